@@ -11,7 +11,7 @@ from typing import Optional, Dict, Any, List
 import uuid
 
 
-@dataclass
+@dataclass(slots=True)
 class Event:
     """
     Canonical event time-series record for BigQuery.
@@ -209,7 +209,7 @@ class Event:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class EntityMention:
     """EntityMention time-series record for BigQuery."""
 
@@ -235,7 +235,7 @@ class EntityMention:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class FREDIndicator:
     """FRED economic indicator record for BigQuery."""
 
@@ -256,7 +256,7 @@ class FREDIndicator:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class UNComtrade:
     """UN Comtrade trade flow record for BigQuery."""
 
@@ -277,7 +277,7 @@ class UNComtrade:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class WorldBank:
     """World Bank development indicator record for BigQuery."""
 
@@ -3,36 +3,469 @@ BigQuery service layer for VenezuelaWatch time-series data.
 
 Provides methods for inserting and querying time-series data in BigQuery.
 Uses google-cloud-bigquery client library with parameterized queries for security.
+Larger batches can be written through the Storage Write API (binary protobuf
+rows over gRPC) instead of JSON streaming inserts.
 """
 
+import json
+import uuid
+import zlib
+from google.api_core.exceptions import InternalServerError, ServiceUnavailable
 from google.cloud import bigquery
+from google.protobuf import descriptor_pb2, descriptor_pool, message_factory
 from django.conf import settings
-from typing import List, Optional
-from datetime import datetime
+from typing import Iterable, List, Optional, Tuple
+from datetime import datetime, date, timedelta, timezone
 from api.bigquery_models import Event, EntityMention, FREDIndicator, UNComtrade, WorldBank
 
+_FIELD = descriptor_pb2.FieldDescriptorProto
+_EPOCH_DATE = date(1970, 1, 1)
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+# Recommended maximum rows per insertAll request for streaming inserts
+STREAMING_INSERT_BATCH_SIZE = 500
+
+# Errors a retry of the whole insert can fix; raised unchanged so callers'
+# retry policies see them (insertIds drop slices a retry re-sends)
+TRANSIENT_INSERT_ERRORS = (ServiceUnavailable, InternalServerError)
+
+# Rows per AppendRowsRequest when writing to a pending stream (keeps each
+# request well under the 10MB Storage Write API limit)
+STORAGE_WRITE_REQUEST_ROWS = 5000
+
+# Duplicate checks against the events table only scan partitions from this
+# many days before the earliest candidate's mentioned_at. A GDELT event keeps
+# its GLOBALEVENTID and DATEADDED (our mentioned_at) when it reappears in later
+# update files, so a stored copy is in the candidate's own daily partition; the
+# margin covers DATEADDED being truncated to the day.
+DEDUP_LOOKBACK_DAYS = 1
+
+# Byte cap for duplicate-check queries. With the mentioned_at cutoff they read
+# the id and mentioned_at columns of a few daily partitions, so the cap is well
+# above that but far below a full-table scan. Re-check against a dry run
+# (QueryJobConfig(dry_run=True), total_bytes_processed) when changing
+# DEDUP_LOOKBACK_DAYS or the queries.
+DEDUP_MAX_BYTES_BILLED = 256 * 1024 ** 2
+
+
+def dedup_cutoff(mentioned_at: Iterable[datetime]) -> datetime:
+    """
+    Earliest mentioned_at a duplicate-check query needs to scan.
+
+    Args:
+        mentioned_at: mentioned_at of every candidate event (non-empty)
+
+    Returns:
+        DEDUP_LOOKBACK_DAYS before the earliest candidate
+    """
+    return min(mentioned_at) - timedelta(days=DEDUP_LOOKBACK_DAYS)
+
+
+def _build_row_message(message_name: str, fields: List[Tuple]):
+    """
+    Build a proto2 row message for the Storage Write API.
+
+    Args:
+        message_name: Proto message name
+        fields: List of (column_name, FieldDescriptorProto type) tuples, with an
+            optional third element for the label (defaults to LABEL_OPTIONAL)
+
+    Returns:
+        Tuple of (DescriptorProto for the writer schema, message class)
+    """
+    file_proto = descriptor_pb2.FileDescriptorProto(
+        name=f"{message_name.lower()}.proto",
+        package="venezuelawatch",
+        syntax="proto2",
+    )
+    message_proto = file_proto.message_type.add(name=message_name)
+    for number, (column_name, field_type, *label) in enumerate(fields, start=1):
+        message_proto.field.add(
+            name=column_name,
+            number=number,
+            type=field_type,
+            label=label[0] if label else _FIELD.LABEL_OPTIONAL,
+        )
+
+    pool = descriptor_pool.DescriptorPool()
+    pool.Add(file_proto)
+    descriptor = pool.FindMessageTypeByName(f"venezuelawatch.{message_name}")
+
+    descriptor_proto = descriptor_pb2.DescriptorProto()
+    descriptor.CopyToProto(descriptor_proto)
+    return descriptor_proto, message_factory.GetMessageClass(descriptor)
+
+
+# fred_indicators row (DATE is encoded as int32 days since epoch)
+FRED_INDICATOR_DESCRIPTOR, FREDIndicatorProto = _build_row_message(
+    "FREDIndicatorRow",
+    [
+        ("series_id", _FIELD.TYPE_STRING),
+        ("date", _FIELD.TYPE_INT32),
+        ("value", _FIELD.TYPE_DOUBLE),
+        ("series_name", _FIELD.TYPE_STRING),
+        ("units", _FIELD.TYPE_STRING),
+    ],
+)
+
+# events row (TIMESTAMP is encoded as int64 microseconds since epoch, JSON as a
+# string). The STRUCT enhancement columns are not part of the writer schema.
+EVENT_DESCRIPTOR, EventProto = _build_row_message(
+    "EventRow",
+    [
+        ("id", _FIELD.TYPE_STRING),
+        ("source", _FIELD.TYPE_STRING),
+        ("source_event_id", _FIELD.TYPE_STRING),
+        ("source_url", _FIELD.TYPE_STRING),
+        ("source_name", _FIELD.TYPE_STRING),
+        ("event_timestamp", _FIELD.TYPE_INT64),
+        ("ingested_at", _FIELD.TYPE_INT64),
+        ("created_at", _FIELD.TYPE_INT64),
+        ("category", _FIELD.TYPE_STRING),
+        ("subcategory", _FIELD.TYPE_STRING),
+        ("event_type", _FIELD.TYPE_STRING),
+        ("country_code", _FIELD.TYPE_STRING),
+        ("admin1", _FIELD.TYPE_STRING),
+        ("admin2", _FIELD.TYPE_STRING),
+        ("latitude", _FIELD.TYPE_DOUBLE),
+        ("longitude", _FIELD.TYPE_DOUBLE),
+        ("location", _FIELD.TYPE_STRING),
+        ("magnitude_raw", _FIELD.TYPE_DOUBLE),
+        ("magnitude_unit", _FIELD.TYPE_STRING),
+        ("magnitude_norm", _FIELD.TYPE_DOUBLE),
+        ("direction", _FIELD.TYPE_STRING),
+        ("tone_raw", _FIELD.TYPE_DOUBLE),
+        ("tone_norm", _FIELD.TYPE_DOUBLE),
+        ("num_sources", _FIELD.TYPE_INT64),
+        ("source_credibility", _FIELD.TYPE_DOUBLE),
+        ("confidence", _FIELD.TYPE_DOUBLE),
+        ("actor1_name", _FIELD.TYPE_STRING),
+        ("actor1_type", _FIELD.TYPE_STRING),
+        ("actor2_name", _FIELD.TYPE_STRING),
+        ("actor2_type", _FIELD.TYPE_STRING),
+        ("commodities", _FIELD.TYPE_STRING, _FIELD.LABEL_REPEATED),
+        ("sectors", _FIELD.TYPE_STRING, _FIELD.LABEL_REPEATED),
+        ("title", _FIELD.TYPE_STRING),
+        ("content", _FIELD.TYPE_STRING),
+        ("risk_score", _FIELD.TYPE_DOUBLE),
+        ("severity", _FIELD.TYPE_STRING),
+        ("themes", _FIELD.TYPE_STRING, _FIELD.LABEL_REPEATED),
+        ("metadata", _FIELD.TYPE_STRING),
+    ],
+)
+_EVENT_TIMESTAMP_FIELDS = ("event_timestamp", "ingested_at", "created_at")
+_EVENT_STRUCT_FIELDS = ("quotations", "gcam_scores", "entity_relationships", "related_events")
+
+# Columns upsert_events may use to identify an existing event
+_UPSERT_MATCH_COLUMNS = ("id", "source_url")
+
+# zlib level for the llm_analysis_z column (analysis JSON compresses ~4-5x)
+LLM_ANALYSIS_COMPRESSION_LEVEL = 6
+
+# SQL condition true when an event has LLM analysis: compressed column, or
+# metadata.llm_analysis on rows analyzed before the column existed
+HAS_LLM_ANALYSIS_SQL = (
+    "(llm_analysis_z IS NOT NULL OR JSON_QUERY(metadata, '$.llm_analysis') IS NOT NULL)"
+)
+
+
+def encode_llm_analysis(analysis: dict) -> bytes:
+    """Serialize an LLM analysis dict for the llm_analysis_z BYTES column."""
+    payload = json.dumps(analysis, separators=(',', ':'), default=str).encode('utf-8')
+    return zlib.compress(payload, LLM_ANALYSIS_COMPRESSION_LEVEL)
+
+
+def decode_llm_analysis(row: dict) -> dict:
+    """
+    Read the LLM analysis of an event row.
+
+    Args:
+        row: Event row with llm_analysis_z and/or metadata
+
+    Returns:
+        Analysis dict ({} if the event has not been analyzed)
+    """
+    compressed = row.get('llm_analysis_z')
+    if compressed:
+        return json.loads(zlib.decompress(compressed))
+    metadata = row.get('metadata') or {}
+    if isinstance(metadata, str):
+        metadata = json.loads(metadata)
+    return metadata.get('llm_analysis') or {}
+
+
+def _to_epoch_micros(value) -> int:
+    """Convert a datetime (naive treated as UTC) or ISO string to epoch microseconds."""
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    delta = value - _EPOCH
+    return (delta.days * 86_400 + delta.seconds) * 1_000_000 + delta.microseconds
+
 
 class BigQueryService:
     """Service for interacting with BigQuery time-series data."""
 
+    # Event columns needed for LLM analysis (see intelligence_tasks)
+    ANALYSIS_COLUMNS = "id, title, content, source_name, event_type, mentioned_at"
+
     def __init__(self):
         """Initialize BigQuery client with Django settings."""
         self.project_id = settings.GCP_PROJECT_ID
         self.dataset_id = settings.BIGQUERY_DATASET
         self.client = bigquery.Client(project=self.project_id)
+        self._write_client = None
+
+    def _get_write_client(self):
+        """Get or create the Storage Write API client (gRPC channel reused)."""
+        if self._write_client is None:
+            from google.cloud import bigquery_storage_v1
+            self._write_client = bigquery_storage_v1.BigQueryWriteClient()
+        return self._write_client
+
+    def _append_rows(
+        self,
+        table: str,
+        descriptor_proto,
+        serialized_rows: List[bytes],
+        pending: bool = False,
+    ) -> None:
+        """
+        Append serialized proto rows to a table via the Storage Write API.
+
+        By default rows go to the table's committed default stream in a single
+        AppendRowsRequest, which is atomic, so callers can safely fall back to
+        streaming inserts if this raises.
+
+        With pending=True the rows are written to a new PENDING stream in
+        STORAGE_WRITE_REQUEST_ROWS-sized requests, then finalized and committed
+        with BatchCommitWriteStreams. Nothing becomes visible until the commit,
+        so large backfills are atomic and don't hit the per-request size limit.
+
+        Args:
+            table: Table name within the dataset
+            descriptor_proto: DescriptorProto matching the serialized rows
+            serialized_rows: Rows serialized with SerializeToString()
+            pending: Use a pending stream committed once all rows are appended
+        """
+        from google.cloud.bigquery_storage_v1 import types
+
+        write_client = self._get_write_client()
+        parent = write_client.table_path(self.project_id, self.dataset_id, table)
+
+        if pending:
+            stream = write_client.create_write_stream(
+                parent=parent,
+                write_stream=types.WriteStream(type_=types.WriteStream.Type.PENDING),
+            )
+            stream_name = stream.name
+            batches = [
+                serialized_rows[i:i + STORAGE_WRITE_REQUEST_ROWS]
+                for i in range(0, len(serialized_rows), STORAGE_WRITE_REQUEST_ROWS)
+            ]
+        else:
+            stream_name = f"{parent}/streams/_default"
+            batches = [serialized_rows]
+
+        requests = [
+            types.AppendRowsRequest(
+                write_stream=stream_name,
+                proto_rows=types.AppendRowsRequest.ProtoData(
+                    writer_schema=types.ProtoSchema(proto_descriptor=descriptor_proto),
+                    rows=types.ProtoRows(serialized_rows=batch),
+                ),
+            )
+            for batch in batches
+        ]
+
+        for response in write_client.append_rows(iter(requests)):
+            if response.error.code or response.row_errors:
+                raise Exception(
+                    f"BigQuery Storage Write errors: {response.error.message} {list(response.row_errors)}"
+                )
+
+        if pending:
+            write_client.finalize_write_stream(name=stream_name)
+            commit = write_client.batch_commit_write_streams(
+                types.BatchCommitWriteStreamsRequest(parent=parent, write_streams=[stream_name])
+            )
+            if commit.stream_errors:
+                raise Exception(f"BigQuery Storage Write commit errors: {list(commit.stream_errors)}")
+
+    def _insert_rows_chunked(self, table_id: str, rows: List[dict], row_ids: Optional[List[str]] = None) -> None:
+        """
+        Stream rows to a table in STREAMING_INSERT_BATCH_SIZE slices.
+
+        Every slice is attempted even if an earlier one fails, so a single bad
+        request doesn't drop the rest of the batch; errors (with row indexes
+        relative to the full batch) are raised together at the end. Transient
+        errors (TRANSIENT_INSERT_ERRORS) are re-raised unchanged instead, so
+        the caller can retry the batch.
+
+        Args:
+            table_id: Fully qualified table id
+            rows: JSON-serializable rows
+            row_ids: Optional insertIds aligned with rows
+        """
+        errors = []
+        for start in range(0, len(rows), STREAMING_INSERT_BATCH_SIZE):
+            end = start + STREAMING_INSERT_BATCH_SIZE
+            try:
+                chunk_errors = self.client.insert_rows_json(
+                    table_id,
+                    rows[start:end],
+                    row_ids=row_ids[start:end] if row_ids is not None else None,
+                )
+            except TRANSIENT_INSERT_ERRORS:
+                raise
+            except Exception as e:
+                errors.append({'rows': f'{start}-{min(end, len(rows))}', 'error': str(e)})
+                continue
+            for error in chunk_errors:
+                error['index'] += start
+            errors.extend(chunk_errors)
+
+        if errors:
+            raise Exception(f"BigQuery insert errors: {errors}")
 
     # Insert methods
     def insert_events(self, events: List[Event]) -> None:
-        """Insert events using streaming insert."""
+        """
+        Insert events using streaming insert.
+
+        Event ids are sent as insertIds, so BigQuery drops rows re-sent by a
+        retried task (best-effort, within the streaming dedup window).
+        """
         if not events:
             return
 
         table_id = f"{self.project_id}.{self.dataset_id}.events"
         rows = [event.to_bigquery_row() for event in events]
-        errors = self.client.insert_rows_json(table_id, rows)
+        self._insert_rows_chunked(table_id, rows, row_ids=[event.id for event in events])
 
-        if errors:
-            raise Exception(f"BigQuery insert errors: {errors}")
+    def upsert_events(
+        self,
+        events: List[Event],
+        match_on: str = 'id',
+        lookback_days: Optional[int] = None,
+        source_name: Optional[str] = None,
+    ) -> List[str]:
+        """
+        Insert events that are not already in the events table.
+
+        Loads the batch into a temporary staging table, then runs a single
+        MERGE so the duplicate check and insert are one atomic operation.
+        The same script then reads back which staged rows the MERGE inserted
+        (id and created_at both match), so callers only act on new events.
+
+        Args:
+            events: Events to insert
+            match_on: Column identifying a duplicate ('id' or 'source_url')
+            lookback_days: Only match existing events mentioned within the last
+                N days (prunes partitions of the target table). By default only
+                events from DEDUP_LOOKBACK_DAYS before the batch's earliest
+                mentioned_at are matched, as for the other duplicate checks.
+            source_name: Only match existing events from this source (prunes
+                blocks, since the events table is clustered on source_name)
+
+        Returns:
+            IDs of the inserted events (events already present are skipped)
+        """
+        if match_on not in _UPSERT_MATCH_COLUMNS:
+            raise ValueError(f"Unsupported match column: {match_on}")
+        if not events:
+            return []
+
+        table_id = f"{self.project_id}.{self.dataset_id}.events"
+        staging_id = f"{self.project_id}.{self.dataset_id}._staging_events_{uuid.uuid4().hex}"
+        target = self.client.get_table(table_id)
+
+        load_config = bigquery.LoadJobConfig(
+            schema=target.schema,
+            source_format=bigquery.SourceFormat.NEWLINE_DELIMITED_JSON,
+            write_disposition=bigquery.WriteDisposition.WRITE_TRUNCATE,
+        )
+        rows = [event.to_bigquery_row() for event in events]
+
+        match_condition = f"T.{match_on} = S.{match_on}"
+        if lookback_days is not None:
+            match_condition += (
+                f" AND T.mentioned_at >= TIMESTAMP_SUB(CURRENT_TIMESTAMP(), INTERVAL {int(lookback_days)} DAY)"
+            )
+        else:
+            match_condition += (
+                f" AND T.mentioned_at >= TIMESTAMP_SUB(min_mentioned_at, INTERVAL {DEDUP_LOOKBACK_DAYS} DAY)"
+            )
+        query_parameters = []
+        if source_name is not None:
+            match_condition += " AND T.source_name = @source_name"
+            query_parameters.append(bigquery.ScalarQueryParameter('source_name', 'STRING', source_name))
+
+        try:
+            self.client.load_table_from_json(rows, staging_id, job_config=load_config).result()
+
+            # A matched row from another sync has the same id (GDELT) but a
+            # different created_at, so only rows this MERGE wrote are returned.
+            # min_mentioned_at prunes the MERGE (without lookback_days) and the
+            # read-back to the batch's partitions.
+            merge_script = f"""
+                DECLARE min_mentioned_at TIMESTAMP DEFAULT (
+                    SELECT MIN(mentioned_at) FROM `{staging_id}`
+                );
+
+                MERGE `{table_id}` T
+                USING `{staging_id}` S
+                ON {match_condition}
+                WHEN NOT MATCHED THEN
+                    INSERT ROW;
+
+                SELECT T.id
+                FROM `{table_id}` T
+                JOIN `{staging_id}` S
+                ON T.id = S.id AND T.created_at = S.created_at
+                WHERE T.mentioned_at >= min_mentioned_at;
+            """
+            merge_job = self.client.query(
+                merge_script,
+                job_config=bigquery.QueryJobConfig(
+                    maximum_bytes_billed=DEDUP_MAX_BYTES_BILLED,
+                    query_parameters=query_parameters,
+                ),
+            )
+            return [row.id for row in merge_job.result()]
+        finally:
+            self.client.delete_table(staging_id, not_found_ok=True)
+
+    def write_events_pb(self, events: List[Event], pending: bool = False) -> None:
+        """
+        Insert events using the Storage Write API.
+
+        The default stream is used for near-realtime ingestion; pass
+        pending=True for backfills that should be committed atomically.
+
+        Raises:
+            ValueError: If an event carries STRUCT enhancement data, which the
+                writer schema does not cover; use insert_events instead.
+        """
+        if not events:
+            return
+
+        serialized_rows = []
+        for event in events:
+            row = event.to_bigquery_row()
+            if any(row.pop(name, None) for name in _EVENT_STRUCT_FIELDS):
+                raise ValueError(f"Event {event.id} has STRUCT fields not supported by write_events_pb")
+
+            for name in _EVENT_TIMESTAMP_FIELDS:
+                if row[name] is not None:
+                    row[name] = _to_epoch_micros(row[name])
+            row['metadata'] = json.dumps(row['metadata'], default=str)
+
+            message = EventProto(**{k: v for k, v in row.items() if v is not None})
+            serialized_rows.append(message.SerializeToString())
+
+        self._append_rows('events', EVENT_DESCRIPTOR, serialized_rows, pending=pending)
 
     def insert_entity_mentions(self, mentions: List[EntityMention]) -> None:
         """Insert entity mentions using streaming insert."""
@@ -41,46 +474,77 @@ class BigQueryService:
 
         table_id = f"{self.project_id}.{self.dataset_id}.entity_mentions"
         rows = [mention.to_bigquery_row() for mention in mentions]
-        errors = self.client.insert_rows_json(table_id, rows)
-
-        if errors:
-            raise Exception(f"BigQuery insert errors: {errors}")
+        self._insert_rows_chunked(table_id, rows, row_ids=[mention.id for mention in mentions])
 
     def insert_fred_indicators(self, indicators: List[FREDIndicator]) -> None:
-        """Insert FRED economic indicators using streaming insert."""
+        """
+        Insert FRED economic indicators using streaming insert.
+
+        Each observation's insertId is series_id|date, so a retried insert
+        doesn't duplicate observations that already landed.
+        """
         if not indicators:
             return
 
         table_id = f"{self.project_id}.{self.dataset_id}.fred_indicators"
         rows = [ind.to_bigquery_row() for ind in indicators]
-        errors = self.client.insert_rows_json(table_id, rows)
+        row_ids = [f"{ind.series_id}|{ind.date}" for ind in indicators]
+        self._insert_rows_chunked(table_id, rows, row_ids=row_ids)
 
-        if errors:
-            raise Exception(f"BigQuery insert errors: {errors}")
+    def write_fred_indicators_pb(self, indicators: List[FREDIndicator], pending: bool = False) -> None:
+        """
+        Insert FRED economic indicators using the Storage Write API.
+
+        pending=True commits the whole batch atomically via a pending stream.
+        """
+        if not indicators:
+            return
+
+        serialized_rows = []
+        for ind in indicators:
+            row = FREDIndicatorProto(series_id=ind.series_id, date=(ind.date - _EPOCH_DATE).days)
+            if ind.value is not None:
+                row.value = ind.value
+            if ind.series_name is not None:
+                row.series_name = ind.series_name
+            if ind.units is not None:
+                row.units = ind.units
+            serialized_rows.append(row.SerializeToString())
+
+        self._append_rows('fred_indicators', FRED_INDICATOR_DESCRIPTOR, serialized_rows, pending=pending)
 
     def insert_un_comtrade(self, records: List[UNComtrade]) -> None:
-        """Insert UN Comtrade trade records using streaming insert."""
+        """
+        Insert UN Comtrade trade records using streaming insert.
+
+        Each record's insertId is its trade flow key (period, reporter,
+        commodity, flow), so a retried insert doesn't duplicate records.
+        """
         if not records:
             return
 
         table_id = f"{self.project_id}.{self.dataset_id}.un_comtrade"
         rows = [rec.to_bigquery_row() for rec in records]
-        errors = self.client.insert_rows_json(table_id, rows)
-
-        if errors:
-            raise Exception(f"BigQuery insert errors: {errors}")
+        row_ids = [
+            f"{rec.period}|{rec.reporter_code}|{rec.commodity_code}|{rec.trade_flow}"
+            for rec in records
+        ]
+        self._insert_rows_chunked(table_id, rows, row_ids=row_ids)
 
     def insert_world_bank(self, indicators: List[WorldBank]) -> None:
-        """Insert World Bank development indicators using streaming insert."""
+        """
+        Insert World Bank development indicators using streaming insert.
+
+        Each observation's insertId is indicator_id|country_code|date, so a
+        retried insert doesn't duplicate observations.
+        """
         if not indicators:
             return
 
         table_id = f"{self.project_id}.{self.dataset_id}.world_bank"
         rows = [ind.to_bigquery_row() for ind in indicators]
-        errors = self.client.insert_rows_json(table_id, rows)
-
-        if errors:
-            raise Exception(f"BigQuery insert errors: {errors}")
+        row_ids = [f"{ind.indicator_id}|{ind.country_code}|{ind.date}" for ind in indicators]
+        self._insert_rows_chunked(table_id, rows, row_ids=row_ids)
 
     # Query methods
     def get_recent_events(
@@ -168,8 +632,50 @@ class BigQueryService:
 
         results = self.client.query(query, job_config=job_config).result()
         row = next(results, None)
+        if not row:
+            return None
+
+        event = dict(row)
+        event['llm_analysis'] = decode_llm_analysis(event)
+        return event
+
+    def get_events_by_ids(self, event_ids: List[str], cutoff_date: datetime) -> List[dict]:
+        """
+        Get many events by ID in one query.
+
+        Args:
+            event_ids: Event IDs (UUID strings)
+            cutoff_date: Only read events mentioned from this date (prunes
+                partitions; older IDs are not returned)
 
-        return dict(row) if row else None
+        Returns:
+            Event dicts (with decoded llm_analysis) for the IDs that exist
+        """
+        if not event_ids:
+            return []
+
+        query = f"""
+            SELECT *
+            FROM `{self.project_id}.{self.dataset_id}.events`
+            WHERE mentioned_at >= @cutoff_date
+            AND id IN UNNEST(@event_ids)
+        """
+
+        job_config = bigquery.QueryJobConfig(
+            query_parameters=[
+                bigquery.ArrayQueryParameter('event_ids', 'STRING', list(event_ids)),
+                bigquery.ScalarQueryParameter('cutoff_date', 'TIMESTAMP', cutoff_date),
+            ]
+        )
+
+        results = self.client.query(query, job_config=job_config).result()
+
+        events = []
+        for row in results:
+            event = dict(row)
+            event['llm_analysis'] = decode_llm_analysis(event)
+            events.append(event)
+        return events
 
     def get_entity_trending(
         self,
@@ -386,10 +892,12 @@ class BigQueryService:
             themes: List of thematic topics
             urgency: Urgency level string
             language: Language code
-            llm_analysis: Complete LLM analysis dict
+            llm_analysis: Complete LLM analysis dict (stored compressed in
+                llm_analysis_z, see decode_llm_analysis)
             severity: Severity level (SEV1-SEV5)
         """
-        # Build metadata JSON with all intelligence fields
+        # Build metadata JSON with the queryable intelligence fields; the full
+        # analysis goes to llm_analysis_z
         metadata = {
             'sentiment': sentiment,
             'risk_score': risk_score,
@@ -399,16 +907,17 @@ class BigQueryService:
             'themes': themes,
             'urgency': urgency,
             'language': language,
-            'llm_analysis': llm_analysis,
             'severity': severity
         }
 
         # Use BigQuery UPDATE DML to update metadata
         query = f"""
             UPDATE `{self.project_id}.{self.dataset_id}.events`
-            SET metadata = @metadata,
+            SET metadata = PARSE_JSON(@metadata),
+                llm_analysis_z = @llm_analysis_z,
                 risk_score = @risk_score,
-                severity = @severity
+                severity = @severity,
+                analyzed_at = CURRENT_TIMESTAMP()
             WHERE id = @event_id
         """
 
@@ -417,13 +926,104 @@ class BigQueryService:
                 bigquery.ScalarQueryParameter('event_id', 'STRING', event_id),
                 bigquery.ScalarQueryParameter('risk_score', 'FLOAT64', risk_score),
                 bigquery.ScalarQueryParameter('severity', 'STRING', severity),
-                bigquery.ScalarQueryParameter('metadata', 'JSON', str(metadata))
+                bigquery.ScalarQueryParameter('metadata', 'STRING', json.dumps(metadata, default=str)),
+                bigquery.ScalarQueryParameter('llm_analysis_z', 'BYTES', encode_llm_analysis(llm_analysis)),
             ]
         )
 
         # Execute UPDATE
         self.client.query(query, job_config=job_config).result()
 
+    def update_events_analysis(self, updates: List[dict]) -> None:
+        """
+        Update several events with intelligence analysis in one DML statement.
+
+        Args:
+            updates: Dicts with the same keys as update_event_analysis arguments
+        """
+        if not updates:
+            return
+
+        rows = []
+        for update in updates:
+            metadata = {
+                'sentiment': update['sentiment'],
+                'risk_score': update['risk_score'],
+                'entities': update['entities'],
+                'summary': update['summary'],
+                'relationships': update['relationships'],
+                'themes': update['themes'],
+                'urgency': update['urgency'],
+                'language': update['language'],
+                'severity': update['severity']
+            }
+            rows.append(bigquery.StructQueryParameter(
+                None,
+                bigquery.ScalarQueryParameter('id', 'STRING', update['event_id']),
+                bigquery.ScalarQueryParameter('risk_score', 'FLOAT64', update['risk_score']),
+                bigquery.ScalarQueryParameter('severity', 'STRING', update['severity']),
+                bigquery.ScalarQueryParameter('metadata', 'STRING', json.dumps(metadata, default=str)),
+                bigquery.ScalarQueryParameter(
+                    'llm_analysis_z', 'BYTES', encode_llm_analysis(update['llm_analysis'])
+                ),
+            ))
+
+        query = f"""
+            UPDATE `{self.project_id}.{self.dataset_id}.events` T
+            SET metadata = PARSE_JSON(U.metadata),
+                llm_analysis_z = U.llm_analysis_z,
+                risk_score = U.risk_score,
+                severity = U.severity,
+                analyzed_at = CURRENT_TIMESTAMP()
+            FROM UNNEST(@updates) U
+            WHERE T.id = U.id
+        """
+
+        job_config = bigquery.QueryJobConfig(
+            query_parameters=[bigquery.ArrayQueryParameter('updates', 'STRUCT', rows)]
+        )
+
+        self.client.query(query, job_config=job_config).result()
+
+    def mark_sanctions_screened(
+        self,
+        event_ids: List[str],
+        screened_at: datetime,
+        cutoff_date: datetime
+    ) -> None:
+        """
+        Record that events were screened against the current sanctions lists.
+
+        screened_at is when the screening read the events, not when it
+        finished: an event re-analyzed in between has analyzed_at after it
+        (see update_event_analysis), so it still needs screening.
+
+        Args:
+            event_ids: IDs of the events just screened
+            screened_at: Time captured before the events were read
+            cutoff_date: Cutoff the events were read with (prunes the UPDATE
+                to their partitions)
+        """
+        if not event_ids:
+            return
+
+        query = f"""
+            UPDATE `{self.project_id}.{self.dataset_id}.events`
+            SET sanctions_screened_at = @screened_at
+            WHERE mentioned_at >= @cutoff_date
+            AND id IN UNNEST(@event_ids)
+        """
+
+        job_config = bigquery.QueryJobConfig(
+            query_parameters=[
+                bigquery.ArrayQueryParameter('event_ids', 'STRING', list(event_ids)),
+                bigquery.ScalarQueryParameter('screened_at', 'TIMESTAMP', screened_at),
+                bigquery.ScalarQueryParameter('cutoff_date', 'TIMESTAMP', cutoff_date),
+            ]
+        )
+
+        self.client.query(query, job_config=job_config).result()
+
     def get_unanalyzed_events(
         self,
         cutoff_date: datetime,
@@ -432,7 +1032,7 @@ class BigQueryService:
         limit: int = 100
     ) -> List[dict]:
         """
-        Get events without LLM analysis (metadata.llm_analysis is null/empty).
+        Get events without LLM analysis (see HAS_LLM_ANALYSIS_SQL).
 
         Args:
             cutoff_date: Only get events after this date
@@ -441,13 +1041,13 @@ class BigQueryService:
             limit: Maximum number of results
 
         Returns:
-            List of event dicts without llm_analysis
+            List of event dicts without llm_analysis (ANALYSIS_COLUMNS only)
         """
         query = f"""
-            SELECT id
+            SELECT {self.ANALYSIS_COLUMNS}
             FROM `{self.project_id}.{self.dataset_id}.events`
             WHERE mentioned_at >= @cutoff_date
-            AND (metadata IS NULL OR JSON_VALUE(metadata, '$.llm_analysis') IS NULL)
+            AND NOT {HAS_LLM_ANALYSIS_SQL}
         """
 
         params = [
@@ -468,7 +1068,7 @@ class BigQueryService:
         job_config = bigquery.QueryJobConfig(query_parameters=params)
         results = self.client.query(query, job_config=job_config).result()
 
-        return [row.id for row in results]
+        return [dict(row) for row in results]
 
     def get_entity_stats(self, entity_id: str, days: int = 90) -> dict:
         """
@@ -7,7 +7,7 @@ for GDELT events via DocumentIdentifier lookup.
 from google.cloud import bigquery
 from django.conf import settings
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 import logging
 
 logger = logging.getLogger(__name__)
@@ -85,6 +85,73 @@ class GDELTGKGService:
             # Return None instead of raising - don't break sync on GKG fetch errors
             return None
 
+    def get_gkg_bulk(
+        self,
+        document_ids: List[str],
+        min_date: datetime,
+        max_date: datetime
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Get GKG records for many documents in a single query.
+
+        Scans the partition range once instead of issuing one query per
+        document. Duplicate document IDs are collapsed.
+
+        Args:
+            document_ids: DocumentIdentifiers (typically SOURCEURLs)
+            min_date: Earliest partition date to scan
+            max_date: Latest partition date to scan
+
+        Returns:
+            Dict mapping DocumentIdentifier to GKG record dict. Documents
+            without a GKG record are omitted.
+        """
+        unique_ids = list(dict.fromkeys(document_ids))
+        if not unique_ids:
+            return {}
+
+        query = f"""
+            SELECT
+                GKGRECORDID,
+                DATE,
+                DocumentIdentifier,
+                SourceCommonName,
+                V2Themes,
+                V2Persons,
+                V2Organizations,
+                V2Locations,
+                V2Tone,
+                Quotations,
+                GCAM,
+                AllNames
+            FROM `{self.gdelt_project}.{self.gdelt_dataset}.gkg_partitioned`
+            WHERE DATE(_PARTITIONTIME) BETWEEN @min_date AND @max_date
+            AND DocumentIdentifier IN UNNEST(@document_ids)
+        """
+
+        job_config = bigquery.QueryJobConfig(
+            query_parameters=[
+                bigquery.ScalarQueryParameter('min_date', 'DATE', min_date.date()),
+                bigquery.ScalarQueryParameter('max_date', 'DATE', max_date.date()),
+                bigquery.ArrayQueryParameter('document_ids', 'STRING', unique_ids)
+            ]
+        )
+
+        try:
+            results = self.client.query(query, job_config=job_config).result()
+            gkg_map = {}
+            for row in results:
+                # Keep the first record per document, matching get_gkg_by_document_id
+                gkg_map.setdefault(row['DocumentIdentifier'], dict(row))
+
+            logger.debug(f"Found GKG records for {len(gkg_map)}/{len(unique_ids)} documents")
+            return gkg_map
+
+        except Exception as e:
+            logger.error(f"Failed to bulk query GKG for {len(unique_ids)} documents: {e}", exc_info=True)
+            # Return empty instead of raising - don't break sync on GKG fetch errors
+            return {}
+
 
 # Singleton instance
 gdelt_gkg_service = GDELTGKGService()
@@ -0,0 +1,215 @@
+"""
+Tests for BigQueryService writes (upsert_events, update_events_analysis,
+chunked streaming inserts, sanctions screening reads and marks).
+
+The BigQuery client is mocked; tests check the statements and parameters
+sent, and how job results are turned into return values.
+"""
+from datetime import date, datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+from google.api_core.exceptions import ServiceUnavailable
+
+from api.bigquery_models import Event, FREDIndicator
+
+# The module creates its shared service (and client) at import
+with patch('google.cloud.bigquery.Client'):
+    from api.services.bigquery_service import (
+        BigQueryService,
+        DEDUP_MAX_BYTES_BILLED,
+        decode_llm_analysis,
+    )
+
+
+def make_event(event_id: str) -> Event:
+    return Event(
+        id=event_id,
+        source_url=f"https://example.com/{event_id}",
+        event_timestamp=datetime(2026, 1, 10, tzinfo=timezone.utc),
+        created_at=datetime(2026, 1, 10, 12, tzinfo=timezone.utc),
+        source_name='GDELT',
+    )
+
+
+def query_parameters(call):
+    """Map name -> parameter of the QueryJobConfig passed to client.query."""
+    job_config = call.kwargs['job_config']
+    return {param.name: param for param in job_config.query_parameters}
+
+
+class UpsertEventsTests(SimpleTestCase):
+    """Test BigQueryService.upsert_events."""
+
+    def setUp(self):
+        with patch('api.services.bigquery_service.bigquery.Client'):
+            self.service = BigQueryService()
+        self.client = self.service.client
+
+    def test_empty_batch_runs_no_jobs(self):
+        self.assertEqual(self.service.upsert_events([]), [])
+        self.client.query.assert_not_called()
+        self.client.load_table_from_json.assert_not_called()
+
+    def test_unsupported_match_column_is_rejected(self):
+        with self.assertRaises(ValueError):
+            self.service.upsert_events([make_event('1')], match_on='title')
+
+    def test_returns_ids_read_back_after_merge(self):
+        self.client.query.return_value.result.return_value = [SimpleNamespace(id='2')]
+
+        inserted = self.service.upsert_events([make_event('1'), make_event('2')])
+
+        self.assertEqual(inserted, ['2'])
+        loaded_rows = self.client.load_table_from_json.call_args.args[0]
+        self.assertEqual([row['id'] for row in loaded_rows], ['1', '2'])
+
+        script = self.client.query.call_args.args[0]
+        self.assertIn('MERGE', script)
+        self.assertIn('ON T.id = S.id', script)
+        self.assertIn('T.created_at = S.created_at', script)
+
+    def test_merge_is_partition_pruned_and_byte_capped(self):
+        self.client.query.return_value.result.return_value = []
+
+        self.service.upsert_events([make_event('1')])
+
+        script = self.client.query.call_args.args[0]
+        self.assertIn('T.mentioned_at >= TIMESTAMP_SUB(min_mentioned_at', script)
+        job_config = self.client.query.call_args.kwargs['job_config']
+        self.assertEqual(job_config.maximum_bytes_billed, DEDUP_MAX_BYTES_BILLED)
+
+    def test_match_on_source_url_with_lookback_and_source(self):
+        self.client.query.return_value.result.return_value = []
+
+        self.service.upsert_events(
+            [make_event('1')], match_on='source_url', lookback_days=30, source_name='ReliefWeb'
+        )
+
+        script = self.client.query.call_args.args[0]
+        self.assertIn('T.source_url = S.source_url', script)
+        self.assertIn('INTERVAL 30 DAY', script)
+        self.assertIn('T.source_name = @source_name', script)
+        params = query_parameters(self.client.query.call_args)
+        self.assertEqual(params['source_name'].value, 'ReliefWeb')
+
+    def test_staging_table_is_dropped_when_merge_fails(self):
+        self.client.query.return_value.result.side_effect = RuntimeError('merge failed')
+
+        with self.assertRaises(RuntimeError):
+            self.service.upsert_events([make_event('1')])
+
+        staging_id = self.client.load_table_from_json.call_args.args[1]
+        self.client.delete_table.assert_called_once_with(staging_id, not_found_ok=True)
+
+
+class UpdateEventsAnalysisTests(SimpleTestCase):
+    """Test BigQueryService.update_events_analysis."""
+
+    def setUp(self):
+        with patch('api.services.bigquery_service.bigquery.Client'):
+            self.service = BigQueryService()
+        self.client = self.service.client
+
+    def _update(self, event_id: str, risk_score: float) -> dict:
+        return {
+            'event_id': event_id,
+            'sentiment': -0.5,
+            'risk_score': risk_score,
+            'entities': ['PDVSA'],
+            'summary': 'Summary',
+            'relationships': {},
+            'themes': ['ENERGY'],
+            'urgency': 'high',
+            'language': 'es',
+            'llm_analysis': {'summary': {'short': f"Analysis {event_id}"}},
+            'severity': 'SEV2',
+        }
+
+    def test_empty_updates_run_no_query(self):
+        self.service.update_events_analysis([])
+        self.client.query.assert_not_called()
+
+    def test_updates_are_written_in_one_statement(self):
+        self.service.update_events_analysis([self._update('1', 80.0), self._update('2', 20.0)])
+
+        self.client.query.assert_called_once()
+        statement = self.client.query.call_args.args[0]
+        self.assertIn('FROM UNNEST(@updates) U', statement)
+        self.assertIn('analyzed_at = CURRENT_TIMESTAMP()', statement)
+
+        rows = query_parameters(self.client.query.call_args)['updates'].values
+        self.assertEqual(len(rows), 2)
+
+        fields = rows[0].struct_values
+        self.assertEqual(fields['id'], '1')
+        self.assertEqual(fields['risk_score'], 80.0)
+        self.assertEqual(
+            decode_llm_analysis({'llm_analysis_z': fields['llm_analysis_z']}),
+            {'summary': {'short': 'Analysis 1'}},
+        )
+
+
+class StreamingInsertTests(SimpleTestCase):
+    """Test chunked streaming inserts (_insert_rows_chunked)."""
+
+    def setUp(self):
+        with patch('api.services.bigquery_service.bigquery.Client'):
+            self.service = BigQueryService()
+        self.client = self.service.client
+        self.indicators = [
+            FREDIndicator(series_id='DCOILWTICO', date=date(2026, 1, day), value=70.0)
+            for day in (1, 2)
+        ]
+
+    def test_fred_rows_use_deterministic_insert_ids(self):
+        self.client.insert_rows_json.return_value = []
+
+        self.service.insert_fred_indicators(self.indicators)
+
+        self.assertEqual(
+            self.client.insert_rows_json.call_args.kwargs['row_ids'],
+            ['DCOILWTICO|2026-01-01', 'DCOILWTICO|2026-01-02'],
+        )
+
+    def test_transient_errors_are_raised_unchanged(self):
+        self.client.insert_rows_json.side_effect = ServiceUnavailable('backend unavailable')
+
+        with self.assertRaises(ServiceUnavailable):
+            self.service.insert_fred_indicators(self.indicators)
+
+    def test_other_errors_are_collected(self):
+        self.client.insert_rows_json.side_effect = ValueError('bad request')
+
+        with self.assertRaisesMessage(Exception, 'BigQuery insert errors'):
+            self.service.insert_fred_indicators(self.indicators)
+
+
+class SanctionsScreeningQueryTests(SimpleTestCase):
+    """Test the partition bounds of sanctions screening reads and marks."""
+
+    def setUp(self):
+        with patch('api.services.bigquery_service.bigquery.Client'):
+            self.service = BigQueryService()
+        self.client = self.service.client
+        self.cutoff = datetime(2026, 1, 3, tzinfo=timezone.utc)
+
+    def test_get_events_by_ids_is_bounded_by_cutoff(self):
+        self.client.query.return_value.result.return_value = []
+
+        self.service.get_events_by_ids(['1', '2'], self.cutoff)
+
+        self.assertIn('mentioned_at >= @cutoff_date', self.client.query.call_args.args[0])
+        params = query_parameters(self.client.query.call_args)
+        self.assertEqual(params['cutoff_date'].value, self.cutoff)
+
+    def test_mark_sanctions_screened_is_bounded_by_cutoff(self):
+        screened_at = datetime(2026, 1, 10, tzinfo=timezone.utc)
+
+        self.service.mark_sanctions_screened(['1'], screened_at, self.cutoff)
+
+        self.assertIn('mentioned_at >= @cutoff_date', self.client.query.call_args.args[0])
+        params = query_parameters(self.client.query.call_args)
+        self.assertEqual(params['cutoff_date'].value, self.cutoff)
+        self.assertEqual(params['screened_at'].value, screened_at)
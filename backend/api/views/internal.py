@@ -8,35 +8,31 @@ Architecture:
 - Pub/Sub push → /api/internal/process-event → enqueue Cloud Tasks
 - Cloud Tasks → /api/internal/analyze-intelligence → run LLM analysis
 - Pub/Sub push → /api/internal/extract-entities → process entity extraction
+- Cloud Tasks → /api/internal/generate-forecast → generate entity risk forecast
 
 Replace Celery tasks with event-driven GCP-native orchestration.
 """
 import json
 import base64
 import logging
-import os
 from typing import Dict, Any
 
 from ninja import Router
 from django.http import JsonResponse
 from django.views.decorators.csrf import csrf_exempt
-from google.cloud import tasks_v2, pubsub_v1
+from google.cloud import pubsub_v1
 
 from data_pipeline.services.llm_intelligence import LLMIntelligence
 from data_pipeline.services.entity_service import EntityService
 from data_pipeline.services.trending_service import TrendingService
 from api.services.bigquery_service import bigquery_service
+from data_pipeline.services.cloud_tasks import GCP_PROJECT_ID, enqueue_internal_task
 from core.models import Entity, EntityMention
 
 logger = logging.getLogger(__name__)
 
 internal_router = Router()
 
-# GCP Project configuration from environment
-GCP_PROJECT_ID = os.environ.get('GCP_PROJECT_ID', 'venezuelawatch-staging')
-GCP_LOCATION = 'us-central1'
-CLOUD_RUN_URL = os.environ.get('CLOUD_RUN_URL', 'https://venezuelawatch-api-gc6im6smjq-uc.a.run.app')
-
 
 @internal_router.post('/process-event')
 def process_event_pubsub(request):
@@ -86,29 +82,18 @@ def process_event_pubsub(request):
         logger.info(f"Received event analysis trigger: event_id={event_id}, model={model}")
 
         # Enqueue to Cloud Tasks for LLM analysis
-        client = tasks_v2.CloudTasksClient()
-        parent = client.queue_path(GCP_PROJECT_ID, GCP_LOCATION, 'llm-analysis-queue')
-
-        task = {
-            'http_request': {
-                'http_method': tasks_v2.HttpMethod.POST,
-                'url': f'{CLOUD_RUN_URL}/api/internal/analyze-intelligence',
-                'headers': {'Content-Type': 'application/json'},
-                'body': json.dumps({'event_id': event_id, 'model': model}).encode(),
-                'oidc_token': {
-                    'service_account_email': f'cloudrun-tasks@{GCP_PROJECT_ID}.iam.gserviceaccount.com'
-                }
-            }
-        }
-
-        response = client.create_task(request={'parent': parent, 'task': task})
+        task_name = enqueue_internal_task(
+            'llm-analysis-queue',
+            '/api/internal/analyze-intelligence',
+            {'event_id': event_id, 'model': model},
+        )
 
-        logger.info(f"Enqueued intelligence analysis task: {response.name}")
+        logger.info(f"Enqueued intelligence analysis task: {task_name}")
 
         return JsonResponse({
             'status': 'enqueued',
             'event_id': event_id,
-            'task_name': response.name
+            'task_name': task_name
         }, status=200)
 
     except json.JSONDecodeError as e:
@@ -170,13 +155,7 @@ def analyze_intelligence_task(request):
         analysis = LLMIntelligence.analyze_event_model(mock_event, model=model)
 
         # Extract entity names for entities field
-        entities = []
-        for person in analysis['entities'].get('people', []):
-            entities.append(person['name'])
-        for org in analysis['entities'].get('organizations', []):
-            entities.append(org['name'])
-        for loc in analysis['entities'].get('locations', []):
-            entities.append(loc['name'])
+        entities = LLMIntelligence.extract_entity_names(analysis)
 
         # Calculate comprehensive risk score
         # TODO: Adapt RiskScorer for dict-based events (currently uses Django Event model)
@@ -191,7 +170,7 @@ def analyze_intelligence_task(request):
             event_id=event_id,
             sentiment=analysis['sentiment']['score'],
             risk_score=comprehensive_risk,
-            entities=entities[:20],  # Limit to top 20
+            entities=entities,
             summary=analysis['summary']['short'],
             relationships=analysis['relationships'],
             themes=analysis['themes'],
@@ -313,6 +292,44 @@ def extract_entities_pubsub(request):
         return JsonResponse({'error': str(e)}, status=500)
 
 
+@internal_router.post('/generate-forecast')
+def generate_forecast_task(request):
+    """
+    Cloud Tasks handler for entity risk forecast generation.
+
+    Enqueued by the forecast API on a cache miss (forecasting.tasks.enqueue_forecast).
+
+    Request body:
+    {
+        "entity_id": 42,
+        "horizon_days": 30
+    }
+
+    Returns:
+        200: Generation finished (status 'ready', 'insufficient_data' or 'error')
+        400: Invalid request body
+    """
+    try:
+        data = json.loads(request.body.decode('utf-8'))
+        entity_id = data.get('entity_id')
+        horizon_days = data.get('horizon_days', 30)
+
+        if entity_id is None:
+            return JsonResponse({'error': 'Missing entity_id'}, status=400)
+
+        from forecasting.tasks import generate_forecast
+
+        # Outcomes are reported to pollers through the cache, so a failed
+        # generation still answers 200 and is not retried by Cloud Tasks
+        outcome = generate_forecast(int(entity_id), int(horizon_days))
+
+        return JsonResponse({'entity_id': entity_id, **outcome}, status=200)
+
+    except json.JSONDecodeError as e:
+        logger.error(f"Failed to decode JSON: {e}")
+        return JsonResponse({'error': 'Invalid JSON'}, status=400)
+
+
 # Private helper functions (reused from entity_extraction.py)
 
 def _extract_from_llm_analysis(event: dict) -> Dict[str, Any]:
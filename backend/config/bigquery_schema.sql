@@ -15,13 +15,34 @@ CREATE TABLE IF NOT EXISTS `venezuelawatch-staging.venezuelawatch_analytics.even
     severity STRING,
     mentioned_at TIMESTAMP NOT NULL,
     created_at TIMESTAMP NOT NULL,
-    metadata JSON
+    metadata JSON,
+    llm_analysis_z BYTES,  -- zlib-compressed analysis JSON (decode_llm_analysis)
+    sanctions_screened_at TIMESTAMP,  -- start of last sanctions screening (NULL: needs screening)
+    analyzed_at TIMESTAMP  -- last LLM analysis (screened before this: needs screening)
 )
 PARTITION BY DATE(mentioned_at)
-CLUSTER BY event_type, source_name
+CLUSTER BY source_name, source_url, event_type
 OPTIONS(
     description="Event time-series data from GDELT, ReliefWeb, and other sources"
 );
+-- Existing tables: clustering on source_url lets duplicate lookups by URL
+-- (e.g. the ReliefWeb MERGE) prune blocks within each date partition.
+-- Apply with (new data is clustered immediately, existing data as it is
+-- re-clustered in the background):
+--   bq update --clustering_fields=source_name,source_url,event_type \
+--     venezuelawatch-staging:venezuelawatch_analytics.events
+-- Full LLM analyses are stored compressed outside metadata, so queries on
+-- metadata fields no longer scan them. Existing tables:
+--   ALTER TABLE `venezuelawatch-staging.venezuelawatch_analytics.events`
+--     ADD COLUMN IF NOT EXISTS llm_analysis_z BYTES;
+-- Sanctions refresh only re-screens events not screened since the sanctions
+-- data last changed. Existing tables:
+--   ALTER TABLE `venezuelawatch-staging.venezuelawatch_analytics.events`
+--     ADD COLUMN IF NOT EXISTS sanctions_screened_at TIMESTAMP;
+-- Re-analysis sets analyzed_at; events screened before it are screened again.
+-- Existing tables:
+--   ALTER TABLE `venezuelawatch-staging.venezuelawatch_analytics.events`
+--     ADD COLUMN IF NOT EXISTS analyzed_at TIMESTAMP;
 
 -- 2. Entity Mentions Table - EntityMention time-series from Phase 6
 CREATE TABLE IF NOT EXISTS `venezuelawatch-staging.venezuelawatch_analytics.entity_mentions` (
@@ -77,3 +98,9 @@ CLUSTER BY indicator_id
 OPTIONS(
     description="World Bank development indicators for Venezuela"
 );
+
+-- 6. Screenable Events View (removed) - the sanctions refresh marks screened
+-- events with a DML UPDATE on every run, which invalidates the materialized
+-- view over exactly the recent partitions it reads, so it is read from the
+-- events table instead.
+DROP MATERIALIZED VIEW IF EXISTS `venezuelawatch-staging.venezuelawatch_analytics.events_with_llm_analysis`;
@@ -1,5 +1,9 @@
+import logging
 import os
 from celery import Celery
+from celery.signals import worker_process_init
+
+logger = logging.getLogger(__name__)
 
 # Set the default Django settings module for the 'celery' program.
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'venezuelawatch.settings')
@@ -29,6 +33,16 @@ app.conf.update(
 )
 
 
+@worker_process_init.connect
+def preload_llm_intelligence(**kwargs):
+    """Set up LLM clients once per worker process, not on the first task."""
+    from data_pipeline.services.llm_intelligence import LLMIntelligence
+    try:
+        LLMIntelligence.preload()
+    except Exception as e:
+        logger.warning(f"LLM preload failed, deferring to first task: {e}")
+
+
 @app.task(bind=True, ignore_result=True)
 def debug_task(self):
     print(f'Request: {self.request!r}')
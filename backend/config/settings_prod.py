@@ -51,6 +51,10 @@ CELERY_TASK_ROUTES = {
     'data_pipeline.tasks.fred.*': {'queue': 'batch'},
     'data_pipeline.tasks.comtrade.*': {'queue': 'batch'},
     'data_pipeline.tasks.worldbank.*': {'queue': 'batch'},
+    # LLM-bound analysis gets its own queue so it can't starve ingestion; run
+    # its workers with: -Q intelligence --concurrency=4 --prefetch-multiplier=1
+    'data_pipeline.tasks.intelligence_tasks.analyze_event_intelligence': {'queue': 'intelligence'},
+    'data_pipeline.tasks.intelligence_tasks.analyze_events_batch': {'queue': 'intelligence'},
 }
 
 # Static files - Google Cloud Storage
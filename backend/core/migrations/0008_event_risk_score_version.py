@@ -0,0 +1,22 @@
+# Generated by Django 5.2 on 2026-10-17 09:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0007_entity_entitymention"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="event",
+            name="risk_score_version",
+            field=models.PositiveSmallIntegerField(
+                blank=True,
+                help_text="RiskScorer version that produced risk_score (null if not from RiskScorer)",
+                null=True,
+            ),
+        ),
+    ]
@@ -0,0 +1,32 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('core', '0008_event_risk_score_version'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            # One World Bank event per indicator and year. The timestamp is
+            # derived from the year (Dec 31), and is part of the key because
+            # unique indexes on a hypertable must include the time column.
+            sql="""
+                -- Remove duplicates left by earlier check-then-insert backfills
+                DELETE FROM events a
+                USING events b
+                WHERE a.source = 'WORLD_BANK'
+                  AND b.source = 'WORLD_BANK'
+                  AND a.timestamp = b.timestamp
+                  AND a.content->>'indicator_id' = b.content->>'indicator_id'
+                  AND a.id > b.id;
+
+                CREATE UNIQUE INDEX IF NOT EXISTS events_worldbank_observation_unique
+                    ON events (timestamp, (content->>'indicator_id'))
+                    WHERE source = 'WORLD_BANK';
+            """,
+            reverse_sql="""
+                DROP INDEX IF EXISTS events_worldbank_observation_unique;
+            """
+        ),
+    ]
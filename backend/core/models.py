@@ -117,6 +117,11 @@ class Event(models.Model):
         db_index=True,
         help_text="Computed risk level (0-100)"
     )
+    risk_score_version = models.PositiveSmallIntegerField(
+        null=True,
+        blank=True,
+        help_text="RiskScorer version that produced risk_score (null if not from RiskScorer)"
+    )
 
     # Severity classification (SEV 1-5)
     severity = models.CharField(
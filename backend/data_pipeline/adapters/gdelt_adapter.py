@@ -24,17 +24,19 @@ GKG metadata, and publishes to our time-series analytics pipeline.
 - GKG parser utilities for theme/entity extraction
 """
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Tuple, Optional
 from datetime import datetime
-import pytz
+from datetime import timezone as dt_timezone
 from django.utils import timezone
+from google.cloud import bigquery
 
 from data_pipeline.adapters.base import DataSourceAdapter
 from data_pipeline.services.category_classifier import CategoryClassifier
 from api.services.gdelt_bigquery_service import gdelt_bigquery_service
 from api.services.gdelt_gkg_service import gdelt_gkg_service
 from api.bigquery_models import Event as BigQueryEvent
-from api.services.bigquery_service import bigquery_service
+from api.services.bigquery_service import bigquery_service, dedup_cutoff, DEDUP_MAX_BYTES_BILLED
 from api.services.gdelt_gkg_parsers import (
     parse_v2_themes,
     parse_v2_persons,
@@ -45,6 +47,9 @@ from api.services.gdelt_gkg_parsers import (
 
 logger = logging.getLogger(__name__)
 
+# Concurrent GKG lookups per fetch (each lookup is an I/O-bound BigQuery RPC)
+GKG_LOOKUP_WORKERS = 16
+
 
 class GdeltAdapter(DataSourceAdapter):
     """
@@ -63,6 +68,10 @@ class GdeltAdapter(DataSourceAdapter):
     schedule_frequency = "*/15 * * * *"  # Every 15 minutes (matches GDELT update frequency)
     default_lookback_minutes = 15
 
+    def __init__(self):
+        # GLOBALEVENTID -> already in BigQuery, filled once per transform() batch
+        self._duplicate_cache: Dict[str, bool] = {}
+
     def fetch(
         self,
         start_time: datetime,
@@ -112,22 +121,19 @@ class GdeltAdapter(DataSourceAdapter):
         total_persons = 0
         total_orgs = 0
 
-        for gdelt_event in gdelt_events:
+        # Fetch GKG records by DocumentIdentifier (= SOURCEURL) concurrently
+        with ThreadPoolExecutor(max_workers=GKG_LOOKUP_WORKERS) as executor:
+            gkg_futures = [
+                executor.submit(self._fetch_gkg_record, gdelt_event)
+                if gdelt_event.get('SOURCEURL') else None
+                for gdelt_event in gdelt_events
+            ]
+
+        for gdelt_event, gkg_future in zip(gdelt_events, gkg_futures):
             source_url = gdelt_event.get('SOURCEURL')
             if source_url:
                 try:
-                    # GDELT-specific: Parse DATEADDED (YYYYMMDDHHMMSS format)
-                    # Other adapters might receive ISO 8601 or Unix timestamps
-                    date_str = str(gdelt_event['DATEADDED'])
-                    event_date = timezone.datetime.strptime(
-                        date_str[:8], '%Y%m%d'
-                    ).replace(tzinfo=pytz.UTC)
-
-                    # Fetch GKG record by DocumentIdentifier (= SOURCEURL)
-                    gkg_raw = gdelt_gkg_service.get_gkg_by_document_id(
-                        document_id=source_url,
-                        partition_date=event_date
-                    )
+                    gkg_raw = gkg_future.result()
 
                     if gkg_raw:
                         # Parse GKG fields into structured data
@@ -178,6 +184,28 @@ class GdeltAdapter(DataSourceAdapter):
 
         return gdelt_events
 
+    def _fetch_gkg_record(self, gdelt_event: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Fetch the GKG record for one GDELT event (runs on a worker thread).
+
+        Args:
+            gdelt_event: Raw GDELT event dict with SOURCEURL and DATEADDED
+
+        Returns:
+            Raw GKG record dict, or None if not found
+        """
+        # GDELT-specific: Parse DATEADDED (YYYYMMDDHHMMSS format)
+        # Other adapters might receive ISO 8601 or Unix timestamps
+        date_str = str(gdelt_event['DATEADDED'])
+        event_date = timezone.datetime.strptime(
+            date_str[:8], '%Y%m%d'
+        ).replace(tzinfo=dt_timezone.utc)
+
+        return gdelt_gkg_service.get_gkg_by_document_id(
+            document_id=gdelt_event['SOURCEURL'],
+            partition_date=event_date
+        )
+
     def transform(self, raw_events: List[Dict[str, Any]]) -> List[BigQueryEvent]:
         """
         Transform GDELT events to canonical Event schema with normalizer logic.
@@ -208,7 +236,7 @@ class GdeltAdapter(DataSourceAdapter):
                 date_str = str(gdelt_event['DATEADDED'])
                 event_date = timezone.datetime.strptime(
                     date_str[:8], '%Y%m%d'
-                ).replace(tzinfo=pytz.UTC)
+                ).replace(tzinfo=dt_timezone.utc)
 
                 # Classify category using CAMEO EventCode
                 event_code = gdelt_event.get('EventCode', '')
@@ -373,8 +401,51 @@ class GdeltAdapter(DataSourceAdapter):
                 # Continue with other events - don't fail entire batch
 
         logger.info(f"Transformed {len(bigquery_events)} GDELT events to canonical schema")
+
+        # Check the whole batch for duplicates up front so validate() doesn't
+        # issue one BigQuery query per event
+        self._prefetch_duplicates(bigquery_events)
+
         return bigquery_events
 
+    def _prefetch_duplicates(self, events: List[BigQueryEvent]) -> None:
+        """
+        Look up which event IDs already exist in BigQuery with a single query.
+
+        Results populate the cache used by validate(). On query failure the
+        cache is left empty and validate() falls back to per-event checks.
+        The scan is pruned to partitions from dedup_cutoff() of the batch.
+
+        Args:
+            events: Transformed batch (GLOBALEVENTIDs and event timestamps)
+        """
+        self._duplicate_cache = {}
+        if not events:
+            return
+
+        event_ids = [event.id for event in events]
+        try:
+            query = f"""
+                SELECT id
+                FROM `{bigquery_service.project_id}.{bigquery_service.dataset_id}.events`
+                WHERE mentioned_at >= @cutoff
+                AND id IN UNNEST(@event_ids)
+            """
+            job_config = bigquery.QueryJobConfig(
+                maximum_bytes_billed=DEDUP_MAX_BYTES_BILLED,
+                query_parameters=[
+                    bigquery.ScalarQueryParameter(
+                        'cutoff', 'TIMESTAMP', dedup_cutoff(event.event_timestamp for event in events)
+                    ),
+                    bigquery.ArrayQueryParameter('event_ids', 'STRING', event_ids),
+                ]
+            )
+            results = bigquery_service.client.query(query, job_config=job_config).result()
+            existing = {row.id for row in results}
+            self._duplicate_cache = {event_id: event_id in existing for event_id in event_ids}
+        except Exception as e:
+            logger.error(f"Failed to batch check for duplicates: {e}")
+
     def _classify_actor_type(self, actor_code: Optional[str]) -> Optional[str]:
         """
         Classify actor type from GDELT actor code.
@@ -446,36 +517,45 @@ class GdeltAdapter(DataSourceAdapter):
             - (False, "error description") for other validation failures
 
         Note:
-            Duplicate detection queries BigQuery, so there's a small latency cost.
-            This is acceptable for GDELT's 15-minute sync frequency. Higher-frequency
-            adapters might want to use in-memory caching instead.
+            Events from the last transform() batch are answered from the batch
+            duplicate cache; any other event falls back to a single BigQuery query.
         """
         # Check required fields
         if not event.id:
             return (False, "Missing required field: id")
         if not event.source_url:
             return (False, "Missing required field: source_url")
-        if not event.mentioned_at:
-            return (False, "Missing required field: mentioned_at")
+        if not event.event_timestamp:
+            return (False, "Missing required field: event_timestamp")
         if not event.title:
             return (False, "Missing required field: title")
 
         # GDELT-specific: Check for duplicates using GLOBALEVENTID
         # Other adapters might check by URL, hash, or composite keys
+        if event.id in self._duplicate_cache:
+            if self._duplicate_cache[event.id]:
+                logger.debug(f"Skipping duplicate GDELT event: {event.id}")
+                return (False, "duplicate")
+            return (True, None)
+
         try:
             existing_query = f"""
                 SELECT COUNT(*) as count
                 FROM `{bigquery_service.project_id}.{bigquery_service.dataset_id}.events`
-                WHERE id = @event_id
+                WHERE mentioned_at >= @cutoff
+                AND id = @event_id
             """
-            from google.cloud import bigquery
             job_config = bigquery.QueryJobConfig(
+                maximum_bytes_billed=DEDUP_MAX_BYTES_BILLED,
                 query_parameters=[
-                    bigquery.ScalarQueryParameter('event_id', 'STRING', event.id)
+                    bigquery.ScalarQueryParameter(
+                        'cutoff', 'TIMESTAMP', dedup_cutoff([event.event_timestamp])
+                    ),
+                    bigquery.ScalarQueryParameter('event_id', 'STRING', event.id),
                 ]
             )
             results = bigquery_service.client.query(existing_query, job_config=job_config).result()
-            row = list(results)[0]
+            row = next(iter(results))
             if row.count > 0:
                 logger.debug(f"Skipping duplicate GDELT event: {event.id}")
                 return (False, "duplicate")
@@ -7,6 +7,8 @@ Requires GCP credentials to run.
 import os
 import unittest
 from datetime import timedelta
+from types import SimpleNamespace
+from unittest.mock import patch
 from django.test import TestCase
 from django.utils import timezone
 
@@ -137,7 +139,7 @@ class GdeltAdapterIntegrationTest(TestCase):
         invalid_event = BigQueryEvent(
             id="",  # Missing
             source_url="",  # Missing
-            mentioned_at=None,  # Missing
+            event_timestamp=None,  # Missing
             created_at=timezone.now(),
             title="",  # Missing
             content="Test",
@@ -209,3 +211,38 @@ class GdeltAdapterUnitTest(TestCase):
         self.assertTrue(callable(adapter.transform))
         self.assertTrue(callable(adapter.validate))
         self.assertTrue(callable(adapter.publish_events))
+
+
+class GdeltAdapterDuplicatePrefetchTest(TestCase):
+    """Batch duplicate prefetch with a mocked BigQuery client."""
+
+    def _raw_event(self, global_event_id):
+        return {
+            'GLOBALEVENTID': global_event_id,
+            'DATEADDED': 20260110123000,
+            'SOURCEURL': f'https://example.com/{global_event_id}',
+            'EventCode': '0231',
+            'Actor1Name': 'VENEZUELA',
+            'GoldsteinScale': -2.0,
+            'AvgTone': -3.5,
+            'NumSources': 2,
+        }
+
+    @patch('data_pipeline.adapters.gdelt_adapter.bigquery_service')
+    def test_transform_prefetches_duplicates_in_one_query(self, mock_service):
+        """transform() fills the duplicate cache with one batched query."""
+        mock_service.client.query.return_value.result.return_value = [
+            SimpleNamespace(id='1001')
+        ]
+        adapter = GdeltAdapter()
+
+        events = adapter.transform([self._raw_event(1001), self._raw_event(1002)])
+
+        self.assertEqual(len(events), 2)
+        self.assertIsInstance(events[0], BigQueryEvent)
+        mock_service.client.query.assert_called_once()
+        self.assertEqual(adapter._duplicate_cache, {'1001': True, '1002': False})
+
+        self.assertEqual(adapter.validate(events[0]), (False, "duplicate"))
+        self.assertEqual(adapter.validate(events[1]), (True, None))
+        mock_service.client.query.assert_called_once()
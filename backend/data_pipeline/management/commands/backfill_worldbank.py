@@ -160,23 +160,13 @@ class Command(BaseCommand):
 
                 created_count = 0
                 skipped_count = 0
+                new_events = []
 
                 # Process each observation
                 for data_point in data_points:
                     year = data_point['year']
                     value = data_point['value']
 
-                    # Check for duplicate
-                    existing = Event.objects.filter(
-                        source='WORLD_BANK',
-                        content__indicator_id=indicator_id,
-                        content__year=year,
-                    ).exists()
-
-                    if existing:
-                        skipped_count += 1
-                        continue
-
                     # Create Event
                     try:
                         indicator_data = {
@@ -184,16 +174,25 @@ class Command(BaseCommand):
                             'year': year,
                             'value': value,
                         }
-                        event = map_worldbank_to_event(indicator_data, indicator_config)
-
-                        with transaction.atomic():
-                            event.save()
-                            created_count += 1
+                        new_events.append(map_worldbank_to_event(indicator_data, indicator_config))
 
                     except Exception as e:
                         logger.error(f"Failed to create event for {indicator_id} {year}: {e}", exc_info=True)
                         skipped_count += 1
 
+                # Insert all observations for this indicator in one transaction.
+                # Existing ones are skipped by the unique index on (timestamp,
+                # indicator_id), which also holds for concurrent backfills.
+                if new_events:
+                    with transaction.atomic():
+                        Event.objects.bulk_create(new_events, batch_size=500, ignore_conflicts=True)
+                        # IDs are client-generated, so the rows that made it in
+                        # are the ones found by primary key
+                        created_count = Event.objects.filter(
+                            id__in=[event.id for event in new_events]
+                        ).count()
+                    skipped_count += len(new_events) - created_count
+
                 status_symbol = '✓' if created_count > 0 else '•'
                 status_style = self.style.SUCCESS if created_count > 0 else self.style.WARNING
                 self.stdout.write(
@@ -0,0 +1,63 @@
+"""
+Cloud Tasks client for the internal API handlers.
+
+Enqueues HTTP tasks that POST a JSON payload to /api/internal/* on the
+Cloud Run service, authenticated with an OIDC token for the Cloud Tasks
+service account (see api.views.internal).
+"""
+import json
+import logging
+import os
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# GCP Project configuration from environment
+GCP_PROJECT_ID = os.environ.get('GCP_PROJECT_ID', 'venezuelawatch-staging')
+GCP_LOCATION = 'us-central1'
+CLOUD_RUN_URL = os.environ.get('CLOUD_RUN_URL', 'https://venezuelawatch-api-gc6im6smjq-uc.a.run.app')
+
+# Service account whose OIDC token authenticates tasks to Cloud Run
+TASKS_SERVICE_ACCOUNT = f'cloudrun-tasks@{GCP_PROJECT_ID}.iam.gserviceaccount.com'
+
+
+def enqueue_internal_task(
+    queue: str,
+    path: str,
+    payload: Dict[str, Any],
+    dispatch_deadline: Optional[int] = None
+) -> str:
+    """
+    Enqueue a Cloud Task that POSTs payload to an internal API handler.
+
+    Args:
+        queue: Cloud Tasks queue name
+        path: Handler path on the Cloud Run service (e.g. '/api/internal/analyze-intelligence')
+        payload: JSON-serializable request body
+        dispatch_deadline: Seconds the handler may run (queue default if None)
+
+    Returns:
+        Name of the created Cloud Task
+    """
+    from google.cloud import tasks_v2
+
+    client = tasks_v2.CloudTasksClient()
+    parent = client.queue_path(GCP_PROJECT_ID, GCP_LOCATION, queue)
+
+    task = {
+        'http_request': {
+            'http_method': tasks_v2.HttpMethod.POST,
+            'url': f'{CLOUD_RUN_URL}{path}',
+            'headers': {'Content-Type': 'application/json'},
+            'body': json.dumps(payload).encode(),
+            'oidc_token': {
+                'service_account_email': TASKS_SERVICE_ACCOUNT
+            }
+        }
+    }
+    if dispatch_deadline is not None:
+        task['dispatch_deadline'] = {'seconds': dispatch_deadline}
+
+    response = client.create_task(request={'parent': parent, 'task': task})
+    logger.debug(f"Enqueued Cloud Task {response.name} for {path}")
+    return response.name
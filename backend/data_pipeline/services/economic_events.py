@@ -5,7 +5,8 @@ Analyzes FRED observations and generates alert events when economic indicators
 cross configured thresholds (e.g., oil prices below $50/barrel, hyperinflation).
 """
 import logging
-from typing import Dict, Any, List, Optional
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 from datetime import timezone as dt_timezone
 from django.utils import timezone
@@ -40,59 +41,73 @@ def detect_threshold_events(
     units = config.get('units', '')
     category = config.get('category', 'economic')
 
-    # Check threshold_low breach
-    threshold_low = config.get('threshold_low')
+    breaches = _detect_breaches(
+        current_value,
+        previous_value,
+        config.get('threshold_low'),
+        config.get('threshold_high'),
+    )
+
+    for threshold_type, threshold_value in breaches:
+        alert_event = _create_threshold_alert(
+            series_id=series_id,
+            series_name=series_name,
+            current_value=current_value,
+            previous_value=previous_value,
+            threshold_value=threshold_value,
+            threshold_type=threshold_type,
+            units=units,
+            category=category,
+            observation_date=observation_date,
+        )
+        alerts.append(alert_event)
+        logger.info(
+            f"Threshold {threshold_type.upper()} breach detected: {series_name} = {current_value} "
+            f"(threshold: {threshold_value})"
+        )
+
+    return alerts
+
+
+@lru_cache(maxsize=4096)
+def _detect_breaches(
+    current_value: float,
+    previous_value: Optional[float],
+    threshold_low: Optional[float],
+    threshold_high: Optional[float],
+) -> Tuple[Tuple[str, float], ...]:
+    """
+    Decide which thresholds a new observation newly breaches.
+
+    Memoized on the raw values: backfills and re-ingested series repeat the
+    same (value, previous value, thresholds) combinations.
+
+    Args:
+        current_value: Current observation value
+        previous_value: Previous observation value, if any
+        threshold_low: Configured low threshold, if any
+        threshold_high: Configured high threshold, if any
+
+    Returns:
+        Tuple of (threshold_type, threshold_value) pairs, 'low' before 'high'
+    """
+    breaches = []
+
+    # Only alert on new breaches (not already below threshold)
     if threshold_low is not None:
-        # Alert if current value crosses below threshold
         current_below = current_value < threshold_low
         previous_below = previous_value is not None and previous_value < threshold_low
-
-        # Only alert on new breaches (not already below threshold)
         if current_below and not previous_below:
-            alert_event = _create_threshold_alert(
-                series_id=series_id,
-                series_name=series_name,
-                current_value=current_value,
-                previous_value=previous_value,
-                threshold_value=threshold_low,
-                threshold_type='low',
-                units=units,
-                category=category,
-                observation_date=observation_date,
-            )
-            alerts.append(alert_event)
-            logger.info(
-                f"Threshold LOW breach detected: {series_name} = {current_value} "
-                f"(threshold: {threshold_low})"
-            )
-
-    # Check threshold_high breach
-    threshold_high = config.get('threshold_high')
+            breaches.append(('low', threshold_low))
+
+    # Only alert on new breaches (not already above threshold)
     if threshold_high is not None:
-        # Alert if current value crosses above threshold
         current_above = current_value > threshold_high
         previous_above = previous_value is not None and previous_value > threshold_high
-
-        # Only alert on new breaches (not already above threshold)
         if current_above and not previous_above:
-            alert_event = _create_threshold_alert(
-                series_id=series_id,
-                series_name=series_name,
-                current_value=current_value,
-                previous_value=previous_value,
-                threshold_value=threshold_high,
-                threshold_type='high',
-                units=units,
-                category=category,
-                observation_date=observation_date,
-            )
-            alerts.append(alert_event)
-            logger.info(
-                f"Threshold HIGH breach detected: {series_name} = {current_value} "
-                f"(threshold: {threshold_high})"
-            )
+            breaches.append(('high', threshold_high))
 
-    return alerts
+    return tuple(breaches)
 
 
 def _create_threshold_alert(
@@ -13,14 +13,16 @@ Uses Claude to analyze events in any language, extracting:
 
 All in a single LLM API call for efficiency.
 """
+import hashlib
 import logging
 import json
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from django.core.cache import cache
 from django.conf import settings
 
 from data_pipeline.services.llm_client import LLMClient
 from data_pipeline.services.gdelt_quantitative_scorer import GdeltQuantitativeScorer
+from data_pipeline.services.semantic_cache import SemanticAnalysisCache
 
 logger = logging.getLogger(__name__)
 
@@ -43,6 +45,23 @@ class LLMIntelligence:
     # GDELT scorer (class-level, reuse across calls)
     _gdelt_scorer = None
 
+    # Response JSON schema (class-level, built once per process)
+    _intelligence_schema = None
+
+    # Model tier -> LiteLLM model name
+    MODEL_TIERS = {
+        "fast": LLMClient.FAST_MODEL,
+        "standard": LLMClient.PRIMARY_MODEL,
+        "premium": LLMClient.PREMIUM_MODEL,
+    }
+
+    # Entity groups flattened into an event's entity name list, in order
+    ENTITY_GROUPS = ('people', 'organizations', 'locations')
+
+    # Events whose title + content (beyond the title itself) is shorter than
+    # this are analyzed locally (VADER + spaCy) instead of by the LLM
+    LOCAL_ANALYSIS_MAX_CHARS = 200
+
     @classmethod
     def get_gdelt_scorer(cls):
         """Get or create GDELT scorer with configured weights."""
@@ -51,6 +70,18 @@ class LLMIntelligence:
             cls._gdelt_scorer = GdeltQuantitativeScorer(weights=weights)
         return cls._gdelt_scorer
 
+    @classmethod
+    def preload(cls) -> None:
+        """
+        Do per-process setup ahead of the first analysis.
+
+        Fetches LLM API keys, builds the response schema and the GDELT
+        scorer, so the first event a worker analyzes doesn't pay for them.
+        """
+        LLMClient.initialize()
+        cls._get_intelligence_schema()
+        cls.get_gdelt_scorer()
+
     @classmethod
     def analyze_event_comprehensive(
         cls,
@@ -75,7 +106,10 @@ class LLMIntelligence:
             Intelligence analysis dict with hybrid risk score
         """
         # Check cache first
-        cache_key = f"llm_intelligence:{hash(title + content + str(context) + model)}"
+        cache_digest = hashlib.sha256(
+            (title + content + str(context) + model).encode('utf-8')
+        ).hexdigest()
+        cache_key = f"llm_intelligence:{cache_digest}"
         cached_result = cache.get(cache_key)
         if cached_result:
             logger.info("Using cached LLM intelligence result")
@@ -92,12 +126,15 @@ class LLMIntelligence:
                 logger.warning(f"GDELT scoring failed, proceeding with LLM-only: {e}")
                 gdelt_score = None
 
+        # Short alerts carry too little text for the LLM to add much; score
+        # them locally at no token cost
+        if content and content != title and len(title) + len(content) < cls.LOCAL_ANALYSIS_MAX_CHARS:
+            result = cls._analyze_locally(title, content, gdelt_score)
+            cache.set(cache_key, result, cls.CACHE_TTL)
+            return result
+
         # Select model based on tier
-        model_name = {
-            "fast": LLMClient.FAST_MODEL,
-            "standard": LLMClient.PRIMARY_MODEL,
-            "premium": LLMClient.PREMIUM_MODEL
-        }.get(model, LLMClient.PRIMARY_MODEL)
+        model_name = cls.MODEL_TIERS.get(model, LLMClient.PRIMARY_MODEL)
 
         # Define JSON schema for structured response
         schema = cls._get_intelligence_schema()
@@ -112,20 +149,40 @@ class LLMIntelligence:
             import time
             start_time = time.time()
 
-            # Use structured output method with JSON schema
-            response = LLMClient._call_llm_structured(
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
-                schema=schema,
-                schema_name="intelligence_analysis",
-                model=model_name,
-                temperature=0.3,
-                max_tokens=2048,
-                strict=True
+            # Near-identical articles with the same other prompt inputs reuse
+            # the cached LLM response
+            semantic_text = SemanticAnalysisCache.cache_text(title, content)
+            semantic_scope = SemanticAnalysisCache.prompt_scope(context, gdelt_score)
+            response, semantic_vector = SemanticAnalysisCache.lookup(
+                semantic_text, model, semantic_scope
             )
 
+            if response is None:
+                # Use structured output method with JSON schema
+                response = LLMClient._call_llm_structured(
+                    messages=[
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": user_prompt}
+                    ],
+                    schema=schema,
+                    schema_name="intelligence_analysis",
+                    model=model_name,
+                    temperature=0.3,
+                    max_tokens=2048,
+                    strict=True
+                )
+                SemanticAnalysisCache.store(
+                    semantic_text,
+                    model,
+                    semantic_scope,
+                    {'content': response['content'], 'model': response['model']},
+                    semantic_vector,
+                )
+                semantic_cache_hit = False
+            else:
+                response['usage'] = {'total_tokens': 0}
+                semantic_cache_hit = True
+
             processing_time = int((time.time() - start_time) * 1000)
 
             # Response is already parsed as dict from structured output
@@ -167,7 +224,8 @@ class LLMIntelligence:
                 'tokens_used': response['usage']['total_tokens'],
                 'processing_time_ms': processing_time,
                 'used_native_schema': model_name in [LLMClient.PRIMARY_MODEL, LLMClient.PREMIUM_MODEL],
-                'scoring_method': 'hybrid' if gdelt_score is not None else 'llm_only'
+                'scoring_method': 'hybrid' if gdelt_score is not None else 'llm_only',
+                'semantic_cache_hit': semantic_cache_hit,
             }
 
             # Cache result
@@ -201,8 +259,16 @@ class LLMIntelligence:
         Defines the complete structure for LLM structured output with strict validation.
 
         Returns:
-            JSON schema dict with all required fields and types
+            JSON schema dict with all required fields and types (shared;
+            do not mutate)
         """
+        if cls._intelligence_schema is None:
+            cls._intelligence_schema = cls._build_intelligence_schema()
+        return cls._intelligence_schema
+
+    @classmethod
+    def _build_intelligence_schema(cls) -> Dict[str, Any]:
+        """Build the JSON schema returned by _get_intelligence_schema."""
         return {
             "type": "object",
             "properties": {
@@ -539,7 +605,10 @@ Respond ONLY with valid JSON matching this exact structure:
             if 'event_type' in context:
                 context_parts.append(f"Event Type: {context['event_type']}")
             if 'timestamp' in context:
-                context_parts.append(f"Date: {context['timestamp']}")
+                # Day only, so wire copies share a semantic cache scope
+                context_parts.append(
+                    f"Date: {SemanticAnalysisCache.prompt_date(context['timestamp'])}"
+                )
 
             if context_parts:
                 context_str = f"\n\nContext:\n" + "\n".join(f"- {part}" for part in context_parts)
@@ -572,6 +641,85 @@ You may agree, disagree, or refine it based on the full context and nuances in t
 
 Provide your analysis in the exact JSON format specified in the system prompt."""
 
+    @classmethod
+    def _analyze_locally(
+        cls,
+        title: str,
+        content: str,
+        gdelt_score: Optional[float]
+    ) -> Dict[str, Any]:
+        """
+        Analyze a short event without an LLM call.
+
+        Sentiment comes from VADER and entities from spaCy. The qualitative
+        risk is derived from sentiment (as in RiskAggregator) and blended
+        with the GDELT score when available. The result has the same shape
+        as an LLM analysis.
+        """
+        from data_pipeline.services.sentiment_analyzer import SentimentAnalyzer
+        from data_pipeline.services.entity_extractor import EntityExtractor
+        from data_pipeline.services.risk_scorer import RiskScorer
+
+        text = f"{title}. {content}"
+        sentiment = SentimentAnalyzer.analyze_text(text)
+        entity_groups = EntityExtractor.categorize_entities(
+            EntityExtractor.extract_entities(text, max_entities=20)
+        )
+
+        # Sentiment -1 -> 100, 0 -> 50, +1 -> 0
+        local_risk_score = max(0.0, min(1.0, 0.5 - sentiment * 0.5)) * 100
+        if gdelt_score is not None:
+            weights = settings.HYBRID_SCORING['weights']
+            hybrid_score = weights['gdelt'] * gdelt_score + weights['llm'] * local_risk_score
+        else:
+            hybrid_score = local_risk_score
+
+        logger.info(
+            f"Local intelligence analysis (short content): "
+            f"hybrid_score={hybrid_score:.2f}, sentiment={sentiment:.2f}"
+        )
+
+        return {
+            'sentiment': {
+                'score': sentiment,
+                'label': SentimentAnalyzer.get_sentiment_label(sentiment),
+                'confidence': 0.5,
+                'reasoning': 'Local VADER analysis (short content)',
+                'nuances': []
+            },
+            'summary': {
+                'short': title[:200],
+                'key_points': [],
+                'full': content
+            },
+            'entities': {
+                group: [{'name': name} for name in entity_groups.get(group, [])]
+                for group in cls.ENTITY_GROUPS
+            },
+            'relationships': [],
+            'risk': {
+                'score': hybrid_score / 100,
+                'level': RiskScorer.get_risk_level(hybrid_score / 100),
+                'reasoning': 'Derived locally from sentiment (short content)',
+                'factors': [],
+                'mitigation': [],
+                'hybrid_score': hybrid_score,
+                'gdelt_score': gdelt_score,
+                'llm_score': None,
+                'severity': cls._derive_severity(hybrid_score),
+            },
+            'themes': [],
+            'urgency': 'medium',
+            'language': 'unknown',
+            'metadata': {
+                'model_used': 'local',
+                'tokens_used': 0,
+                'processing_time_ms': 0,
+                'used_native_schema': False,
+                'scoring_method': 'local',
+            }
+        }
+
     @classmethod
     def _get_fallback_result(
         cls,
@@ -617,22 +765,40 @@ Provide your analysis in the exact JSON format specified in the system prompt.""
         }
 
     @classmethod
-    def analyze_event_model(
-        cls,
-        event: 'Event',
-        model: str = "fast"
-    ) -> Dict[str, Any]:
+    def extract_entity_names(cls, analysis: Dict[str, Any], limit: int = 20) -> List[str]:
         """
-        Analyze an Event model instance.
+        Flatten entity names from an analysis result.
 
         Args:
-            event: Event instance
-            model: Model tier ("fast", "standard", "premium")
+            analysis: Result of analyze_event_comprehensive / analyze_event_model
+            limit: Maximum number of names to return
 
         Returns:
-            Complete intelligence analysis dict
+            People, then organizations, then locations names, capped at limit
+        """
+        entities = analysis['entities']
+        return [
+            entity['name']
+            for group in cls.ENTITY_GROUPS
+            for entity in entities.get(group, ())
+        ][:limit]
+
+    @classmethod
+    def event_text(cls, event: Any) -> Tuple[str, str]:
+        """
+        Extract the title and analyzable content of an event.
+
+        Content is a dict of text fields on Event models and a string on
+        BigQuery rows (EventView). GDELT rows carry a string generated from
+        the event code and tone rather than article text, so they keep the
+        title as their content.
+
+        Args:
+            event: Event instance (or any object with title and content)
+
+        Returns:
+            Tuple of (title, content); content falls back to the title
         """
-        # Extract text content
         title = event.title or ""
 
         content_parts = []
@@ -640,8 +806,47 @@ Provide your analysis in the exact JSON format specified in the system prompt.""
             for field in ['description', 'summary', 'body', 'text']:
                 if field in event.content and event.content[field]:
                     content_parts.append(str(event.content[field]))
+        elif isinstance(event.content, str) and getattr(event, 'source', '') != 'GDELT':
+            if event.content.strip():
+                content_parts.append(event.content)
 
         content = ' '.join(content_parts) if content_parts else title
+        return title, content
+
+    @classmethod
+    def prefetch_embeddings(cls, events: List[Any]) -> int:
+        """
+        Embed a batch of events for the semantic cache in as few API calls
+        as possible, ahead of analyzing them one by one.
+
+        Args:
+            events: Event instances (or objects with title and content)
+
+        Returns:
+            Number of texts newly embedded
+        """
+        return SemanticAnalysisCache.embed_texts([
+            SemanticAnalysisCache.cache_text(*cls.event_text(event))
+            for event in events
+        ])
+
+    @classmethod
+    def analyze_event_model(
+        cls,
+        event: 'Event',
+        model: str = "fast"
+    ) -> Dict[str, Any]:
+        """
+        Analyze an Event model instance.
+
+        Args:
+            event: Event instance
+            model: Model tier ("fast", "standard", "premium")
+
+        Returns:
+            Complete intelligence analysis dict
+        """
+        title, content = cls.event_text(event)
 
         # Build context (include metadata for GDELT scoring)
         context = {
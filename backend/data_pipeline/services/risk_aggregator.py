@@ -8,7 +8,11 @@ Produces composite risk scores (0-100) that avoid score inflation and capture
 nuanced risk across multiple domains.
 """
 import logging
-from typing import List, Dict, Optional
+import math
+import numbers
+from typing import List, Dict, Optional, Sequence
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
@@ -102,6 +106,9 @@ class RiskAggregator:
         Returns:
             Risk score 0-100 (scaled from weighted 0.0-1.0)
 
+        Raises:
+            ValueError: If an input is malformed (see _validate_inputs)
+
         Example:
             >>> score = RiskAggregator.calculate_composite_risk(
             ...     llm_risk=0.7,
@@ -113,14 +120,10 @@ class RiskAggregator:
             ... )
             >>> assert 0 <= score <= 100
         """
+        cls._validate_inputs(llm_risk, sanctions_score, sentiment, urgency, event_type, themes)
+
         # Map urgency to risk score (0.0-1.0)
-        urgency_map = {
-            'low': 0.2,
-            'medium': 0.5,
-            'high': 0.8,
-            'immediate': 1.0
-        }
-        urgency_risk = urgency_map.get(urgency.lower() if urgency else 'medium', 0.5)
+        urgency_risk = cls.URGENCY_RISK.get(urgency.lower() if urgency else 'medium', 0.5)
 
         # Map sentiment to risk (absolute value, negative = risky)
         # Sentiment range: -1.0 (very negative) to +1.0 (very positive)
@@ -179,6 +182,148 @@ class RiskAggregator:
 
         return final_score
 
+    # Score for events whose inputs are malformed (matches RiskScorer's error fallback)
+    FALLBACK_SCORE = 50.0
+
+    # Dimension order of the weight/dimension matrices in calculate_composite_risk_batch
+    DIMENSIONS = ('llm_base_risk', 'sanctions', 'sentiment', 'urgency', 'supply_chain')
+
+    # Urgency level to risk score (0.0-1.0)
+    URGENCY_RISK = {
+        'low': 0.2,
+        'medium': 0.5,
+        'high': 0.8,
+        'immediate': 1.0
+    }
+
+    @classmethod
+    def calculate_composite_risk_batch(
+        cls,
+        llm_risks: Sequence[float],
+        sanctions_scores: Sequence[float],
+        sentiments: Sequence[Optional[float]],
+        urgencies: Sequence[str],
+        event_types: Sequence[str],
+        themes: Sequence[List[str]]
+    ) -> np.ndarray:
+        """
+        Vectorized calculate_composite_risk over many events.
+
+        The per-event inputs are mapped to an (n, 5) dimension matrix and
+        weighted with an (n, 5) weight matrix in one numpy expression,
+        instead of one Python aggregation per event. Scores match
+        calculate_composite_risk; events with malformed inputs (where it
+        raises ValueError) score FALLBACK_SCORE instead of failing the batch.
+
+        Args:
+            llm_risks: Per-event LLM risk, 0.0-1.0
+            sanctions_scores: Per-event sanctions score, 0.0 or 1.0
+            sentiments: Per-event sentiment, -1.0 to 1.0 (None = neutral)
+            urgencies: Per-event urgency level
+            event_types: Per-event type for weight selection
+            themes: Per-event theme lists for supply chain detection
+
+        Returns:
+            Array of risk scores 0-100
+        """
+        if not len(event_types):
+            return np.empty(0)
+
+        # Validate per event so one malformed event cannot become NaN or fail the batch
+        rows = list(zip(llm_risks, sanctions_scores, sentiments, urgencies, event_types, themes))
+        scores = np.full(len(rows), cls.FALLBACK_SCORE)
+        valid = []
+        for index, row in enumerate(rows):
+            try:
+                cls._validate_inputs(*row)
+            except ValueError as e:
+                logger.warning(f"Malformed risk inputs for event {index}, scoring {cls.FALLBACK_SCORE}: {e}")
+            else:
+                valid.append(index)
+        if not valid:
+            return scores
+        llm_risks, sanctions_scores, sentiments, urgencies, event_types, themes = zip(
+            *(rows[index] for index in valid)
+        )
+
+        urgency_risk = np.array([
+            cls.URGENCY_RISK.get(urgency.lower() if urgency else 'medium', 0.5)
+            for urgency in urgencies
+        ], dtype=np.float64)
+
+        sentiment = np.array(
+            [np.nan if value is None else value for value in sentiments],
+            dtype=np.float64,
+        )
+        sentiment_risk = np.where(
+            np.isnan(sentiment), 0.5, np.clip(0.5 - sentiment * 0.5, 0.0, 1.0)
+        )
+
+        supply_chain_risk = np.array(
+            [cls._calculate_supply_chain_risk(event_themes) for event_themes in themes],
+            dtype=np.float64,
+        )
+
+        dimensions = np.column_stack([
+            np.asarray(llm_risks, dtype=np.float64),
+            np.asarray(sanctions_scores, dtype=np.float64),
+            sentiment_risk,
+            urgency_risk,
+            supply_chain_risk,
+        ])
+
+        weight_rows = {}
+        for event_type in set(event_types):
+            weights = cls.EVENT_TYPE_WEIGHTS.get(event_type, cls.DEFAULT_WEIGHTS)
+            row = np.array([weights.get(dim, 0.0) for dim in cls.DIMENSIONS])
+            if abs(row.sum() - 1.0) > 0.001:
+                row = row / row.sum()
+            weight_rows[event_type] = row
+        weights = np.vstack([weight_rows[event_type] for event_type in event_types])
+
+        composite = np.clip((dimensions * weights).sum(axis=1), 0.0, 1.0)
+        scores[valid] = np.round(composite * 100, 2)
+        return scores
+
+    @classmethod
+    def _validate_inputs(
+        cls,
+        llm_risk: float,
+        sanctions_score: float,
+        sentiment: Optional[float],
+        urgency: Optional[str],
+        event_type: Optional[str],
+        themes: Optional[List[str]]
+    ) -> None:
+        """
+        Check calculate_composite_risk inputs before aggregation.
+
+        Raises:
+            ValueError: If a score is missing, non-numeric or not finite, or
+                urgency, event type or themes are not strings
+        """
+        for name, value in (('llm_risk', llm_risk), ('sanctions_score', sanctions_score)):
+            if not cls._is_finite_number(value):
+                raise ValueError(f"{name} must be a finite number, got {value!r}")
+
+        if sentiment is not None and not cls._is_finite_number(sentiment):
+            raise ValueError(f"sentiment must be a finite number or None, got {sentiment!r}")
+
+        if urgency is not None and not isinstance(urgency, str):
+            raise ValueError(f"urgency must be a string or None, got {urgency!r}")
+
+        if event_type is not None and not isinstance(event_type, str):
+            raise ValueError(f"event_type must be a string or None, got {event_type!r}")
+
+        if themes and not (
+            isinstance(themes, (list, tuple)) and all(isinstance(theme, str) for theme in themes)
+        ):
+            raise ValueError(f"themes must be a list of strings, got {themes!r}")
+
+    @staticmethod
+    def _is_finite_number(value) -> bool:
+        return isinstance(value, numbers.Real) and math.isfinite(value)
+
     @classmethod
     def _calculate_supply_chain_risk(cls, themes: List[str]) -> float:
         """
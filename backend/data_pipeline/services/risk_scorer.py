@@ -9,12 +9,16 @@ Calculates risk scores based on event characteristics including:
 """
 import logging
 import re
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from datetime import datetime, timedelta
 from django.utils import timezone
 
 logger = logging.getLogger(__name__)
 
+# Bump whenever calculate_comprehensive_risk changes, so stored scores from an
+# older scorer are recalculated by batch_recalculate_risk_scores
+RISK_SCORER_VERSION = 2
+
 
 class RiskScorer:
     """
@@ -107,55 +111,18 @@ class RiskScorer:
             >>> assert 0 <= score <= 100
         """
         from data_pipeline.services.risk_aggregator import RiskAggregator
-        from data_pipeline.services.sanctions_screener import SanctionsScreener
 
         try:
-            # Extract LLM base risk (0.0-1.0)
-            llm_risk = 0.5  # Default if no LLM analysis
-            if event.llm_analysis:
-                llm_risk = event.llm_analysis.get('risk', {}).get('score', 0.5)
-
-            # Get sanctions screening score (0.0 or 1.0)
-            # Check if event already has sanctions screening results
-            if event.llm_analysis and 'sanctions_score' in event.llm_analysis:
-                sanctions_score = event.llm_analysis['sanctions_score']
-            else:
-                # Screen entities if LLM analysis exists
-                if event.llm_analysis and 'entities' in event.llm_analysis:
-                    sanctions_score = SanctionsScreener.screen_event_entities(event)
-                else:
-                    sanctions_score = 0.0
-
-            # Extract sentiment (-1.0 to 1.0)
-            sentiment = event.sentiment if event.sentiment is not None else 0.0
-
-            # Extract urgency (from LLM analysis or event field)
-            urgency = event.urgency or 'medium'
-
-            # Extract event type
-            event_type = event.event_type or 'OTHER'
-
-            # Extract themes (from LLM analysis or event field)
-            themes = []
-            if event.llm_analysis:
-                themes = event.llm_analysis.get('themes', [])
-            elif event.themes:
-                themes = event.themes
+            inputs = cls._composite_risk_inputs(event)
 
             # Calculate composite risk using RiskAggregator
-            composite_risk = RiskAggregator.calculate_composite_risk(
-                llm_risk=llm_risk,
-                sanctions_score=sanctions_score,
-                sentiment=sentiment,
-                urgency=urgency,
-                event_type=event_type,
-                themes=themes
-            )
+            composite_risk = RiskAggregator.calculate_composite_risk(**inputs)
 
             logger.info(
                 f"Event {event.id} comprehensive risk: {composite_risk:.2f} "
-                f"(llm={llm_risk:.2f}, sanctions={sanctions_score:.2f}, "
-                f"sentiment={sentiment:.2f}, urgency={urgency}, type={event_type})"
+                f"(llm={inputs['llm_risk']:.2f}, sanctions={inputs['sanctions_score']:.2f}, "
+                f"sentiment={inputs['sentiment']:.2f}, urgency={inputs['urgency']}, "
+                f"type={inputs['event_type']})"
             )
 
             return composite_risk
@@ -167,6 +134,93 @@ class RiskScorer:
             )
             return 50.0  # Default to medium risk (50/100) on error
 
+    @classmethod
+    def calculate_comprehensive_risk_batch(cls, events: List['Event']) -> List[float]:
+        """
+        Calculate comprehensive risk for many events at once.
+
+        Gathers each event's risk dimensions, then aggregates all of them in
+        one vectorized RiskAggregator.calculate_composite_risk_batch call.
+        Events whose inputs cannot be gathered score 50.0, as in
+        calculate_comprehensive_risk.
+
+        Args:
+            events: Event model instances with llm_analysis populated
+
+        Returns:
+            Composite risk scores from 0-100, in the order of events
+        """
+        from data_pipeline.services.risk_aggregator import RiskAggregator
+
+        inputs = []
+        failed = set()
+        for index, event in enumerate(events):
+            try:
+                inputs.append(cls._composite_risk_inputs(event))
+            except Exception as e:
+                logger.error(
+                    f"Failed to calculate comprehensive risk for Event {event.id}: {e}",
+                    exc_info=True
+                )
+                failed.add(index)
+
+        scores = iter(RiskAggregator.calculate_composite_risk_batch(
+            llm_risks=[i['llm_risk'] for i in inputs],
+            sanctions_scores=[i['sanctions_score'] for i in inputs],
+            sentiments=[i['sentiment'] for i in inputs],
+            urgencies=[i['urgency'] for i in inputs],
+            event_types=[i['event_type'] for i in inputs],
+            themes=[i['themes'] for i in inputs],
+        ).tolist())
+
+        return [50.0 if index in failed else next(scores) for index in range(len(events))]
+
+    @classmethod
+    def _composite_risk_inputs(cls, event: 'Event') -> Dict[str, Any]:
+        """Gather RiskAggregator.calculate_composite_risk arguments for an event."""
+        from data_pipeline.services.sanctions_screener import SanctionsScreener
+
+        # Extract LLM base risk (0.0-1.0)
+        llm_risk = 0.5  # Default if no LLM analysis
+        if event.llm_analysis:
+            llm_risk = event.llm_analysis.get('risk', {}).get('score', 0.5)
+
+        # Get sanctions screening score (0.0 or 1.0)
+        # Check if event already has sanctions screening results
+        if event.llm_analysis and 'sanctions_score' in event.llm_analysis:
+            sanctions_score = event.llm_analysis['sanctions_score']
+        else:
+            # Screen entities if LLM analysis exists
+            if event.llm_analysis and 'entities' in event.llm_analysis:
+                sanctions_score = SanctionsScreener.screen_event_entities(event)
+            else:
+                sanctions_score = 0.0
+
+        # Extract sentiment (-1.0 to 1.0)
+        sentiment = event.sentiment if event.sentiment is not None else 0.0
+
+        # Extract urgency (from LLM analysis or event field)
+        urgency = event.urgency or 'medium'
+
+        # Extract event type
+        event_type = event.event_type or 'OTHER'
+
+        # Extract themes (from LLM analysis or event field)
+        themes = []
+        if event.llm_analysis:
+            themes = event.llm_analysis.get('themes', [])
+        elif event.themes:
+            themes = event.themes
+
+        return {
+            'llm_risk': llm_risk,
+            'sanctions_score': sanctions_score,
+            'sentiment': sentiment,
+            'urgency': urgency,
+            'event_type': event_type,
+            'themes': themes,
+        }
+
     @classmethod
     def calculate_risk_score(cls, event: 'Event') -> float:
         """
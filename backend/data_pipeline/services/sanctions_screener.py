@@ -6,10 +6,21 @@ using fuzzy matching to handle name variations, transliterations, and aliases.
 
 Uses free OFAC API by default, with optional OpenSanctions premium support.
 """
+import hashlib
 import logging
+import threading
+import time
+from bisect import bisect_right
+from dataclasses import dataclass
+from datetime import datetime
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Dict, List, Optional, Tuple
+from urllib3.util.retry import Retry
+from rapidfuzz import process
+from rapidfuzz.distance import Levenshtein
 from django.conf import settings
+from django.core.cache import cache
 from django.utils import timezone
 
 from core.models import Event, SanctionsMatch
@@ -17,6 +28,34 @@ from data_pipeline.services.secrets import SecretManagerClient
 
 logger = logging.getLogger(__name__)
 
+# Shared keep-alive session for sanctions APIs (reused across screenings in a worker)
+_SESSION = requests.Session()
+_SESSION.mount(
+    'https://',
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=8,
+        max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=(502, 503, 504)),
+    ),
+)
+
+
+# Separates names in _SDNIndex.joined; never part of a normalized name
+_NAME_SEPARATOR = '\x00'
+
+
+@dataclass(slots=True, frozen=True)
+class _SDNIndex:
+    """Normalized SDN names of one entity type, indexed for exact and containment lookups."""
+    names: List[str]
+    entries: List[Dict]
+    # Positions in names of each distinct name
+    positions: Dict[str, List[int]]
+    # All names joined by _NAME_SEPARATOR, and the offset each name starts at
+    joined: str
+    starts: List[int]
+    max_name_length: int
+
 
 class SanctionsScreener:
     """
@@ -36,6 +75,21 @@ class SanctionsScreener:
     # API timeout
     API_TIMEOUT = 10  # seconds
 
+    # OFAC SDN list, downloaded once and reused for this long (6 hours)
+    OFAC_SDN_URL = 'https://sanctionssearch.ofac.treas.gov/api/PublicationPreview/SdnList'
+    SDN_CACHE_TTL = 6 * 3600
+
+    # Cache keys recording when the downloaded SDN list last changed content
+    SDN_DIGEST_CACHE_KEY = 'sanctions:sdn_digest'
+    SDN_CHANGED_AT_CACHE_KEY = 'sanctions:sdn_changed_at'
+
+    _sdn_lock = threading.Lock()
+    _sdn_entries: Optional[List[Dict]] = None
+    _sdn_loaded_at = 0.0
+    # Normalized names and entries per entity type ('individual', 'entity'),
+    # rebuilt whenever the SDN list is re-downloaded
+    _sdn_index: Dict[str, _SDNIndex] = {}
+
     def __init__(self):
         """Initialize sanctions screener with API credentials."""
         self.secret_client = SecretManagerClient()
@@ -63,12 +117,60 @@ class SanctionsScreener:
         Side effects:
             Creates SanctionsMatch records for matches above threshold
         """
+        scores, matches = cls.screen_events_bulk([event])
+        if matches:
+            SanctionsMatch.objects.bulk_create(matches)
+        return scores[event.id]
+
+    @classmethod
+    def screen_events_bulk(
+        cls,
+        events: List[Event]
+    ) -> Tuple[Dict[str, float], List[SanctionsMatch]]:
+        """
+        Screen many events, returning unsaved matches for one bulk_create.
+
+        A single screener (and API session) is shared across events, and each
+        distinct entity name is looked up once per call, so names recurring
+        across events cost one API request.
+
+        Args:
+            events: Event objects with llm_analysis containing entities
+
+        Returns:
+            (sanctions_score per event ID, unsaved SanctionsMatch instances)
+        """
         screener = cls()
+        lookups: Dict[Tuple[str, str], List[Dict]] = {}
+        scores: Dict[str, float] = {}
+        all_matches: List[SanctionsMatch] = []
+
+        for event in events:
+            score, matches = screener._screen_event(event, lookups)
+            scores[event.id] = score
+            all_matches.extend(matches)
+
+        return scores, all_matches
+
+    def _screen_event(
+        self,
+        event: Event,
+        lookups: Dict[Tuple[str, str], List[Dict]]
+    ) -> Tuple[float, List[SanctionsMatch]]:
+        """
+        Screen one event's people and organizations.
+
+        Args:
+            event: Event object with llm_analysis containing entities
+            lookups: Sanctions lookups already made, keyed on (entity_type, name)
 
+        Returns:
+            (sanctions_score, unsaved SanctionsMatch instances)
+        """
         # Extract entities from LLM analysis
         if not event.llm_analysis or 'entities' not in event.llm_analysis:
             logger.debug(f"Event {event.id} has no entity data to screen")
-            return 0.0
+            return 0.0, []
 
         entities = event.llm_analysis.get('entities', {})
         people = entities.get('people', [])
@@ -80,57 +182,43 @@ class SanctionsScreener:
         )
 
         max_match_score = 0.0
+        sanctions_matches = []
+
+        for entity_type, candidates, check in (
+            ('person', people, self._check_person),
+            ('organization', organizations, self._check_organization),
+        ):
+            for candidate in candidates:
+                if isinstance(candidate, dict):
+                    name = candidate.get('name', '')
+                else:
+                    # Handle simple string format
+                    name = str(candidate)
+
+                if not name:
+                    continue
 
-        # Screen people
-        for person in people:
-            if isinstance(person, dict):
-                name = person.get('name', '')
-            else:
-                # Handle simple string format
-                name = str(person)
-
-            if not name:
-                continue
-
-            matches = screener._check_person(name)
-            for match in matches:
-                if match['score'] > max_match_score:
-                    max_match_score = match['score']
-
-                # Record matches above threshold
-                if match['score'] >= cls.RECORD_THRESHOLD:
-                    screener._create_sanctions_match(
-                        event=event,
-                        entity_name=name,
-                        entity_type='person',
-                        match_data=match
-                    )
-
-        # Screen organizations
-        for org in organizations:
-            if isinstance(org, dict):
-                name = org.get('name', '')
-            else:
-                name = str(org)
-
-            if not name:
-                continue
-
-            matches = screener._check_organization(name)
-            for match in matches:
-                if match['score'] > max_match_score:
-                    max_match_score = match['score']
-
-                if match['score'] >= cls.RECORD_THRESHOLD:
-                    screener._create_sanctions_match(
-                        event=event,
-                        entity_name=name,
-                        entity_type='organization',
-                        match_data=match
-                    )
+                key = (entity_type, name)
+                if key not in lookups:
+                    lookups[key] = check(name)
+
+                for match in lookups[key]:
+                    if match['score'] > max_match_score:
+                        max_match_score = match['score']
+
+                    # Record matches above threshold
+                    if match['score'] >= self.RECORD_THRESHOLD:
+                        sanctions_matches.append(
+                            self._build_sanctions_match(
+                                event=event,
+                                entity_name=name,
+                                entity_type=entity_type,
+                                match_data=match
+                            )
+                        )
 
         # Binary score: any match above threshold = sanctioned
-        sanctions_score = 1.0 if max_match_score >= cls.RECORD_THRESHOLD else 0.0
+        sanctions_score = 1.0 if max_match_score >= self.RECORD_THRESHOLD else 0.0
 
         logger.info(
             f"Event {event.id} sanctions screening complete. "
@@ -138,7 +226,7 @@ class SanctionsScreener:
             f"Sanctions score: {sanctions_score}"
         )
 
-        return sanctions_score
+        return sanctions_score, sanctions_matches
 
     def _check_person(self, name: str) -> List[Dict]:
         """
@@ -192,7 +280,7 @@ class SanctionsScreener:
         }
 
         try:
-            response = requests.get(
+            response = _SESSION.get(
                 url,
                 params=params,
                 headers=headers,
@@ -219,141 +307,191 @@ class SanctionsScreener:
             logger.error(f"OpenSanctions API error for '{name}': {e}")
             return []
 
-    def _check_ofac(self, name: str, entity_type: str) -> List[Dict]:
+    @classmethod
+    def load_sdn_entries(cls) -> List[Dict]:
         """
-        Check name against OFAC SDN list (free API).
-
-        Uses OFAC Sanctions List Search API with fuzzy matching.
+        Return the OFAC SDN entries, downloading the list at most once per TTL.
 
-        Args:
-            name: Name to check
-            entity_type: 'individual' or 'entity'
+        The list is shared by every screener in the worker process, so a
+        refresh over thousands of entity names downloads it once instead of
+        once per name. If a re-download fails, the stale copy is kept.
 
         Returns:
-            List of matches with scores
-        """
-        # OFAC Sanctions Search API endpoint
-        url = 'https://sanctionssearch.ofac.treas.gov/api/PublicationPreview/SdnList'
-
-        try:
-            response = requests.get(url, timeout=self.API_TIMEOUT)
-            response.raise_for_status()
+            SDN entries from the OFAC publication
 
-            data = response.json()
-            matches = []
-
-            # Search through SDN entries
-            sdn_entries = data.get('sdnEntries', [])
-
-            for entry in sdn_entries:
-                entry_type = entry.get('sdnType', '').lower()
-                entry_name = entry.get('name', '')
+        Raises:
+            requests.exceptions.RequestException: If the first download fails
+        """
+        with cls._sdn_lock:
+            age = time.monotonic() - cls._sdn_loaded_at
+            if cls._sdn_entries is not None and age < cls.SDN_CACHE_TTL:
+                return cls._sdn_entries
+
+            try:
+                response = _SESSION.get(cls.OFAC_SDN_URL, timeout=cls.API_TIMEOUT)
+                response.raise_for_status()
+            except requests.exceptions.RequestException as e:
+                if cls._sdn_entries is None:
+                    raise
+                logger.warning(f"OFAC SDN refresh failed, reusing cached list: {e}")
+                return cls._sdn_entries
+
+            cls._sdn_entries = response.json().get('sdnEntries', [])
+            cls._sdn_index = cls._build_sdn_index(cls._sdn_entries)
+            cls._sdn_loaded_at = time.monotonic()
+
+            digest = hashlib.blake2b(response.content, digest_size=16).hexdigest()
+            if cache.get(cls.SDN_DIGEST_CACHE_KEY) != digest:
+                cache.set_many({
+                    cls.SDN_DIGEST_CACHE_KEY: digest,
+                    cls.SDN_CHANGED_AT_CACHE_KEY: timezone.now(),
+                }, None)
+            logger.info(f"Loaded {len(cls._sdn_entries)} OFAC SDN entries")
+            return cls._sdn_entries
+
+    @staticmethod
+    def _build_sdn_index(entries: List[Dict]) -> Dict[str, _SDNIndex]:
+        """Split SDN entries by entity type, with names normalized and indexed once."""
+        split = {'individual': ([], []), 'entity': ([], [])}
+        for entry in entries:
+            name = entry.get('name', '').lower().strip().replace(_NAME_SEPARATOR, '')
+            if not name:
+                continue
+            entity_type = 'individual' if entry.get('sdnType', '').lower() == 'individual' else 'entity'
+            names, typed_entries = split[entity_type]
+            names.append(name)
+            typed_entries.append(entry)
+
+        index = {}
+        for entity_type, (names, typed_entries) in split.items():
+            positions = {}
+            starts = []
+            offset = 0
+            for position, name in enumerate(names):
+                positions.setdefault(name, []).append(position)
+                starts.append(offset)
+                offset += len(name) + len(_NAME_SEPARATOR)
+            index[entity_type] = _SDNIndex(
+                names=names,
+                entries=typed_entries,
+                positions=positions,
+                joined=_NAME_SEPARATOR.join(names),
+                starts=starts,
+                max_name_length=max(map(len, names), default=0),
+            )
+        return index
 
-                # Filter by entity type
-                type_match = (
-                    (entity_type == 'individual' and entry_type == 'individual') or
-                    (entity_type == 'entity' and entry_type != 'individual')
-                )
+    @staticmethod
+    def _containment_matches(query: str, index: _SDNIndex) -> set:
+        """
+        Positions of names that contain the query or are contained in it.
 
-                if not type_match:
-                    continue
+        Names containing the query are found by native substring search over
+        the joined names; names contained in the query by looking up each of
+        the query's substrings. Neither loops over the whole list.
+        """
+        matches = set()
 
-                # Calculate fuzzy match score
-                score = self._calculate_name_similarity(name, entry_name)
-
-                if score >= self.MATCH_THRESHOLD:
-                    match = {
-                        'score': score,
-                        'list': 'OFAC-SDN',
-                        'data': {
-                            'name': entry_name,
-                            'uid': entry.get('uid'),
-                            'type': entry.get('sdnType'),
-                            'programs': entry.get('programs', []),
-                            'remarks': entry.get('remarks', '')
-                        }
-                    }
-                    matches.append(match)
+        find = index.joined.find
+        offset = find(query)
+        while offset != -1:
+            position = bisect_right(index.starts, offset) - 1
+            matches.add(position)
+            # Continue after this name, which is already matched
+            offset = find(query, index.starts[position] + len(index.names[position]))
 
-            logger.debug(f"OFAC: '{name}' ({entity_type}) -> {len(matches)} matches")
-            return matches
+        for start in range(len(query)):
+            for end in range(start + 1, min(len(query), start + index.max_name_length) + 1):
+                matches.update(index.positions.get(query[start:end], ()))
 
-        except requests.exceptions.RequestException as e:
-            logger.error(f"OFAC API error for '{name}': {e}")
-            return []
+        return matches
 
-    def _calculate_name_similarity(self, name1: str, name2: str) -> float:
+    @classmethod
+    def list_version(cls) -> datetime:
         """
-        Calculate fuzzy similarity between two names.
+        Return when the screening data last changed.
 
-        Uses simple normalized Levenshtein distance for name matching.
-        Handles case-insensitive comparison and whitespace normalization.
-
-        Args:
-            name1: First name
-            name2: Second name
+        Events screened after this time need no re-screening unless their
+        entities changed. For OFAC this is when the downloaded SDN list last
+        differed from the previous download. OpenSanctions is queried live
+        per name, so its version is always the current time.
 
         Returns:
-            Similarity score (0.0 to 1.0)
+            Timestamp of the last sanctions data change
         """
-        # Normalize names
-        n1 = name1.lower().strip()
-        n2 = name2.lower().strip()
-
-        # Exact match
-        if n1 == n2:
-            return 1.0
-
-        # Check if one name contains the other (partial match)
-        if n1 in n2 or n2 in n1:
-            return 0.8
+        if settings.OPENSANCTIONS_API_KEY:
+            return timezone.now()
 
-        # Calculate Levenshtein distance
-        distance = self._levenshtein_distance(n1, n2)
-        max_len = max(len(n1), len(n2))
-
-        if max_len == 0:
-            return 0.0
-
-        # Normalize to 0-1 score
-        similarity = 1.0 - (distance / max_len)
+        try:
+            cls.load_sdn_entries()
+        except requests.exceptions.RequestException as e:
+            logger.warning(f"OFAC SDN list unavailable, assuming it changed: {e}")
+            return timezone.now()
 
-        return similarity
+        return cache.get(cls.SDN_CHANGED_AT_CACHE_KEY) or timezone.now()
 
-    def _levenshtein_distance(self, s1: str, s2: str) -> int:
+    def _check_ofac(self, name: str, entity_type: str) -> List[Dict]:
         """
-        Calculate Levenshtein distance between two strings.
+        Check name against OFAC SDN list (free API).
 
-        Classic dynamic programming algorithm for edit distance.
+        Uses OFAC Sanctions List Search API with fuzzy matching.
 
         Args:
-            s1: First string
-            s2: Second string
+            name: Name to check
+            entity_type: 'individual' or 'entity'
 
         Returns:
-            Edit distance (number of operations)
+            List of matches with scores
         """
-        if len(s1) < len(s2):
-            return self._levenshtein_distance(s2, s1)
+        try:
+            self.load_sdn_entries()
+            index = self._sdn_index[entity_type]
+            query = name.lower().strip().replace(_NAME_SEPARATOR, '')
+            if not query:
+                return []
+
+            # Normalized Levenshtein similarity (1 - distance / max_len) for
+            # the whole list in one native call
+            scores = {
+                position: score
+                for _, score, position in process.extract(
+                    query,
+                    index.names,
+                    scorer=Levenshtein.normalized_similarity,
+                    score_cutoff=self.MATCH_THRESHOLD,
+                    limit=None,
+                )
+            }
 
-        if len(s2) == 0:
-            return len(s1)
+            # Partial (containment) and exact matches take fixed scores
+            for position in self._containment_matches(query, index):
+                scores[position] = 0.8
+            for position in index.positions.get(query, ()):
+                scores[position] = 1.0
 
-        previous_row = range(len(s2) + 1)
+            matches = []
+            for position, score in scores.items():
+                entry = index.entries[position]
+                matches.append({
+                    'score': score,
+                    'list': 'OFAC-SDN',
+                    'data': {
+                        'name': entry.get('name', ''),
+                        'uid': entry.get('uid'),
+                        'type': entry.get('sdnType'),
+                        'programs': entry.get('programs', []),
+                        'remarks': entry.get('remarks', '')
+                    }
+                })
 
-        for i, c1 in enumerate(s1):
-            current_row = [i + 1]
-            for j, c2 in enumerate(s2):
-                # Cost of insertions, deletions, or substitutions
-                insertions = previous_row[j + 1] + 1
-                deletions = current_row[j] + 1
-                substitutions = previous_row[j] + (c1 != c2)
-                current_row.append(min(insertions, deletions, substitutions))
-            previous_row = current_row
+            logger.debug(f"OFAC: '{name}' ({entity_type}) -> {len(matches)} matches")
+            return matches
 
-        return previous_row[-1]
+        except requests.exceptions.RequestException as e:
+            logger.error(f"OFAC API error for '{name}': {e}")
+            return []
 
-    def _create_sanctions_match(
+    def _build_sanctions_match(
         self,
         event: Event,
         entity_name: str,
@@ -361,7 +499,7 @@ class SanctionsScreener:
         match_data: Dict
     ) -> SanctionsMatch:
         """
-        Create SanctionsMatch record for a detected match.
+        Build an unsaved SanctionsMatch record for a detected match.
 
         Args:
             event: Event containing the entity
@@ -370,20 +508,18 @@ class SanctionsScreener:
             match_data: Match data with score, list, and full data
 
         Returns:
-            Created SanctionsMatch instance
+            Unsaved SanctionsMatch instance
         """
-        sanctions_match = SanctionsMatch.objects.create(
-            event=event,
+        logger.info(
+            f"SanctionsMatch: {entity_name} ({entity_type}) "
+            f"matched {match_data['list']} with score {match_data['score']:.3f}"
+        )
+
+        return SanctionsMatch(
+            event_id=event.id,
             entity_name=entity_name,
             entity_type=entity_type,
             sanctions_list=match_data['list'],
             match_score=match_data['score'],
             sanctions_data=match_data['data'],
         )
-
-        logger.info(
-            f"Created SanctionsMatch: {entity_name} ({entity_type}) "
-            f"matched {match_data['list']} with score {match_data['score']:.3f}"
-        )
-
-        return sanctions_match
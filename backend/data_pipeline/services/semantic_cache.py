@@ -0,0 +1,328 @@
+"""
+Semantic cache for LLM intelligence analysis.
+
+News-wire copies and re-publications of the same article arrive as separate
+events with near-identical text. Rather than paying a full LLM call for each,
+analysis responses are cached in Redis and looked up in two steps:
+
+1. Exact match on a SHA-256 of the article text, within the scope of the
+   other prompt inputs (context fields and GDELT score, see prompt_scope).
+   Timestamps enter the prompt and the scope as a day bucket (prompt_date),
+   so re-publications later the same day still share a scope
+2. Nearest neighbour over embeddings of recently analyzed texts in the same
+   scope, accepted only for near-identical text (SIMILARITY_THRESHOLD) of at
+   least MIN_NEAR_DUPLICATE_CHARS, and only when an OpenAI key is configured
+   for EMBEDDING_MODEL
+
+The embedding index is a flat in-process matrix of normalized vectors, so a
+search is a single matrix-vector product. It is bounded to INDEX_MAX_ENTRIES
+and shared by all threads of a worker process.
+"""
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from django.core.cache import cache
+from litellm import embedding
+
+from data_pipeline.services.llm_client import LLMClient
+
+logger = logging.getLogger(__name__)
+
+
+class SemanticAnalysisCache:
+    """
+    Exact + near-duplicate cache of LLM analysis responses.
+
+    Usage:
+        scope = SemanticAnalysisCache.prompt_scope(context, gdelt_score)
+        cached, vector = SemanticAnalysisCache.lookup(text, model, scope)
+        if cached is None:
+            response = call_llm(...)
+            SemanticAnalysisCache.store(text, model, scope, response, vector)
+    """
+
+    # Embedding model used for near-duplicate lookup (OpenAI)
+    EMBEDDING_MODEL = "text-embedding-3-small"
+
+    # Minimum cosine similarity for a near-duplicate hit: near-identical
+    # text only, since the hit's entities and summary are reused as-is
+    SIMILARITY_THRESHOLD = 0.99
+
+    # Shorter texts (e.g. GDELT actor/event-code titles) differ too little
+    # for embeddings to tell events apart; they only use the exact cache
+    MIN_NEAR_DUPLICATE_CHARS = 200
+
+    # Characters of content included in the cached text (the prompt limit)
+    CONTENT_CHARS = 5000
+
+    # Context fields included in the analysis prompt (_build_analysis_prompt)
+    PROMPT_CONTEXT_FIELDS = ('source', 'event_type', 'timestamp')
+
+    # Maximum vectors kept in the in-process index (oldest half evicted)
+    INDEX_MAX_ENTRIES = 10_000
+
+    # Cached response TTL (24 hours, matches LLMIntelligence.CACHE_TTL)
+    CACHE_TTL = 86400
+
+    # Embeddings memoized per process, and in Redis for this long (7 days)
+    EMBEDDING_MEMO_SIZE = 10_000
+    EMBEDDING_CACHE_TTL = 7 * 86400
+
+    # Maximum inputs per embedding API request
+    EMBEDDING_BATCH_SIZE = 2048
+
+    _lock = threading.Lock()
+    _vectors: Optional[np.ndarray] = None
+    _keys: List[str] = []
+    _embeddings: 'OrderedDict[str, np.ndarray]' = OrderedDict()
+
+    @classmethod
+    def cache_text(cls, title: str, content: str) -> str:
+        """Build the text that identifies an article for caching."""
+        return f"{title.strip()}\n{content[:cls.CONTENT_CHARS].strip()}"
+
+    @classmethod
+    def prompt_scope(
+        cls,
+        context: Optional[Dict[str, Any]],
+        gdelt_score: Optional[float]
+    ) -> str:
+        """
+        Digest of the prompt inputs other than the article text.
+
+        Cached responses are only reused within the same scope, so events
+        whose prompts differ in context or GDELT score never share one.
+        """
+        fields = [
+            f"{name}={cls.prompt_date(context[name]) if name == 'timestamp' else context[name]}"
+            for name in cls.PROMPT_CONTEXT_FIELDS
+            if context and name in context
+        ]
+        if gdelt_score is not None:
+            fields.append(f"gdelt={gdelt_score:.1f}")  # As rendered in the prompt
+        return hashlib.blake2b('\n'.join(fields).encode('utf-8'), digest_size=8).hexdigest()
+
+    @staticmethod
+    def prompt_date(timestamp: Any) -> str:
+        """Day bucket (YYYY-MM-DD) of an event timestamp, as rendered in the prompt."""
+        return str(timestamp)[:10]
+
+    @staticmethod
+    def _cache_key(text: str, model: str, scope: str) -> str:
+        digest = hashlib.sha256(text.encode('utf-8')).hexdigest()
+        return f"llm_semantic:{model}:{scope}:{digest}"
+
+    @staticmethod
+    def embeddings_enabled() -> bool:
+        """Whether EMBEDDING_MODEL can be called (OpenAI key configured)."""
+        LLMClient.initialize()
+        return bool(os.getenv("OPENAI_API_KEY"))
+
+    @classmethod
+    def embed_text(cls, text: str) -> Optional[np.ndarray]:
+        """
+        Embed text as a unit-length vector.
+
+        Embeddings are memoized in-process (LRU, EMBEDDING_MEMO_SIZE entries)
+        and in Redis, both keyed on a BLAKE2b digest of the text, so
+        re-analysis of the same article does not repeat the embedding call.
+
+        Returns:
+            Normalized embedding, or None if embeddings are not configured
+            or the embedding call failed
+        """
+        if not cls.embeddings_enabled():
+            return None
+
+        digest = cls._text_digest(text)
+
+        with cls._lock:
+            vector = cls._embeddings.get(digest)
+            if vector is not None:
+                cls._embeddings.move_to_end(digest)
+                return vector
+
+        vector = cache.get(cls._embedding_key(digest))
+
+        if vector is None:
+            try:
+                vector = cls._request_embeddings([text])[0]
+            except Exception as e:
+                logger.warning(f"Embedding failed, semantic cache lookup skipped: {e}")
+                return None
+            if vector is None:
+                return None
+            cache.set(cls._embedding_key(digest), vector, cls.EMBEDDING_CACHE_TTL)
+
+        cls._memoize(digest, vector)
+        return vector
+
+    @classmethod
+    def embed_texts(cls, texts: List[str]) -> int:
+        """
+        Embed many texts ahead of lookup(), EMBEDDING_BATCH_SIZE per API call.
+
+        Texts already in the in-process or Redis cache are skipped. The new
+        embeddings are written to Redis, so lookups in other worker
+        processes reuse them instead of calling the API once per event.
+
+        Args:
+            texts: Article texts from cache_text()
+
+        Returns:
+            Number of texts newly embedded
+        """
+        texts = [text for text in texts if len(text) >= cls.MIN_NEAR_DUPLICATE_CHARS]
+        if not texts or not cls.embeddings_enabled():
+            return 0
+
+        digests = list(dict.fromkeys(cls._text_digest(text) for text in texts))
+        text_by_digest = {cls._text_digest(text): text for text in texts}
+
+        with cls._lock:
+            digests = [d for d in digests if d not in cls._embeddings]
+        if not digests:
+            return 0
+
+        cached = cache.get_many([cls._embedding_key(d) for d in digests])
+        missing = [d for d in digests if cls._embedding_key(d) not in cached]
+
+        embedded = 0
+        for start in range(0, len(missing), cls.EMBEDDING_BATCH_SIZE):
+            batch = missing[start:start + cls.EMBEDDING_BATCH_SIZE]
+            vectors = cls._request_embeddings([text_by_digest[d] for d in batch])
+
+            new_entries = {}
+            for digest, vector in zip(batch, vectors):
+                if vector is not None:
+                    new_entries[cls._embedding_key(digest)] = vector
+                    cls._memoize(digest, vector)
+            cache.set_many(new_entries, cls.EMBEDDING_CACHE_TTL)
+            embedded += len(new_entries)
+
+        return embedded
+
+    @staticmethod
+    def _text_digest(text: str) -> str:
+        return hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+
+    @classmethod
+    def _embedding_key(cls, digest: str) -> str:
+        return f"embedding:{cls.EMBEDDING_MODEL}:{digest}"
+
+    @classmethod
+    def _request_embeddings(cls, texts: List[str]) -> List[Optional[np.ndarray]]:
+        """Call the embedding API once; returns unit vectors (None if zero)."""
+        response = embedding(model=cls.EMBEDDING_MODEL, input=texts)
+        vectors = []
+        for item in response.data:
+            vector = np.asarray(item['embedding'], dtype=np.float32)
+            norm = np.linalg.norm(vector)
+            vectors.append(vector / norm if norm else None)
+        return vectors
+
+    @classmethod
+    def _memoize(cls, digest: str, vector: np.ndarray) -> None:
+        vector.setflags(write=False)
+        with cls._lock:
+            cls._embeddings[digest] = vector
+            cls._embeddings.move_to_end(digest)
+            while len(cls._embeddings) > cls.EMBEDDING_MEMO_SIZE:
+                cls._embeddings.popitem(last=False)
+
+    @classmethod
+    def _search(cls, vector: np.ndarray, key_prefix: str) -> Optional[str]:
+        """Return the key of the nearest indexed vector above threshold under key_prefix."""
+        with cls._lock:
+            if cls._vectors is None or not len(cls._keys):
+                return None
+            similarities = cls._vectors @ vector
+            above = np.flatnonzero(similarities >= cls.SIMILARITY_THRESHOLD)
+            for index in above[np.argsort(-similarities[above])]:
+                if cls._keys[index].startswith(key_prefix):
+                    return cls._keys[index]
+            return None
+
+    @classmethod
+    def _index(cls, vector: np.ndarray, key: str) -> None:
+        with cls._lock:
+            if cls._vectors is None:
+                cls._vectors = vector[np.newaxis, :]
+                cls._keys = [key]
+                return
+
+            if len(cls._keys) >= cls.INDEX_MAX_ENTRIES:
+                keep = cls.INDEX_MAX_ENTRIES // 2
+                cls._vectors = cls._vectors[-keep:]
+                cls._keys = cls._keys[-keep:]
+
+            cls._vectors = np.vstack([cls._vectors, vector])
+            cls._keys.append(key)
+
+    @classmethod
+    def lookup(
+        cls,
+        text: str,
+        model: str,
+        scope: str
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[np.ndarray]]:
+        """
+        Look up a cached analysis response for text.
+
+        Args:
+            text: Article text from cache_text()
+            model: Model tier the response was produced with
+            scope: Other prompt inputs, from prompt_scope()
+
+        Returns:
+            (cached response or None, embedding to pass to store() on a miss)
+        """
+        cached = cache.get(cls._cache_key(text, model, scope))
+        if cached is not None:
+            logger.info("Semantic cache exact hit")
+            return cached, None
+
+        if len(text) < cls.MIN_NEAR_DUPLICATE_CHARS:
+            return None, None
+
+        vector = cls.embed_text(text)
+        if vector is None:
+            return None, None
+
+        hit_key = cls._search(vector, f"llm_semantic:{model}:{scope}:")
+        if hit_key is not None:
+            cached = cache.get(hit_key)
+            if cached is not None:
+                logger.info("Semantic cache near-duplicate hit")
+                return cached, vector
+
+        return None, vector
+
+    @classmethod
+    def store(
+        cls,
+        text: str,
+        model: str,
+        scope: str,
+        response: Dict[str, Any],
+        vector: Optional[np.ndarray] = None
+    ) -> None:
+        """
+        Cache an analysis response and index its embedding.
+
+        Args:
+            text: Article text from cache_text()
+            model: Model tier the response was produced with
+            scope: Other prompt inputs, from prompt_scope()
+            response: Response to return for this text and its near-duplicates
+            vector: Embedding returned by lookup(), if any
+        """
+        key = cls._cache_key(text, model, scope)
+        cache.set(key, response, cls.CACHE_TTL)
+        if vector is not None:
+            cls._index(vector, key)
@@ -0,0 +1,44 @@
+"""
+Tests for the shared Cloud Tasks enqueue helper.
+
+The Cloud Tasks client is mocked; tests check the task sent to the queue.
+"""
+import json
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+
+from data_pipeline.services.cloud_tasks import (
+    CLOUD_RUN_URL,
+    TASKS_SERVICE_ACCOUNT,
+    enqueue_internal_task,
+)
+
+
+@patch('google.cloud.tasks_v2.CloudTasksClient')
+class EnqueueInternalTaskTests(SimpleTestCase):
+    """Test enqueue_internal_task."""
+
+    def _sent_task(self, client_class):
+        return client_class.return_value.create_task.call_args.kwargs['request']['task']
+
+    def test_task_posts_payload_with_oidc_token(self, client_class):
+        client_class.return_value.create_task.return_value.name = 'tasks/1'
+
+        name = enqueue_internal_task(
+            'llm-analysis-queue', '/api/internal/analyze-intelligence', {'event_id': 'abc'}
+        )
+
+        self.assertEqual(name, 'tasks/1')
+        request = self._sent_task(client_class)['http_request']
+        self.assertEqual(request['url'], f'{CLOUD_RUN_URL}/api/internal/analyze-intelligence')
+        self.assertEqual(json.loads(request['body']), {'event_id': 'abc'})
+        self.assertEqual(request['oidc_token']['service_account_email'], TASKS_SERVICE_ACCOUNT)
+        self.assertNotIn('dispatch_deadline', self._sent_task(client_class))
+
+    def test_dispatch_deadline_is_set_when_given(self, client_class):
+        enqueue_internal_task(
+            'forecast-queue', '/api/internal/generate-forecast', {'entity_id': 1}, dispatch_deadline=300
+        )
+
+        self.assertEqual(self._sent_task(client_class)['dispatch_deadline'], {'seconds': 300})
@@ -7,12 +7,16 @@ Tests the complete hybrid scoring pipeline:
 - Weighted average hybrid score calculation
 - Severity derivation (SEV1-5)
 - Fallback to LLM-only when GDELT unavailable
+- Short BigQuery alerts analyzed locally without an LLM call
 """
 import pytest
 from unittest.mock import patch, MagicMock
 from django.test import TestCase, override_settings
 
 from data_pipeline.services.llm_intelligence import LLMIntelligence
+from data_pipeline.tasks.intelligence_tasks import EventView
+
+LOCMEM_CACHE = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
 
 
 class HybridIntelligenceTests(TestCase):
@@ -20,6 +24,11 @@ class HybridIntelligenceTests(TestCase):
 
     def setUp(self):
         """Set up test fixtures."""
+        # These tests cover the LLM path; short alerts would be analyzed locally
+        patcher = patch.object(LLMIntelligence, 'LOCAL_ANALYSIS_MAX_CHARS', 0)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
         # Sample GDELT metadata for high-risk event
         self.high_risk_metadata = {
             'goldstein_scale': -8.5,  # Conflict
@@ -389,3 +398,40 @@ class HybridIntelligenceTests(TestCase):
             expected_score,
             places=2
         )
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class LocalAnalysisRoutingTests(TestCase):
+    """Test routing of short BigQuery rows to local analysis."""
+
+    LOCAL_RESULT = {'metadata': {'model_used': 'local'}}
+
+    @patch.object(LLMIntelligence, '_analyze_locally', return_value=LOCAL_RESULT)
+    @patch('data_pipeline.services.llm_intelligence.LLMClient._call_llm_structured')
+    def test_short_reliefweb_row_skips_llm(self, mock_llm, mock_local):
+        """A short ReliefWeb alert (string content) is analyzed locally."""
+        event = EventView(
+            title='Venezuela: Floods - Jan 2026',
+            content='Flash floods in Merida state; 200 families affected.',
+            source='ReliefWeb',
+            event_type='humanitarian',
+        )
+
+        result = LLMIntelligence.analyze_event_model(event)
+
+        self.assertEqual(result, self.LOCAL_RESULT)
+        mock_local.assert_called_once()
+        mock_llm.assert_not_called()
+
+    def test_gdelt_row_content_falls_back_to_title(self):
+        """Generated GDELT content is not treated as article text."""
+        event = EventView(
+            title='Maduro - Opposition (0231)',
+            content='GDELT Event: 0231 - Tone: -2.5',
+            source='GDELT',
+        )
+
+        self.assertEqual(
+            LLMIntelligence.event_text(event),
+            ('Maduro - Opposition (0231)', 'Maduro - Opposition (0231)')
+        )
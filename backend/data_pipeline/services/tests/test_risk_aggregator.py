@@ -0,0 +1,87 @@
+"""
+Unit tests for RiskAggregator batch scoring.
+
+Tests that calculate_composite_risk_batch matches the scalar path on mixed
+inputs, including malformed events that fall back to 50.0.
+"""
+import unittest
+from types import SimpleNamespace
+
+from data_pipeline.services.risk_aggregator import RiskAggregator
+from data_pipeline.services.risk_scorer import RiskScorer
+
+# (llm_risk, sanctions_score, sentiment, urgency, event_type, themes)
+MIXED_INPUTS = [
+    (0.7, 1.0, -0.5, 'high', 'POLITICAL', ['sanctions', 'arrest']),
+    (0.2, 0.0, None, None, 'TRADE', ['oil', 'export', 'port']),
+    (None, 0.0, 0.3, 'low', 'ECONOMIC', []),
+    ('high', 0.0, 0.0, 'medium', 'CRISIS', []),
+    (float('nan'), 1.0, -1.0, 'immediate', 'HUMANITARIAN', []),
+    (0.5, None, 0.0, 'medium', 'OTHER', None),
+    (1, True, 0, 'IMMEDIATE', None, ('energy',)),
+    (0.4, 0.0, 0.1, 3, 'POLITICAL', []),
+    (0.4, 0.0, 0.1, 'low', 'POLITICAL', [None]),
+]
+
+
+def scalar_score(llm_risk, sanctions_score, sentiment, urgency, event_type, themes):
+    """Scalar path with RiskScorer's fallback on malformed input."""
+    try:
+        return RiskAggregator.calculate_composite_risk(
+            llm_risk, sanctions_score, sentiment, urgency, event_type, themes
+        )
+    except ValueError:
+        return RiskAggregator.FALLBACK_SCORE
+
+
+class TestCompositeRiskBatch(unittest.TestCase):
+    """Test suite for calculate_composite_risk_batch."""
+
+    def test_empty_batch(self):
+        scores = RiskAggregator.calculate_composite_risk_batch([], [], [], [], [], [])
+        self.assertEqual(len(scores), 0)
+
+    def test_batch_matches_scalar_on_mixed_inputs(self):
+        batch = RiskAggregator.calculate_composite_risk_batch(*zip(*MIXED_INPUTS))
+
+        self.assertEqual(len(batch), len(MIXED_INPUTS))
+        for score, inputs in zip(batch.tolist(), MIXED_INPUTS):
+            self.assertAlmostEqual(score, scalar_score(*inputs), places=6, msg=inputs)
+
+    def test_malformed_events_score_fallback(self):
+        batch = RiskAggregator.calculate_composite_risk_batch(*zip(*MIXED_INPUTS))
+
+        self.assertEqual(batch.tolist()[2:6], [RiskAggregator.FALLBACK_SCORE] * 4)
+        self.assertEqual(batch.tolist()[7:], [RiskAggregator.FALLBACK_SCORE] * 2)
+
+    def test_scalar_rejects_malformed_llm_risk(self):
+        with self.assertRaises(ValueError):
+            RiskAggregator.calculate_composite_risk(None, 0.0, 0.0, 'low', 'POLITICAL', [])
+
+
+class TestComprehensiveRiskBatch(unittest.TestCase):
+    """Test RiskScorer batch scoring against the per-event path."""
+
+    def _event(self, event_id, llm_risk, sentiment=0.0):
+        return SimpleNamespace(
+            id=event_id,
+            llm_analysis={'risk': {'score': llm_risk}, 'sanctions_score': 0.0, 'themes': ['oil']},
+            sentiment=sentiment,
+            urgency='high',
+            event_type='ECONOMIC',
+            themes=[],
+        )
+
+    def test_batch_matches_per_event_scores(self):
+        events = [
+            self._event(1, 0.8, sentiment=-0.4),
+            self._event(2, None),
+            self._event(3, 'severe'),
+            self._event(4, 0.1, sentiment=0.9),
+        ]
+
+        batch = RiskScorer.calculate_comprehensive_risk_batch(events)
+
+        for score, event in zip(batch, events):
+            self.assertAlmostEqual(score, RiskScorer.calculate_comprehensive_risk(event), places=6)
+        self.assertEqual(batch[1:3], [50.0, 50.0])
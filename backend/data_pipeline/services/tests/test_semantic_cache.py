@@ -0,0 +1,155 @@
+"""
+Tests for the semantic LLM analysis cache.
+
+Tests exact and near-duplicate lookup:
+- Exact hit within the same prompt scope, miss across scopes and models
+- Near-duplicate hit above SIMILARITY_THRESHOLD, miss below it
+- Near-duplicate hit for re-publications later the same day
+- Short texts and missing embedding provider skip the embedding call
+"""
+import numpy as np
+from unittest.mock import patch
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from data_pipeline.services.semantic_cache import SemanticAnalysisCache
+
+LOCMEM_CACHE = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+
+
+def unit(*components):
+    """Unit vector from components (padded to 3 dimensions)."""
+    vector = np.zeros(3, dtype=np.float32)
+    vector[:len(components)] = components
+    return vector / np.linalg.norm(vector)
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class SemanticAnalysisCacheTests(TestCase):
+    """Test SemanticAnalysisCache lookup and store."""
+
+    def setUp(self):
+        cache.clear()
+        SemanticAnalysisCache._vectors = None
+        SemanticAnalysisCache._keys = []
+        SemanticAnalysisCache._embeddings.clear()
+
+        self.text = SemanticAnalysisCache.cache_text('Title', 'x' * 500)
+        self.scope = SemanticAnalysisCache.prompt_scope(
+            {'source': 'GDELT', 'event_type': 'political', 'timestamp': '2026-01-10'}, 42.0
+        )
+        self.response = {'content': {'summary': 'cached'}, 'model': 'haiku'}
+
+        patcher = patch.object(SemanticAnalysisCache, 'embeddings_enabled', return_value=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _store(self, text, vector, scope=None):
+        SemanticAnalysisCache.store(
+            text, 'fast', scope or self.scope, self.response, vector
+        )
+
+    @patch.object(SemanticAnalysisCache, '_request_embeddings')
+    def test_exact_hit_skips_embedding(self, request_embeddings):
+        self._store(self.text, None)
+
+        cached, vector = SemanticAnalysisCache.lookup(self.text, 'fast', self.scope)
+
+        self.assertEqual(cached, self.response)
+        self.assertIsNone(vector)
+        request_embeddings.assert_not_called()
+
+    @patch.object(SemanticAnalysisCache, '_request_embeddings')
+    def test_exact_miss_for_other_scope_or_model(self, request_embeddings):
+        request_embeddings.return_value = [unit(0, 1)]
+        self._store(self.text, unit(1, 0))
+        other_scope = SemanticAnalysisCache.prompt_scope({'source': 'GDELT'}, 10.0)
+
+        cached, _ = SemanticAnalysisCache.lookup(self.text, 'fast', other_scope)
+        self.assertIsNone(cached)
+
+        cached, _ = SemanticAnalysisCache.lookup(self.text, 'premium', self.scope)
+        self.assertIsNone(cached)
+
+    def test_scope_covers_prompt_inputs(self):
+        context = {'source': 'GDELT', 'event_type': 'political', 'timestamp': '2026-01-10'}
+        scope = SemanticAnalysisCache.prompt_scope(context, 42.0)
+
+        self.assertEqual(scope, SemanticAnalysisCache.prompt_scope(dict(context), 42.0))
+        self.assertNotEqual(scope, SemanticAnalysisCache.prompt_scope(context, 43.0))
+        self.assertNotEqual(scope, SemanticAnalysisCache.prompt_scope(context, None))
+        self.assertNotEqual(
+            scope,
+            SemanticAnalysisCache.prompt_scope({**context, 'timestamp': '2026-01-11'}, 42.0)
+        )
+
+    @patch.object(SemanticAnalysisCache, '_request_embeddings')
+    def test_near_duplicate_hit_above_threshold(self, request_embeddings):
+        self._store(self.text, unit(1, 0))
+        request_embeddings.return_value = [unit(1, 0.01)]
+
+        cached, vector = SemanticAnalysisCache.lookup(self.text + ' copy', 'fast', self.scope)
+
+        self.assertEqual(cached, self.response)
+        self.assertIsNotNone(vector)
+
+    @patch.object(SemanticAnalysisCache, '_request_embeddings')
+    def test_near_duplicate_hit_across_timestamps_same_day(self, request_embeddings):
+        context = {'source': 'GDELT', 'event_type': 'political'}
+        original_scope = SemanticAnalysisCache.prompt_scope(
+            {**context, 'timestamp': '2026-01-10 08:15:00+00:00'}, 42.0
+        )
+        republished_scope = SemanticAnalysisCache.prompt_scope(
+            {**context, 'timestamp': '2026-01-10T17:40:00+00:00'}, 42.0
+        )
+        self._store(self.text, unit(1, 0), scope=original_scope)
+        request_embeddings.return_value = [unit(1, 0.01)]
+
+        cached, _ = SemanticAnalysisCache.lookup(
+            self.text + ' (Reuters)', 'fast', republished_scope
+        )
+
+        self.assertEqual(republished_scope, original_scope)
+        self.assertEqual(cached, self.response)
+
+    @patch.object(SemanticAnalysisCache, '_request_embeddings')
+    def test_near_duplicate_miss_below_threshold(self, request_embeddings):
+        self._store(self.text, unit(1, 0))
+        # cos ~ 0.98: similar article, but below SIMILARITY_THRESHOLD
+        request_embeddings.return_value = [unit(1, 0.2)]
+
+        cached, vector = SemanticAnalysisCache.lookup(self.text + ' other', 'fast', self.scope)
+
+        self.assertIsNone(cached)
+        self.assertIsNotNone(vector)
+
+    @patch.object(SemanticAnalysisCache, '_request_embeddings')
+    def test_near_duplicate_miss_across_scopes(self, request_embeddings):
+        other_scope = SemanticAnalysisCache.prompt_scope({'source': 'ReliefWeb'}, None)
+        self._store(self.text, unit(1, 0), scope=other_scope)
+        request_embeddings.return_value = [unit(1, 0)]
+
+        cached, _ = SemanticAnalysisCache.lookup(self.text + ' copy', 'fast', self.scope)
+
+        self.assertIsNone(cached)
+
+    @patch.object(SemanticAnalysisCache, '_request_embeddings')
+    def test_short_text_skips_embedding(self, request_embeddings):
+        short_text = SemanticAnalysisCache.cache_text('Maduro - Opposition (0231)', 'GDELT Event')
+
+        cached, vector = SemanticAnalysisCache.lookup(short_text, 'fast', self.scope)
+
+        self.assertIsNone(cached)
+        self.assertIsNone(vector)
+        request_embeddings.assert_not_called()
+
+    @patch.object(SemanticAnalysisCache, '_request_embeddings')
+    def test_no_embedding_provider_skips_embedding(self, request_embeddings):
+        with patch.object(SemanticAnalysisCache, 'embeddings_enabled', return_value=False):
+            cached, vector = SemanticAnalysisCache.lookup(self.text, 'fast', self.scope)
+            embedded = SemanticAnalysisCache.embed_texts([self.text])
+
+        self.assertIsNone(cached)
+        self.assertIsNone(vector)
+        self.assertEqual(embedded, 0)
+        request_embeddings.assert_not_called()
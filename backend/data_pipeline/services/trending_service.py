@@ -121,21 +121,24 @@ class TrendingService:
         # Calculate cutoff timestamp
         cutoff = timezone.now() - timedelta(days=days)
 
-        # Query all mentions in time window
+        # Query all mentions in time window, streamed (only the scored
+        # fields) so a large window is not held in memory
         mentions = EntityMention.objects.filter(
             mentioned_at__gte=cutoff
-        ).select_related('entity')
+        ).values_list('entity_id', 'mentioned_at', 'relevance')
 
         # Rebuild trending scores
-        for mention in mentions:
+        mentions_processed = 0
+        for entity_id, mentioned_at, relevance in mentions.iterator(chunk_size=2000):
             cls.update_entity_score(
-                entity_id=str(mention.entity.id),
-                timestamp=mention.mentioned_at,
-                weight=mention.relevance or 1.0
+                entity_id=str(entity_id),
+                timestamp=mentioned_at,
+                weight=relevance or 1.0
             )
+            mentions_processed += 1
 
         return {
-            'mentions_processed': mentions.count(),
+            'mentions_processed': mentions_processed,
             'days': days,
             'cutoff': cutoff.isoformat()
         }
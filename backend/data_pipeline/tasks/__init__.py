@@ -20,6 +20,7 @@
 # from data_pipeline.tasks.sanctions_tasks import (  # REMOVED: Celery dependency
 #     refresh_sanctions_screening,
 #     screen_event_sanctions,
+#     screen_events_sanctions,
 # )
 
 # All tasks deprecated - Cloud Functions replaced Celery in Phase 18
@@ -6,7 +6,7 @@ for significant trade flows.
 """
 import logging
 from datetime import datetime, timedelta, date
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Set, Tuple
 from celery import shared_task
 from django.db import transaction
 from django.utils import timezone
@@ -23,11 +23,48 @@ from data_pipeline.config.comtrade_config import (
 )
 from core.models import Event
 from api.bigquery_models import UNComtrade
-from api.services.bigquery_service import bigquery_service
+from api.services.bigquery_service import bigquery_service, DEDUP_MAX_BYTES_BILLED
 
 logger = logging.getLogger(__name__)
 
 
+def _existing_trade_flows(
+    period_date: date,
+    commodity_codes: List[str],
+) -> Set[Tuple[date, str, str, str]]:
+    """
+    Return the (period, reporter_code, commodity_code, trade_flow) keys
+    already stored in BigQuery for a period.
+
+    Selects only the key columns, once per run, instead of a COUNT(*) per
+    trade flow. On failure an empty set is returned, so records are inserted
+    rather than skipped.
+    """
+    query = f"""
+        SELECT DISTINCT period, reporter_code, commodity_code, trade_flow
+        FROM `{settings.GCP_PROJECT_ID}.{settings.BIGQUERY_DATASET}.un_comtrade`
+        WHERE period = @period
+        AND commodity_code IN UNNEST(@commodity_codes)
+    """
+    job_config = bigquery.QueryJobConfig(
+        maximum_bytes_billed=DEDUP_MAX_BYTES_BILLED,
+        query_parameters=[
+            bigquery.ScalarQueryParameter('period', 'DATE', period_date),
+            bigquery.ArrayQueryParameter('commodity_codes', 'STRING', commodity_codes),
+        ]
+    )
+
+    try:
+        results = bigquery_service.client.query(query, job_config=job_config).result()
+        return {
+            (row.period, row.reporter_code, row.commodity_code, row.trade_flow)
+            for row in results
+        }
+    except Exception as e:
+        logger.error(f"Failed to check for duplicates in BigQuery: {e}")
+        return set()
+
+
 @shared_task(base=BaseIngestionTask, bind=True)
 def ingest_comtrade_trade_data(
     self,
@@ -79,6 +116,11 @@ def ingest_comtrade_trade_data(
     # Batch collection for BigQuery
     comtrade_records = []
 
+    existing = _existing_trade_flows(
+        datetime.strptime(period, '%Y%m').date(),
+        list(commodity_codes),
+    )
+
     # Process each commodity
     for commodity_code in commodity_codes:
         commodity_config = get_commodity_config(commodity_code)
@@ -126,34 +168,11 @@ def ingest_comtrade_trade_data(
                         flow_code = row.get('flowCode', 'M')
                         trade_flow_type = 'imports' if flow_code == 'M' else 'exports'
 
-                        # Check for duplicate in BigQuery
-                        try:
-                            query = f"""
-                                SELECT COUNT(*) as count
-                                FROM `{settings.GCP_PROJECT_ID}.{settings.BIGQUERY_DATASET}.un_comtrade`
-                                WHERE period = @period
-                                AND reporter_code = @reporter_code
-                                AND commodity_code = @commodity_code
-                                AND trade_flow = @trade_flow
-                            """
-                            job_config = bigquery.QueryJobConfig(
-                                query_parameters=[
-                                    bigquery.ScalarQueryParameter('period', 'DATE', period_date),
-                                    bigquery.ScalarQueryParameter('reporter_code', 'STRING', reporter),
-                                    bigquery.ScalarQueryParameter('commodity_code', 'STRING', commodity_code),
-                                    bigquery.ScalarQueryParameter('trade_flow', 'STRING', trade_flow_type)
-                                ]
-                            )
-                            results = bigquery_service.client.query(query, job_config=job_config).result()
-                            row_result = list(results)[0]
-                            if row_result.count > 0:
-                                logger.debug(f"Skipping duplicate trade flow: {commodity_code} {period_str} {trade_flow_type}")
-                                trade_flows_skipped += 1
-                                continue
-                        except Exception as e:
-                            logger.error(f"Failed to check for duplicate in BigQuery: {e}")
-                            # Continue with insert - better to have duplicate than skip valid record
-                            pass
+                        key = (period_date, str(reporter), commodity_code, trade_flow_type)
+                        if key in existing:
+                            logger.debug(f"Skipping duplicate trade flow: {commodity_code} {period_str} {trade_flow_type}")
+                            trade_flows_skipped += 1
+                            continue
 
                         # Create UNComtrade record for BigQuery
                         try:
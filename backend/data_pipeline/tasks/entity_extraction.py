@@ -21,7 +21,7 @@ import logging
 from typing import Dict
 from datetime import timedelta
 
-from celery import shared_task
+from celery import shared_task, group
 from django.db import transaction
 from django.utils import timezone
 
@@ -136,11 +136,11 @@ def backfill_entities(days: int = 30, limit: int = 1000) -> Dict:
 
         results = bigquery_service.client.query(query, job_config=job_config).result()
 
-        # Queue tasks for each event
-        events_queued = 0
-        for row in results:
-            extract_entities_from_event.delay(row.id)
-            events_queued += 1
+        # Queue tasks for all events in a single broker publish
+        event_ids = [row.id for row in results]
+        if event_ids:
+            group(extract_entities_from_event.s(event_id) for event_id in event_ids).apply_async()
+        events_queued = len(event_ids)
 
         logger.info(f"Queued {events_queued} events for entity extraction (last {days} days)")
 
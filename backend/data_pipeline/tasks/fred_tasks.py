@@ -7,12 +7,15 @@ and threshold-based alert generation.
 import logging
 from datetime import datetime, timedelta, date
 from datetime import timezone as dt_timezone
+from functools import lru_cache
 from typing import Dict, Any, Optional
 from celery import shared_task, group
 from django.db import transaction
 from django.utils import timezone
 from django.conf import settings
 from google.cloud import bigquery
+from google.api_core.exceptions import ServiceUnavailable, InternalServerError
+from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 import pandas as pd
 
 from data_pipeline.tasks.base import BaseIngestionTask
@@ -29,14 +32,93 @@ from api.services.bigquery_service import bigquery_service
 
 logger = logging.getLogger(__name__)
 
+# Batches larger than this go through the Storage Write API
+STORAGE_WRITE_MIN_ROWS = 10
+
+# Batches this large (multi-year backfills) are written to a pending stream and
+# committed atomically instead of the default stream
+PENDING_STREAM_MIN_ROWS = 1000
+
 
 # Import intelligence task for LLM analysis
+@lru_cache(maxsize=None)
 def get_intelligence_task():
-    """Lazy import to avoid circular dependency."""
+    """Lazy import to avoid circular dependency (resolved once per process)."""
     from data_pipeline.tasks.intelligence_tasks import analyze_event_intelligence
     return analyze_event_intelligence
 
 
+@retry(
+    retry=retry_if_exception_type((ServiceUnavailable, InternalServerError)),
+    wait=wait_exponential(multiplier=1, max=30),
+    stop=stop_after_attempt(5),
+    reraise=True,
+)
+def _insert_fred_indicators(fred_indicators: list) -> None:
+    """
+    Insert FRED indicators to BigQuery, retrying only transient errors.
+
+    Retrying just the insert avoids re-fetching the series and re-running the
+    per-observation queries, which a full Celery task retry would do.
+    Larger batches prefer the Storage Write API, falling back to JSON
+    streaming inserts if it is unavailable. Backfill-sized batches use a
+    pending stream so they land all-or-nothing.
+    """
+    if len(fred_indicators) > STORAGE_WRITE_MIN_ROWS:
+        try:
+            bigquery_service.write_fred_indicators_pb(
+                fred_indicators,
+                pending=len(fred_indicators) >= PENDING_STREAM_MIN_ROWS,
+            )
+            return
+        except (ServiceUnavailable, InternalServerError):
+            raise
+        except Exception as e:
+            logger.warning(f"Storage Write API insert failed, falling back to streaming insert: {e}")
+
+    bigquery_service.insert_fred_indicators(fred_indicators)
+
+
+def _load_stored_observations(series_id: str, start_date: date) -> Dict[date, float]:
+    """
+    Load stored observations for a series in one query.
+
+    Returns values from start_date onward plus the last value before it, so
+    the caller can dedup and compute previous values without per-row queries.
+
+    Args:
+        series_id: FRED series identifier
+        start_date: Earliest observation date being ingested
+
+    Returns:
+        Dict mapping observation date to stored value
+    """
+    table = f"`{settings.GCP_PROJECT_ID}.{settings.BIGQUERY_DATASET}.fred_indicators`"
+    query = f"""
+        SELECT date, value
+        FROM {table}
+        WHERE series_id = @series_id
+        AND date >= COALESCE(
+            (SELECT MAX(date) FROM {table} WHERE series_id = @series_id AND date < @start_date),
+            @start_date
+        )
+    """
+    job_config = bigquery.QueryJobConfig(
+        query_parameters=[
+            bigquery.ScalarQueryParameter('series_id', 'STRING', series_id),
+            bigquery.ScalarQueryParameter('start_date', 'DATE', start_date)
+        ]
+    )
+
+    try:
+        results = bigquery_service.client.query(query, job_config=job_config).result()
+        return {row.date: row.value for row in results}
+    except Exception as e:
+        logger.error(f"Failed to load stored observations from BigQuery: {e}")
+        # Continue with insert - better to have duplicate than skip valid observation
+        return {}
+
+
 @shared_task(base=BaseIngestionTask, bind=True)
 def ingest_single_series(
     self,
@@ -109,21 +191,33 @@ def ingest_single_series(
             }
 
         observations_created = 0
-        observations_skipped = 0
+
+        # Skip NaN values up front
+        valid = df['value'].notna()
+        observations_skipped = int((~valid).sum())
+        df = df[valid]
+
+        # Load stored observations once (dedup + previous-value lookup)
+        existing = _load_stored_observations(series_id, df.index.min().date()) if len(df) else {}
+
+        # Previous value per row: stored history merged with the new observations,
+        # so each observation compares against the one immediately before it
+        history = pd.Series(existing, dtype='float64')
+        history.index = pd.to_datetime(history.index)
+        combined = df['value'].astype('float64').combine_first(history).sort_index()
+        df = df.assign(prev=combined.shift(1).reindex(df.index))
+        df['change_pct'] = ((df['value'] / df['prev'] - 1) * 100).where(df['prev'] != 0)
 
         # Batch collection for BigQuery
         fred_indicators = []
         threshold_alert_events = []
 
         # Process each observation
-        for obs_date, row in df.iterrows():
-            value = row['value']
-
-            # Skip NaN values
-            if value is None or (hasattr(value, '__iter__') and any(pd.isna(v) for v in value if hasattr(pd, 'isna'))) or (not hasattr(value, '__iter__') and str(value) == 'nan'):
-                logger.debug(f"Skipping NaN value for {series_id} on {obs_date}")
-                observations_skipped += 1
-                continue
+        for row in df.itertuples():
+            obs_date = row.Index
+            value = float(row.value)
+            previous_value = float(row.prev) if pd.notna(row.prev) else None
+            change_pct = float(row.change_pct) if pd.notna(row.change_pct) else None
 
             # Convert pandas Timestamp to datetime/date
             if hasattr(obs_date, 'to_pydatetime'):
@@ -141,60 +235,18 @@ def ingest_single_series(
             if hasattr(obs_datetime, 'tzinfo') and timezone.is_naive(obs_datetime):
                 obs_datetime = timezone.make_aware(obs_datetime, dt_timezone.utc)
 
-            # Check for duplicate in BigQuery fred_indicators
-            try:
-                query = f"""
-                    SELECT COUNT(*) as count
-                    FROM `{settings.GCP_PROJECT_ID}.{settings.BIGQUERY_DATASET}.fred_indicators`
-                    WHERE series_id = @series_id
-                    AND date = @date
-                """
-                job_config = bigquery.QueryJobConfig(
-                    query_parameters=[
-                        bigquery.ScalarQueryParameter('series_id', 'STRING', series_id),
-                        bigquery.ScalarQueryParameter('date', 'DATE', obs_date_only)
-                    ]
-                )
-                results = bigquery_service.client.query(query, job_config=job_config).result()
-                row_result = list(results)[0]
-                if row_result.count > 0:
-                    logger.debug(f"Skipping duplicate observation for {series_id} on {obs_date_only}")
-                    observations_skipped += 1
-                    continue
-            except Exception as e:
-                logger.error(f"Failed to check for duplicate in BigQuery: {e}")
-                # Continue with insert - better to have duplicate than skip valid observation
-                pass
-
-            # Get previous observation for change calculation
-            try:
-                prev_query = f"""
-                    SELECT value
-                    FROM `{settings.GCP_PROJECT_ID}.{settings.BIGQUERY_DATASET}.fred_indicators`
-                    WHERE series_id = @series_id
-                    AND date < @date
-                    ORDER BY date DESC
-                    LIMIT 1
-                """
-                prev_job_config = bigquery.QueryJobConfig(
-                    query_parameters=[
-                        bigquery.ScalarQueryParameter('series_id', 'STRING', series_id),
-                        bigquery.ScalarQueryParameter('date', 'DATE', obs_date_only)
-                    ]
-                )
-                prev_results = bigquery_service.client.query(prev_query, prev_job_config).result()
-                prev_rows = list(prev_results)
-                previous_value = prev_rows[0].value if prev_rows else None
-            except Exception as e:
-                logger.warning(f"Failed to get previous value from BigQuery: {e}")
-                previous_value = None
+            # Skip observations already stored in BigQuery fred_indicators
+            if obs_date_only in existing:
+                logger.debug(f"Skipping duplicate observation for {series_id} on {obs_date_only}")
+                observations_skipped += 1
+                continue
 
             # Create FREDIndicator for BigQuery
             try:
                 fred_indicator = FREDIndicator(
                     series_id=series_id,
                     date=obs_date_only,
-                    value=float(value),
+                    value=value,
                     series_name=series_config.get('name'),
                     units=series_config.get('units')
                 )
@@ -205,7 +257,7 @@ def ingest_single_series(
                 # Detect threshold breaches for event generation
                 threshold_alerts = detect_threshold_events(
                     series_id=series_id,
-                    current_value=float(value),
+                    current_value=value,
                     previous_value=previous_value,
                     config=series_config,
                     observation_date=obs_datetime if isinstance(obs_datetime, datetime) else datetime.combine(obs_datetime, datetime.min.time()).replace(tzinfo=dt_timezone.utc),
@@ -227,9 +279,9 @@ def ingest_single_series(
                         metadata={
                             'series_id': series_id,
                             'threshold_type': alert.content.get('threshold_type') if isinstance(alert.content, dict) else None,
-                            'current_value': float(value),
+                            'current_value': value,
                             'previous_value': previous_value,
-                            'change_pct': ((float(value) - previous_value) / previous_value * 100) if previous_value else None
+                            'change_pct': change_pct
                         }
                     )
                     threshold_alert_events.append(bq_alert)
@@ -245,11 +297,19 @@ def ingest_single_series(
         # Batch insert to BigQuery
         if fred_indicators:
             try:
-                bigquery_service.insert_fred_indicators(fred_indicators)
+                _insert_fred_indicators(fred_indicators)
                 logger.info(f"Inserted {len(fred_indicators)} FRED indicators to BigQuery")
             except Exception as e:
+                # Permanent error (or transient retries exhausted) - fail this
+                # series without re-fetching from FRED
                 logger.error(f"Failed to insert FRED indicators to BigQuery: {e}", exc_info=True)
-                raise
+                return {
+                    'series_id': series_id,
+                    'observations_created': 0,
+                    'observations_skipped': observations_skipped,
+                    'status': 'failed',
+                    'error': f'BigQuery insert failed: {str(e)}',
+                }
 
         # Insert threshold alert events
         if threshold_alert_events:
@@ -259,9 +319,11 @@ def ingest_single_series(
 
                 # Dispatch LLM intelligence analysis for threshold alerts
                 analyze_task = get_intelligence_task()
-                for alert_event in threshold_alert_events:
-                    analyze_task.delay(alert_event.id, model='standard')
-                    logger.debug(f"Dispatched LLM analysis for FRED alert {alert_event.id}")
+                group(
+                    analyze_task.s(alert_event.id, model='standard')
+                    for alert_event in threshold_alert_events
+                ).apply_async()
+                logger.debug(f"Dispatched LLM analysis for {len(threshold_alert_events)} FRED alerts")
 
             except Exception as e:
                 logger.error(f"Failed to insert threshold alert events to BigQuery: {e}", exc_info=True)
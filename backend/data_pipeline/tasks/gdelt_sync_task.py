@@ -5,18 +5,26 @@ Syncs Venezuela-related events from gdelt-bq.gdeltv2 to our events table.
 Runs every 15 minutes to match GDELT update frequency.
 """
 import logging
+import time
 import uuid
-from typing import Dict, Any
-from celery import shared_task
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import itemgetter
+from typing import Dict, Any, List, Set
+from celery import shared_task, group
+from django.conf import settings
 from django.utils import timezone
-from datetime import timedelta
-import pytz
+from datetime import datetime, timedelta
+import pandas as pd
+import redis
+from google.cloud import bigquery
 
 from data_pipeline.tasks.base import BaseIngestionTask
 from api.services.gdelt_bigquery_service import gdelt_bigquery_service
 from api.services.gdelt_gkg_service import gdelt_gkg_service
 from api.bigquery_models import Event as BigQueryEvent
-from api.services.bigquery_service import bigquery_service
+from api.services.bigquery_service import bigquery_service, dedup_cutoff, DEDUP_MAX_BYTES_BILLED
 from api.services.gdelt_gkg_parsers import (
     parse_v2_themes,
     parse_v2_persons,
@@ -27,11 +35,312 @@ from api.services.gdelt_gkg_parsers import (
 
 logger = logging.getLogger(__name__)
 
+# QuadClass (1-4) -> event_type, indexed by QuadClass
+QUAD_CLASS_EVENT_TYPES = (
+    'other',
+    'political',  # 1: Verbal Cooperation
+    'political',  # 2: Material Cooperation
+    'political',  # 3: Verbal Conflict
+    'political',  # 4: Material Conflict
+)
 
+# (metadata key, GDELT column) pairs copied verbatim into event metadata.
+# All columns are selected by get_venezuela_events, so itemgetter is safe.
+GDELT_METADATA_FIELDS = (
+    ('goldstein_scale', 'GoldsteinScale'),
+    ('avg_tone', 'AvgTone'),
+    ('num_mentions', 'NumMentions'),
+    ('num_sources', 'NumSources'),
+    ('num_articles', 'NumArticles'),
+    ('quad_class', 'QuadClass'),
+    ('actor1_code', 'Actor1Code'),
+    ('actor1_name', 'Actor1Name'),
+    ('actor2_code', 'Actor2Code'),
+    ('actor2_name', 'Actor2Name'),
+    ('event_code', 'EventCode'),
+    ('action_geo_lat', 'ActionGeo_Lat'),
+    ('action_geo_long', 'ActionGeo_Long'),
+
+    # Religion & Ethnicity
+    ('actor1_religion1_code', 'Actor1Religion1Code'),
+    ('actor1_religion2_code', 'Actor1Religion2Code'),
+    ('actor2_religion1_code', 'Actor2Religion1Code'),
+    ('actor2_religion2_code', 'Actor2Religion2Code'),
+    ('actor1_ethnic_code', 'Actor1EthnicCode'),
+    ('actor2_ethnic_code', 'Actor2EthnicCode'),
+
+    # Enhanced Actor Classification
+    ('actor1_known_group_code', 'Actor1KnownGroupCode'),
+    ('actor1_type2_code', 'Actor1Type2Code'),
+    ('actor2_known_group_code', 'Actor2KnownGroupCode'),
+    ('actor2_type3_code', 'Actor2Type3Code'),
+
+    # Geographic Precision
+    ('actor1_geo_adm1', 'Actor1Geo_ADM1Code'),
+    ('actor1_geo_adm2', 'Actor1Geo_ADM2Code'),
+    ('actor1_geo_feature_id', 'Actor1Geo_FeatureID'),
+    ('actor2_geo_adm1', 'Actor2Geo_ADM1Code'),
+    ('actor2_geo_adm2', 'Actor2Geo_ADM2Code'),
+    ('actor2_geo_feature_id', 'Actor2Geo_FeatureID'),
+    ('action_geo_adm1', 'ActionGeo_ADM1Code'),
+    ('action_geo_adm2', 'ActionGeo_ADM2Code'),
+    ('action_geo_feature_id', 'ActionGeo_FeatureID'),
+)
+_METADATA_KEYS = tuple(key for key, _ in GDELT_METADATA_FIELDS)
+_get_metadata_values = itemgetter(*(column for _, column in GDELT_METADATA_FIELDS))
+
+# Dedup queries against our events table (project/dataset fixed at import)
+EVENTS_TABLE = f"`{bigquery_service.project_id}.{bigquery_service.dataset_id}.events`"
+# The mentioned_at cutoff (dedup_cutoff) prunes the scan to the candidates' partitions
+EXISTING_IDS_SQL = f"""
+    SELECT id
+    FROM {EVENTS_TABLE}
+    WHERE mentioned_at >= @cutoff
+    AND id IN UNNEST(@ids)
+"""
+# IDs per existence query, keeping the request payload bounded for large syncs
+EXISTING_IDS_BATCH_SIZE = 500
+
+# Events analyzed per LLM batch task
+ANALYSIS_BATCH_SIZE = 50
+
+# In-process Bloom filter of recently inserted GDELT IDs (seeded lazily).
+# It only learns this worker's own inserts, so it is re-seeded from BigQuery
+# every RECENT_ID_FILTER_TTL seconds to pick up other workers' inserts.
+RECENT_ID_LOOKBACK_DAYS = 7
+RECENT_ID_FILTER_TTL = 3600
+# The mentioned_at predicate prunes partitions. GDELT events are inserted soon
+# after DATEADDED (mentioned_at, truncated to the day), hence the extra day.
+RECENT_IDS_SQL = f"""
+    SELECT id
+    FROM {EVENTS_TABLE}
+    WHERE mentioned_at >= TIMESTAMP_SUB(CURRENT_TIMESTAMP(), INTERVAL {RECENT_ID_LOOKBACK_DAYS + 1} DAY)
+    AND created_at > TIMESTAMP_SUB(TIMESTAMP_TRUNC(CURRENT_TIMESTAMP(), HOUR), INTERVAL {RECENT_ID_LOOKBACK_DAYS} DAY)
+    AND source_name = 'GDELT'
+"""
+_recent_event_ids = None
+_recent_event_ids_seeded_at = 0.0
+
+# RedisBloom filter of recently inserted GDELT IDs shared by all workers. The
+# filter is built complete under a temporary key and renamed into place, so
+# readers never see a partially seeded filter. It expires
+# RECENT_ID_LOOKBACK_DAYS after seeding and is re-seeded from BigQuery, so it
+# only ever covers roughly the lookback window.
+REDIS_BLOOM_KEY = 'gdelt:recent_event_ids'
+REDIS_BLOOM_CAPACITY = 5_000_000
+REDIS_BLOOM_ERROR_RATE = 0.001
+REDIS_BLOOM_SEED_BATCH_SIZE = 10_000
+
+# Held by the worker seeding the filter (seconds); others use the in-process
+# filter meanwhile. Also the TTL of the temporary key if a seed is abandoned.
+REDIS_BLOOM_SEED_LOCK_KEY = 'gdelt:recent_event_ids:seeding'
+REDIS_BLOOM_SEED_TIMEOUT = 600
+
+# Exact cache of GLOBALEVENTIDs inserted by this worker, oldest first.
+# Consecutive syncs overlap heavily, so these are skipped without touching
+# BigQuery at all.
+RECENT_INSERTED_CACHE_SIZE = 50_000
+_recently_inserted = OrderedDict()
+
+
+def _remember_inserted(event_ids: List[str]) -> None:
+    """Record inserted event IDs, evicting the oldest past RECENT_INSERTED_CACHE_SIZE."""
+    for event_id in event_ids:
+        _recently_inserted[event_id] = None
+        _recently_inserted.move_to_end(event_id)
+    while len(_recently_inserted) > RECENT_INSERTED_CACHE_SIZE:
+        _recently_inserted.popitem(last=False)
+
+
+@lru_cache(maxsize=None)
 def get_intelligence_task():
-    """Lazy import to avoid circular dependency."""
-    from data_pipeline.tasks.intelligence_tasks import analyze_event_intelligence
-    return analyze_event_intelligence
+    """Lazy import to avoid circular dependency (resolved once per process)."""
+    from data_pipeline.tasks.intelligence_tasks import analyze_events_batch
+    return analyze_events_batch
+
+
+def _get_existing_event_ids(event_ids: List[str], cutoff: datetime) -> Set[str]:
+    """
+    Return the subset of event IDs already present in our events table.
+
+    Args:
+        event_ids: Candidate event IDs (GDELT GLOBALEVENTIDs as strings)
+        cutoff: Earliest mentioned_at to scan, from dedup_cutoff()
+
+    Returns:
+        Set of IDs that already exist
+    """
+    existing_ids = set()
+    for start in range(0, len(event_ids), EXISTING_IDS_BATCH_SIZE):
+        job_config = bigquery.QueryJobConfig(
+            use_query_cache=True,
+            maximum_bytes_billed=DEDUP_MAX_BYTES_BILLED,
+            query_parameters=[
+                bigquery.ScalarQueryParameter('cutoff', 'TIMESTAMP', cutoff),
+                bigquery.ArrayQueryParameter(
+                    'ids', 'STRING', event_ids[start:start + EXISTING_IDS_BATCH_SIZE]
+                ),
+            ]
+        )
+        results = bigquery_service.client.query(EXISTING_IDS_SQL, job_config=job_config).result()
+        existing_ids.update(row.id for row in results)
+    return existing_ids
+
+
+def _query_recent_event_ids():
+    """Run RECENT_IDS_SQL, byte-capped like the other dedup queries."""
+    job_config = bigquery.QueryJobConfig(maximum_bytes_billed=DEDUP_MAX_BYTES_BILLED)
+    return bigquery_service.client.query(RECENT_IDS_SQL, job_config=job_config).result()
+
+
+def _get_recent_event_ids():
+    """
+    Get the Bloom filter of recently inserted GDELT event IDs.
+
+    Seeded per worker from the last RECENT_ID_LOOKBACK_DAYS days of GDELT
+    events, and re-seeded once older than RECENT_ID_FILTER_TTL. Between
+    seeds it misses IDs inserted by other workers. Returns None if
+    pybloom_live is not installed or seeding fails, in which case callers
+    fall back to querying BigQuery.
+    """
+    global _recent_event_ids, _recent_event_ids_seeded_at
+    age = time.monotonic() - _recent_event_ids_seeded_at
+    if _recent_event_ids is not None and age < RECENT_ID_FILTER_TTL:
+        return _recent_event_ids
+    _recent_event_ids = None
+
+    try:
+        from pybloom_live import ScalableBloomFilter
+    except ImportError:
+        logger.warning("pybloom_live not installed, GDELT dedup will query BigQuery")
+        return None
+
+    try:
+        bloom = ScalableBloomFilter(initial_capacity=100_000, error_rate=1e-6)
+        for row in _query_recent_event_ids():
+            bloom.add(row.id)
+    except Exception as e:
+        logger.error(f"Failed to seed GDELT event ID filter: {e}")
+        return None
+
+    logger.info(f"Seeded GDELT event ID filter with {len(bloom)} recent IDs")
+    _recent_event_ids = bloom
+    _recent_event_ids_seeded_at = time.monotonic()
+    return _recent_event_ids
+
+
+@lru_cache(maxsize=None)
+def _get_redis_client() -> redis.Redis:
+    """Redis client for the shared Bloom filter (created once per process)."""
+    return redis.Redis.from_url(settings.REDIS_URL)
+
+
+def _redis_bloom_add(event_ids: List[str], key: str = REDIS_BLOOM_KEY) -> None:
+    """
+    Add event IDs to an existing RedisBloom filter.
+
+    NOCREATE: the shared filter is only ever created by _seed_redis_bloom,
+    so an insert never brings back a filter that lacks the seeded IDs.
+    """
+    if not event_ids:
+        return
+    _get_redis_client().execute_command('BF.INSERT', key, 'NOCREATE', 'ITEMS', *event_ids)
+
+
+def _seed_redis_bloom() -> bool:
+    """
+    Build the shared RedisBloom filter from BigQuery and publish it.
+
+    The filter is seeded under a temporary key and RENAMEd to REDIS_BLOOM_KEY
+    only once complete. One worker seeds at a time (REDIS_BLOOM_SEED_LOCK_KEY).
+
+    Returns:
+        True if the filter was seeded, False if another worker is seeding it
+    """
+    client = _get_redis_client()
+    if not client.set(REDIS_BLOOM_SEED_LOCK_KEY, 1, nx=True, ex=REDIS_BLOOM_SEED_TIMEOUT):
+        return False
+
+    temp_key = f"{REDIS_BLOOM_KEY}:seed:{uuid.uuid4().hex}"
+    try:
+        client.execute_command(
+            'BF.RESERVE', temp_key, REDIS_BLOOM_ERROR_RATE, REDIS_BLOOM_CAPACITY
+        )
+        client.expire(temp_key, REDIS_BLOOM_SEED_TIMEOUT)
+
+        batch = []
+        for row in _query_recent_event_ids():
+            batch.append(row.id)
+            if len(batch) >= REDIS_BLOOM_SEED_BATCH_SIZE:
+                _redis_bloom_add(batch, key=temp_key)
+                batch = []
+        _redis_bloom_add(batch, key=temp_key)
+
+        # RENAME carries the TTL over to REDIS_BLOOM_KEY
+        client.expire(temp_key, timedelta(days=RECENT_ID_LOOKBACK_DAYS))
+        client.rename(temp_key, REDIS_BLOOM_KEY)
+    except Exception:
+        client.delete(temp_key)
+        raise
+    finally:
+        client.delete(REDIS_BLOOM_SEED_LOCK_KEY)
+
+    logger.info("Seeded shared GDELT event ID filter in Redis")
+    return True
+
+
+def _redis_bloom_candidates(event_ids: List[str]):
+    """
+    Filter event IDs down to those the shared RedisBloom filter may contain.
+
+    The filter is seeded from BigQuery the first time it is missing. Returns
+    None if Redis or the RedisBloom module is unavailable, or another worker
+    is still seeding the filter, in which case callers fall back to the
+    in-process filter.
+
+    Args:
+        event_ids: Candidate event IDs
+
+    Returns:
+        IDs that may already exist (filter hits), or None
+    """
+    try:
+        client = _get_redis_client()
+        if not client.exists(REDIS_BLOOM_KEY) and not _seed_redis_bloom():
+            logger.info("Shared GDELT event ID filter is being seeded, using in-process filter")
+            return None
+
+        if not event_ids:
+            return []
+        hits = client.execute_command('BF.MEXISTS', REDIS_BLOOM_KEY, *event_ids)
+    except Exception as e:
+        logger.warning(f"Redis Bloom filter unavailable, using in-process filter: {e}")
+        return None
+
+    return [event_id for event_id, hit in zip(event_ids, hits) if hit]
+
+
+def _parse_gkg_record(gkg_raw: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Parse a raw GKG record into the structured dict stored in event metadata.
+
+    Args:
+        gkg_raw: GKG row dict from gdelt_gkg_service
+
+    Returns:
+        Structured GKG dict (themes, persons, organizations, locations, tone)
+    """
+    return {
+        'record_id': gkg_raw.get('GKGRECORDID'),
+        'source': gkg_raw.get('SourceCommonName'),
+        'themes': parse_v2_themes(gkg_raw.get('V2Themes')),
+        'persons': parse_v2_persons(gkg_raw.get('V2Persons')),
+        'organizations': parse_v2_organizations(gkg_raw.get('V2Organizations')),
+        'locations': parse_v2_locations(gkg_raw.get('V2Locations')),
+        'tone': parse_v2_tone(gkg_raw.get('V2Tone')),
+        'quotations': gkg_raw.get('Quotations', ''),  # Keep raw for now
+        'gcam': gkg_raw.get('GCAM', '')  # Keep raw for now, complex format
+    }
 
 
 @shared_task(base=BaseIngestionTask, bind=True)
@@ -67,125 +376,142 @@ def sync_gdelt_events(self, lookback_minutes: int = 15) -> Dict[str, Any]:
 
         logger.info(f"Fetched {len(gdelt_events)} events from GDELT BigQuery")
 
-        # Enrich events with GKG data (themes, entities, sentiment)
+        events_created = 0
+        bigquery_events = []
+
+        # Drop repeated GLOBALEVENTIDs within the response before any BigQuery
+        # lookups; suppressed rows are counted as skipped below
+        seen_ids = set()
+        unique_events = []
+        for gdelt_event in gdelt_events:
+            global_event_id = str(gdelt_event['GLOBALEVENTID'])
+            if global_event_id not in seen_ids:
+                seen_ids.add(global_event_id)
+                unique_events.append(gdelt_event)
+
+        # Parse GDELT date format (YYYYMMDDHHMMSS) for all events in one pass
+        parsed_dates = pd.to_datetime(
+            [str(e['DATEADDED'])[:8] for e in unique_events],
+            format='%Y%m%d',
+            utc=True,
+            errors='coerce',
+        )
+
+        # Check for duplicates using GLOBALEVENTID. IDs this worker inserted
+        # recently are known duplicates. Of the rest, only Bloom filter hits
+        # are confirmed against BigQuery to rule out false positives. IDs
+        # missing from the shared RedisBloom filter are new. The in-process
+        # fallback filter also misses IDs other workers inserted since it was
+        # last seeded; the MERGE below skips those, and the direct-insert
+        # fallbacks re-check the batch against BigQuery first.
+        cached_ids = {gid for gid in seen_ids if gid in _recently_inserted}
+        candidate_ids = [gid for gid in seen_ids if gid not in cached_ids]
+        recent_ids = None
+        bloom_hits = _redis_bloom_candidates(candidate_ids)
+        if bloom_hits is not None:
+            candidate_ids = bloom_hits
+        else:
+            recent_ids = _get_recent_event_ids()
+            if recent_ids is not None:
+                candidate_ids = [gid for gid in candidate_ids if gid in recent_ids]
+
+        # Fetch GKG records for all source URLs in one query. The GKG scan cost
+        # is set by the partition range, not the URL count, so it runs
+        # concurrently with the dedup query instead of waiting for it.
+        source_urls = list({
+            e['SOURCEURL'] for e in unique_events
+            if e.get('SOURCEURL') and str(e['GLOBALEVENTID']) not in cached_ids
+        })
+        # Events with an unparseable DATEADDED are skipped below, so only
+        # valid dates bound the dedup scan
+        if not parsed_dates.notna().any():
+            candidate_ids = []
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            existing_future = None
+            if candidate_ids:
+                existing_future = executor.submit(
+                    _get_existing_event_ids,
+                    candidate_ids,
+                    dedup_cutoff(parsed_dates.dropna().to_pydatetime()),
+                )
+            gkg_future = None
+            if source_urls and parsed_dates.notna().any():
+                # Partition range covering every event's DATEADDED
+                gkg_future = executor.submit(
+                    gdelt_gkg_service.get_gkg_bulk,
+                    document_ids=source_urls,
+                    min_date=parsed_dates.min().to_pydatetime(),
+                    max_date=parsed_dates.max().to_pydatetime()
+                )
+
+        try:
+            existing_ids = cached_ids
+            if existing_future is not None:
+                existing_ids = existing_future.result() | cached_ids
+        except Exception as e:
+            logger.error(f"Failed to check for duplicates: {e}")
+            # Continue with insert
+            existing_ids = cached_ids
+        gkg_map = gkg_future.result() if gkg_future else {}
+
+        new_events = [
+            (gdelt_event, event_date)
+            for gdelt_event, event_date in zip(unique_events, parsed_dates.to_pydatetime())
+            if str(gdelt_event['GLOBALEVENTID']) not in existing_ids
+        ]
+        events_skipped = len(gdelt_events) - len(new_events)
+        if events_skipped:
+            logger.debug(f"Skipping {events_skipped} duplicate GDELT events")
+
+        # Enrich with GKG data (themes, entities, sentiment) and map in one pass
         events_with_gkg = 0
         events_without_gkg = 0
         total_themes = 0
         total_persons = 0
         total_orgs = 0
 
-        for gdelt_event in gdelt_events:
+        # Shared creation timestamp for this sync batch
+        created_at = timezone.now()
+
+        for gdelt_event, event_date in new_events:
             source_url = gdelt_event.get('SOURCEURL')
-            if source_url:
+            gkg_parsed = None
+            gkg_raw = gkg_map.get(source_url) if source_url else None
+            if gkg_raw:
                 try:
-                    # Parse event date for partition filtering
-                    date_str = str(gdelt_event['DATEADDED'])
-                    event_date = timezone.datetime.strptime(date_str[:8], '%Y%m%d').replace(tzinfo=pytz.UTC)
-
-                    # Fetch GKG record by DocumentIdentifier (= SOURCEURL)
-                    gkg_raw = gdelt_gkg_service.get_gkg_by_document_id(
-                        document_id=source_url,
-                        partition_date=event_date
-                    )
-
-                    if gkg_raw:
-                        # Parse GKG fields into structured data
-                        themes_list = parse_v2_themes(gkg_raw.get('V2Themes'))
-                        persons_list = parse_v2_persons(gkg_raw.get('V2Persons'))
-                        orgs_list = parse_v2_organizations(gkg_raw.get('V2Organizations'))
-                        locations_list = parse_v2_locations(gkg_raw.get('V2Locations'))
-                        tone_dict = parse_v2_tone(gkg_raw.get('V2Tone'))
-
-                        # Build structured GKG dict
-                        gdelt_event['gkg_parsed'] = {
-                            'record_id': gkg_raw.get('GKGRECORDID'),
-                            'source': gkg_raw.get('SourceCommonName'),
-                            'themes': themes_list,
-                            'persons': persons_list,
-                            'organizations': orgs_list,
-                            'locations': locations_list,
-                            'tone': tone_dict,
-                            'quotations': gkg_raw.get('Quotations', ''),  # Keep raw for now
-                            'gcam': gkg_raw.get('GCAM', '')  # Keep raw for now, complex format
-                        }
-
-                        events_with_gkg += 1
-                        total_themes += len(themes_list)
-                        total_persons += len(persons_list)
-                        total_orgs += len(orgs_list)
-
-                        logger.debug(
-                            f"Parsed GKG for {source_url[:50]}: "
-                            f"{len(themes_list)} themes, {len(persons_list)} persons, {len(orgs_list)} orgs"
-                        )
-                    else:
-                        events_without_gkg += 1
+                    gkg_parsed = _parse_gkg_record(gkg_raw)
 
+                    events_with_gkg += 1
+                    total_themes += len(gkg_parsed['themes'])
+                    total_persons += len(gkg_parsed['persons'])
+                    total_orgs += len(gkg_parsed['organizations'])
                 except Exception as e:
                     logger.warning(f"Failed to parse GKG for {source_url[:50]}: {e}")
                     events_without_gkg += 1
             else:
                 events_without_gkg += 1
 
-        logger.info(
-            f"GKG enrichment: {events_with_gkg} events with GKG data, {events_without_gkg} without | "
-            f"Parsed {total_themes} themes, {total_persons} persons, {total_orgs} organizations"
-        )
-
-        events_created = 0
-        events_skipped = 0
-        bigquery_events = []
-
-        for gdelt_event in gdelt_events:
-            # Check for duplicates using GLOBALEVENTID
-            try:
-                existing_query = f"""
-                    SELECT COUNT(*) as count
-                    FROM `{bigquery_service.project_id}.{bigquery_service.dataset_id}.events`
-                    WHERE id = @event_id
-                """
-                from google.cloud import bigquery
-                job_config = bigquery.QueryJobConfig(
-                    query_parameters=[
-                        bigquery.ScalarQueryParameter('event_id', 'STRING', str(gdelt_event['GLOBALEVENTID']))
-                    ]
-                )
-                results = bigquery_service.client.query(existing_query, job_config=job_config).result()
-                row = list(results)[0]
-                if row.count > 0:
-                    logger.debug(f"Skipping duplicate GDELT event: {gdelt_event['GLOBALEVENTID']}")
-                    events_skipped += 1
-                    continue
-            except Exception as e:
-                logger.error(f"Failed to check for duplicate: {e}")
-                # Continue with insert
-                pass
-
             # Map GDELT event to our BigQuery schema
             try:
-                # Parse GDELT date format (YYYYMMDDHHMMSS)
-                date_str = str(gdelt_event['DATEADDED'])
-                event_date = timezone.datetime.strptime(date_str[:8], '%Y%m%d').replace(tzinfo=pytz.UTC)
+                if pd.isna(event_date):
+                    raise ValueError(f"Invalid DATEADDED: {gdelt_event['DATEADDED']}")
 
                 # Generate title from actors and event code
                 title = f"{gdelt_event.get('Actor1Name', 'Unknown')} - {gdelt_event.get('Actor2Name', 'Event')} ({gdelt_event.get('EventCode', '')})"
 
                 # Map QuadClass to event_type
                 quad_class = gdelt_event.get('QuadClass')
-                event_type_map = {
-                    1: 'political',  # Verbal Cooperation
-                    2: 'political',  # Material Cooperation
-                    3: 'political',  # Verbal Conflict
-                    4: 'political'   # Material Conflict
-                }
-                event_type = event_type_map.get(quad_class, 'other')
+                event_type = (
+                    QUAD_CLASS_EVENT_TYPES[quad_class]
+                    if quad_class in (1, 2, 3, 4) else 'other'
+                )
 
                 # Create BigQueryEvent
                 bq_event = BigQueryEvent(
                     id=str(gdelt_event['GLOBALEVENTID']),  # Use GDELT ID
                     source_url=gdelt_event.get('SOURCEURL', ''),
                     mentioned_at=event_date,
-                    created_at=timezone.now(),
+                    created_at=created_at,
                     title=title[:500],  # Truncate if needed
                     content=f"GDELT Event: {gdelt_event.get('EventCode', '')} - Tone: {gdelt_event.get('AvgTone', 0)}",
                     source_name='GDELT',
@@ -194,47 +520,10 @@ def sync_gdelt_events(self, lookback_minutes: int = 15) -> Dict[str, Any]:
                     risk_score=None,  # Computed by LLM
                     severity=None,    # Computed by LLM
                     metadata={
-                        'goldstein_scale': gdelt_event.get('GoldsteinScale'),
-                        'avg_tone': gdelt_event.get('AvgTone'),
-                        'num_mentions': gdelt_event.get('NumMentions'),
-                        'num_sources': gdelt_event.get('NumSources'),
-                        'num_articles': gdelt_event.get('NumArticles'),
-                        'quad_class': quad_class,
-                        'actor1_code': gdelt_event.get('Actor1Code'),
-                        'actor1_name': gdelt_event.get('Actor1Name'),
-                        'actor2_code': gdelt_event.get('Actor2Code'),
-                        'actor2_name': gdelt_event.get('Actor2Name'),
-                        'event_code': gdelt_event.get('EventCode'),
-                        'action_geo_lat': gdelt_event.get('ActionGeo_Lat'),
-                        'action_geo_long': gdelt_event.get('ActionGeo_Long'),
-
-                        # Religion & Ethnicity
-                        'actor1_religion1_code': gdelt_event.get('Actor1Religion1Code'),
-                        'actor1_religion2_code': gdelt_event.get('Actor1Religion2Code'),
-                        'actor2_religion1_code': gdelt_event.get('Actor2Religion1Code'),
-                        'actor2_religion2_code': gdelt_event.get('Actor2Religion2Code'),
-                        'actor1_ethnic_code': gdelt_event.get('Actor1EthnicCode'),
-                        'actor2_ethnic_code': gdelt_event.get('Actor2EthnicCode'),
-
-                        # Enhanced Actor Classification
-                        'actor1_known_group_code': gdelt_event.get('Actor1KnownGroupCode'),
-                        'actor1_type2_code': gdelt_event.get('Actor1Type2Code'),
-                        'actor2_known_group_code': gdelt_event.get('Actor2KnownGroupCode'),
-                        'actor2_type3_code': gdelt_event.get('Actor2Type3Code'),
-
-                        # Geographic Precision
-                        'actor1_geo_adm1': gdelt_event.get('Actor1Geo_ADM1Code'),
-                        'actor1_geo_adm2': gdelt_event.get('Actor1Geo_ADM2Code'),
-                        'actor1_geo_feature_id': gdelt_event.get('Actor1Geo_FeatureID'),
-                        'actor2_geo_adm1': gdelt_event.get('Actor2Geo_ADM1Code'),
-                        'actor2_geo_adm2': gdelt_event.get('Actor2Geo_ADM2Code'),
-                        'actor2_geo_feature_id': gdelt_event.get('Actor2Geo_FeatureID'),
-                        'action_geo_adm1': gdelt_event.get('ActionGeo_ADM1Code'),
-                        'action_geo_adm2': gdelt_event.get('ActionGeo_ADM2Code'),
-                        'action_geo_feature_id': gdelt_event.get('ActionGeo_FeatureID'),
+                        **dict(zip(_METADATA_KEYS, _get_metadata_values(gdelt_event))),
 
                         # GKG enrichment data (parsed into structured fields)
-                        'gkg': gdelt_event.get('gkg_parsed') if 'gkg_parsed' in gdelt_event else None,
+                        'gkg': gkg_parsed,
                     }
                 )
 
@@ -245,17 +534,59 @@ def sync_gdelt_events(self, lookback_minutes: int = 15) -> Dict[str, Any]:
                 logger.error(f"Failed to map GDELT event: {e}", exc_info=True)
                 events_skipped += 1
 
-        # Batch insert to BigQuery
+        logger.info(
+            f"GKG enrichment: {events_with_gkg} events with GKG data, {events_without_gkg} without | "
+            f"Parsed {total_themes} themes, {total_persons} persons, {total_orgs} organizations"
+        )
+
+        # Batch insert to BigQuery. MERGE makes the insert idempotent against
+        # concurrent syncs that pass the duplicate check above.
         if bigquery_events:
             try:
-                bigquery_service.insert_events(bigquery_events)
-                logger.info(f"Inserted {len(bigquery_events)} events to BigQuery")
+                try:
+                    inserted_ids = bigquery_service.upsert_events(bigquery_events)
+                    events_skipped += events_created - len(inserted_ids)
+                    events_created = len(inserted_ids)
+                except Exception as e:
+                    logger.warning(f"MERGE upsert failed, falling back to direct insert: {e}")
+                    if recent_ids is not None:
+                        # Events other workers inserted since the in-process
+                        # filter was seeded may have passed the duplicate check
+                        existing_ids = _get_existing_event_ids(
+                            [event.id for event in bigquery_events],
+                            dedup_cutoff(event.mentioned_at for event in bigquery_events),
+                        )
+                        bigquery_events = [
+                            event for event in bigquery_events if event.id not in existing_ids
+                        ]
+                        events_skipped += events_created - len(bigquery_events)
+                        events_created = len(bigquery_events)
+                    try:
+                        bigquery_service.write_events_pb(bigquery_events)
+                    except Exception as e:
+                        logger.warning(f"Storage Write API insert failed, falling back to streaming insert: {e}")
+                        bigquery_service.insert_events(bigquery_events)
+                    inserted_ids = [event.id for event in bigquery_events]
+                logger.info(f"Inserted {events_created} events to BigQuery")
+
+                # Rows the MERGE skipped were stored by another sync, which
+                # records and analyzes them itself
+                _remember_inserted(inserted_ids)
+                if recent_ids is not None:
+                    for event_id in inserted_ids:
+                        recent_ids.add(event_id)
+                try:
+                    _redis_bloom_add(inserted_ids)
+                except Exception as e:
+                    logger.warning(f"Failed to add GDELT event IDs to Redis Bloom filter: {e}")
 
-                # Dispatch LLM analysis for each event
+                # Dispatch LLM analysis in batches of ANALYSIS_BATCH_SIZE events
                 analyze_task = get_intelligence_task()
-                for event in bigquery_events:
-                    analyze_task.delay(event.id, model='fast')
-                    logger.debug(f"Dispatched LLM analysis for GDELT event {event.id}")
+                group(
+                    analyze_task.s(inserted_ids[i:i + ANALYSIS_BATCH_SIZE], model='fast')
+                    for i in range(0, len(inserted_ids), ANALYSIS_BATCH_SIZE)
+                ).apply_async()
+                logger.debug(f"Dispatched LLM analysis for {len(inserted_ids)} GDELT events")
 
             except Exception as e:
                 logger.error(f"Failed to insert events to BigQuery: {e}", exc_info=True)
@@ -6,13 +6,14 @@ Updates daily to capture UN OCHA reports, NGO updates, and disaster information.
 """
 import logging
 import requests
+import urllib3
+from requests.adapters import HTTPAdapter
 from datetime import datetime, timedelta
-from typing import Dict, Any
+from typing import Dict, Any, Iterator
 from celery import shared_task
+from django.core.cache import cache
 from django.db import transaction
 from django.utils import timezone
-from django.conf import settings
-from google.cloud import bigquery
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
 from data_pipeline.tasks.base import BaseIngestionTask
@@ -21,8 +22,144 @@ from core.models import Event
 from api.bigquery_models import Event as BigQueryEvent
 from api.services.bigquery_service import bigquery_service
 
+try:
+    from orjson import loads as json_loads
+except ImportError:  # orjson is optional; stdlib json is slower on large payloads
+    from json import loads as json_loads
+
+try:
+    import ijson
+except ImportError:  # ijson is optional; without it the response is parsed whole
+    ijson = None
+
 logger = logging.getLogger(__name__)
 
+# Keep-alive session reused across task runs in a worker (retries are handled
+# by tenacity on the task, so the adapter does not retry)
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
+# Reports whose URL was stored within this window are treated as duplicates
+DUPLICATE_LOOKBACK_DAYS = 30
+
+# Reports per API request (ReliefWeb maximum); further pages use offset
+REPORTS_PAGE_SIZE = 1000
+
+# Safety cap on pagination: stop after this many reports in one run (reports
+# are sorted oldest first, so the next run resumes from the cursor)
+MAX_REPORTS_OFFSET = 10_000
+
+# Cache key of the newest date.created ingested so far. Scheduled runs fetch
+# from this cursor, so the API returns only new reports and the MERGE only
+# has to resolve the boundary report. Expires with the duplicate lookback window.
+LAST_CREATED_CACHE_KEY = 'reliefweb:last_created'
+
+# Lookback of scheduled runs; only these resume from the cursor, so an
+# explicit backfill (e.g. lookback_days=30) fetches its whole window
+DEFAULT_LOOKBACK_DAYS = 1
+
+# ReliefWeb API v1 endpoint
+API_URL = "https://api.reliefweb.int/v1/reports"
+
+# Query parameters, minus the per-run date filter (filter[value][from])
+# appname: Required identification header
+# query: Search for Venezuela (country.iso3:VEN)
+# filter: Date filter for recent reports
+# sort: Oldest first, so offset pages are stable and the cursor can only
+#   advance past reports that were fetched
+# fields: Specify which fields to include (not body-html: nothing reads
+#   it, and it roughly doubles the payload)
+# limit: Results per request (max 1000)
+_PARAMS_BASE = {
+    'appname': 'venezuelawatch',
+    'query[value]': 'country.iso3:VEN',
+    'filter[field]': 'date.created',
+    'sort[]': 'date.created:asc',
+    'fields[include][]': (
+        'id',
+        'title',
+        'body',
+        'date.created',
+        'country.name',
+        'source.name',
+        'url',
+        'file.url',
+    ),
+    'limit': REPORTS_PAGE_SIZE,
+}
+
+
+def _iter_reports(response: requests.Response, meta: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """
+    Yield report records from a ReliefWeb response as they are parsed.
+
+    With ijson the body is stream-parsed from the socket, one report at a
+    time; otherwise it is parsed whole. Top-level counts ('count',
+    'totalCount') are written into meta as they are encountered.
+
+    Raises:
+        requests.RequestException: If the streamed body is cut off or times
+            out (urllib3 and ijson errors are wrapped so the task's retry
+            policy applies to them)
+    """
+    if ijson is None:
+        data = json_loads(response.content)
+        meta.update(count=data.get('count', 0), totalCount=data.get('totalCount', 0))
+        yield from data.get('data', [])
+        return
+
+    # Release the pooled connection even if the caller stops early
+    with response:
+        response.raw.decode_content = True
+        builder = None
+        try:
+            for prefix, event, value in ijson.parse(response.raw, use_float=True):
+                if builder is not None:
+                    builder.event(event, value)
+                    if prefix == 'data.item' and event == 'end_map':
+                        yield builder.value
+                        builder = None
+                elif prefix == 'data.item' and event == 'start_map':
+                    builder = ijson.ObjectBuilder()
+                    builder.event(event, value)
+                elif prefix in ('count', 'totalCount'):
+                    meta[prefix] = value
+        except (urllib3.exceptions.HTTPError, ijson.IncompleteJSONError) as e:
+            raise requests.exceptions.ChunkedEncodingError(
+                f"ReliefWeb response stream interrupted: {e}", response=response
+            ) from e
+
+
+def _iter_all_reports(api_url: str, params: Dict[str, Any], meta: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """
+    Yield every matching report, following offset pages until totalCount
+    (or MAX_REPORTS_OFFSET, after which the rest is left for the next run).
+
+    Pages are requested one after another over the keep-alive session; each
+    page is streamed through _iter_reports.
+    """
+    offset = 0
+    while True:
+        response = _SESSION.get(
+            api_url, params={**params, 'offset': offset}, timeout=30, stream=True
+        )
+        response.raise_for_status()
+
+        page_reports = 0
+        for report in _iter_reports(response, meta):
+            page_reports += 1
+            yield report
+
+        offset += page_reports
+        if page_reports < params['limit'] or offset >= meta.get('totalCount', 0):
+            break
+        if offset >= MAX_REPORTS_OFFSET:
+            logger.warning(
+                f"Stopping ReliefWeb pagination at {offset} of {meta.get('totalCount')} reports; "
+                f"the rest is fetched from the cursor next run"
+            )
+            break
+
 
 @shared_task(base=BaseIngestionTask, bind=True)
 @retry(
@@ -31,7 +168,7 @@ logger = logging.getLogger(__name__)
     retry=retry_if_exception_type((requests.RequestException, requests.Timeout)),
     reraise=True,
 )
-def ingest_reliefweb_updates(self, lookback_days: int = 1) -> Dict[str, Any]:
+def ingest_reliefweb_updates(self, lookback_days: int = DEFAULT_LOOKBACK_DAYS) -> Dict[str, Any]:
     """
     Ingest Venezuela humanitarian reports from ReliefWeb API.
 
@@ -41,7 +178,8 @@ def ingest_reliefweb_updates(self, lookback_days: int = 1) -> Dict[str, Any]:
     API Documentation: https://apidoc.reliefweb.int/
 
     Args:
-        lookback_days: How many days to look back (default: 1)
+        lookback_days: How many days to look back (default: 1). Any other
+            value is a backfill and ignores the last-created cursor.
 
     Returns:
         {
@@ -52,89 +190,60 @@ def ingest_reliefweb_updates(self, lookback_days: int = 1) -> Dict[str, Any]:
     """
     logger.info(f"Starting ReliefWeb ingestion (lookback: {lookback_days} days)")
 
-    # Calculate date filter
+    # Calculate date filter; scheduled runs start after the last ingested
+    # report if newer (ISO 8601 strings compare chronologically)
     cutoff_date = timezone.now() - timedelta(days=lookback_days)
     date_filter = cutoff_date.strftime('%Y-%m-%d')
+    last_created = cache.get(LAST_CREATED_CACHE_KEY)
+    if lookback_days == DEFAULT_LOOKBACK_DAYS and last_created and last_created > date_filter:
+        logger.info(f"Resuming ReliefWeb ingestion from last seen report ({last_created})")
+        date_filter = last_created
 
-    # ReliefWeb API v1 endpoint
-    api_url = "https://api.reliefweb.int/v1/reports"
-
-    # Query parameters
-    # appname: Required identification header
-    # query: Search for Venezuela (country.iso3:VEN)
-    # filter: Date filter for recent reports
-    # fields: Specify which fields to include
-    # limit: Results per request (max 1000)
-    params = {
-        'appname': 'venezuelawatch',
-        'query[value]': 'country.iso3:VEN',
-        'filter[field]': 'date.created',
-        'filter[value][from]': date_filter,
-        'fields[include][]': [
-            'id',
-            'title',
-            'body',
-            'body-html',
-            'date.created',
-            'country.name',
-            'source.name',
-            'url',
-            'file.url',
-        ],
-        'limit': 100,  # Start with 100, increase if needed
-    }
+    params = {**_PARAMS_BASE, 'filter[value][from]': date_filter}
 
     try:
-        # Fetch from ReliefWeb
-        response = requests.get(api_url, params=params, timeout=30)
-        response.raise_for_status()
-        data = response.json()
-
-        # ReliefWeb response structure: {'data': [...], 'count': N, 'totalCount': N}
-        reports = data.get('data', [])
-        total_count = data.get('totalCount', 0)
-
-        logger.info(f"Fetched {len(reports)} reports from ReliefWeb (total available: {total_count})")
+        # ReliefWeb response structure: {'data': [...], 'count': N, 'totalCount': N}.
+        # Reports are mapped as they stream in rather than after the whole
+        # payload is buffered.
+        meta = {}
+        reports_fetched = 0
 
         events_created = 0
         events_skipped = 0
 
+        # URLs already seen in this response; stored duplicates are skipped by
+        # the MERGE below, so there is no read before the write
+        seen_urls = set()
+
+        # Cursor candidate: date.created of the last report before the first
+        # one that failed to map, so failed reports are fetched again
+        newest_created = last_created
+        cursor_blocked = False
+
         # Process each report
         bigquery_events = []
-        for report_wrapper in reports:
+        for report_wrapper in _iter_all_reports(API_URL, params, meta):
+            reports_fetched += 1
+
             # ReliefWeb wraps each record: {'id': ..., 'fields': {...}}
             report_id = report_wrapper.get('id')
             fields = report_wrapper.get('fields', {})
             url = fields.get('url')
 
+            # Reports arrive oldest first, so this is the last fetched report
+            # (never one past the pagination cap)
+            created = fields.get('date', {}).get('created')
+
             if not url:
                 logger.warning(f"Skipping ReliefWeb report {report_id} without URL")
                 events_skipped += 1
                 continue
 
-            # Check for duplicates in BigQuery (last 30 days for humanitarian reports)
-            try:
-                query = f"""
-                    SELECT COUNT(*) as count
-                    FROM `{settings.GCP_PROJECT_ID}.{settings.BIGQUERY_DATASET}.events`
-                    WHERE source_url = @url
-                    AND mentioned_at >= TIMESTAMP_SUB(CURRENT_TIMESTAMP(), INTERVAL 30 DAY)
-                """
-                job_config = bigquery.QueryJobConfig(
-                    query_parameters=[
-                        bigquery.ScalarQueryParameter('url', 'STRING', url)
-                    ]
-                )
-                results = bigquery_service.client.query(query, job_config=job_config).result()
-                row = list(results)[0]
-                if row.count > 0:
-                    logger.debug(f"Skipping duplicate ReliefWeb report: {url}")
-                    events_skipped += 1
-                    continue
-            except Exception as e:
-                logger.error(f"Failed to check for duplicate in BigQuery: {e}")
-                # Continue with insert - better to have duplicate than skip valid event
-                pass
+            if url in seen_urls:
+                logger.debug(f"Skipping duplicate ReliefWeb report: {url}")
+                events_skipped += 1
+                continue
+            seen_urls.add(url)
 
             # Map ReliefWeb report to BigQueryEvent
             try:
@@ -163,20 +272,54 @@ def ingest_reliefweb_updates(self, lookback_days: int = 1) -> Dict[str, Any]:
             except Exception as e:
                 logger.error(f"Failed to create BigQuery event from ReliefWeb report: {e}", exc_info=True)
                 events_skipped += 1
+                cursor_blocked = True
+                continue
 
-        # Batch insert to BigQuery
+            if not cursor_blocked and created and (newest_created is None or created > newest_created):
+                newest_created = created
+
+        logger.info(
+            f"Fetched {reports_fetched} reports from ReliefWeb "
+            f"(total available: {meta.get('totalCount', 0)})"
+        )
+
+        # Batch insert to BigQuery. The staged MERGE skips reports whose URL is
+        # already stored (last DUPLICATE_LOOKBACK_DAYS days), so duplicate
+        # detection and insert are a single job.
         if bigquery_events:
             try:
-                bigquery_service.insert_events(bigquery_events)
-                logger.info(f"Inserted {len(bigquery_events)} ReliefWeb events to BigQuery")
+                try:
+                    inserted_ids = bigquery_service.upsert_events(
+                        bigquery_events,
+                        match_on='source_url',
+                        lookback_days=DUPLICATE_LOOKBACK_DAYS,
+                        source_name='ReliefWeb',
+                    )
+                    events_skipped += events_created - len(inserted_ids)
+                    events_created = len(inserted_ids)
+                except Exception as e:
+                    logger.warning(f"MERGE upsert failed, falling back to direct insert: {e}")
+                    # Better to have a duplicate than drop valid reports
+                    try:
+                        bigquery_service.write_events_pb(bigquery_events)
+                    except Exception as e:
+                        logger.warning(f"Storage Write API insert failed, falling back to streaming insert: {e}")
+                        bigquery_service.insert_events(bigquery_events)
+                logger.info(f"Inserted {events_created} ReliefWeb events to BigQuery")
             except Exception as e:
                 logger.error(f"Failed to insert events to BigQuery: {e}", exc_info=True)
                 raise
 
+        # Advance the cursor only once this run's reports are stored
+        if newest_created and newest_created != last_created:
+            cache.set(
+                LAST_CREATED_CACHE_KEY, newest_created, DUPLICATE_LOOKBACK_DAYS * 86400
+            )
+
         result = {
             'events_created': events_created,
             'events_skipped': events_skipped,
-            'reports_fetched': len(reports),
+            'reports_fetched': reports_fetched,
         }
 
         logger.info(
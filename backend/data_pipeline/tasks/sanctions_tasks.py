@@ -7,18 +7,51 @@ Ensures sanctions data stays current as new sanctions are added.
 Migration: Phase 14.3 - Now reads events from BigQuery instead of PostgreSQL.
 """
 import logging
-from typing import Dict, Any
+from dataclasses import dataclass
+from typing import Dict, Any, List
 from celery import shared_task
+from django.db import transaction
 from django.utils import timezone
 from datetime import timedelta
 
 from core.models import SanctionsMatch
 from data_pipeline.tasks.base import BaseIngestionTask
 from data_pipeline.services.sanctions_screener import SanctionsScreener
-from api.services.bigquery_service import bigquery_service
+from api.services.bigquery_service import (
+    bigquery_service,
+    decode_llm_analysis,
+    HAS_LLM_ANALYSIS_SQL,
+)
 
 logger = logging.getLogger(__name__)
 
+# Events fetched from BigQuery and screened per page
+SCREENING_PAGE_SIZE = 1000
+
+# Refresh query (project/dataset fixed at import). Events screened since the
+# sanctions data last changed, and not re-analyzed since, are skipped.
+_DATASET = f"{bigquery_service.project_id}.{bigquery_service.dataset_id}"
+_NEEDS_SCREENING_SQL = (
+    "(sanctions_screened_at IS NULL"
+    " OR sanctions_screened_at < @sanctions_version"
+    " OR sanctions_screened_at < analyzed_at)"
+)
+SCREENABLE_EVENTS_SQL = f"""
+    SELECT id, metadata, llm_analysis_z
+    FROM `{_DATASET}.events`
+    WHERE mentioned_at >= @cutoff_date
+    AND {HAS_LLM_ANALYSIS_SQL}
+    AND {_NEEDS_SCREENING_SQL}
+    ORDER BY mentioned_at DESC
+"""
+
+
+@dataclass(slots=True, frozen=True)
+class ScreeningEvent:
+    """BigQuery event as SanctionsScreener expects an Event (id, llm_analysis)."""
+    id: str
+    llm_analysis: Dict[str, Any]
+
 
 @shared_task(base=BaseIngestionTask, bind=True, name='refresh_sanctions_screening')
 def refresh_sanctions_screening(self, lookback_days: int = 7) -> Dict[str, Any]:
@@ -27,7 +60,10 @@ def refresh_sanctions_screening(self, lookback_days: int = 7) -> Dict[str, Any]:
 
     Reads events from BigQuery, screens for sanctions, and stores matches in PostgreSQL.
     Runs daily to catch new sanctions additions and updates.
-    Only screens events with LLM entity extraction (metadata.llm_analysis populated).
+    Only screens events with LLM entity extraction (llm_analysis_z, or metadata.llm_analysis on older rows).
+    Events already screened since the sanctions data last changed
+    (SanctionsScreener.list_version) and since their last analysis
+    (analyzed_at) are skipped.
 
     Args:
         lookback_days: Number of days to look back (default: 7)
@@ -45,85 +81,80 @@ def refresh_sanctions_screening(self, lookback_days: int = 7) -> Dict[str, Any]:
     try:
         from google.cloud import bigquery as bq
 
-        cutoff_date = timezone.now() - timedelta(days=lookback_days)
+        # Truncated to the hour so a re-run within the hour issues an
+        # identical query and can be served from BigQuery's result cache
+        cutoff_date = (timezone.now() - timedelta(days=lookback_days)).replace(
+            minute=0, second=0, microsecond=0
+        )
 
-        # Get recent events from BigQuery with LLM analysis
-        query = f"""
-            SELECT id, metadata
-            FROM `{bigquery_service.project_id}.{bigquery_service.dataset_id}.events`
-            WHERE mentioned_at >= @cutoff_date
-            AND metadata IS NOT NULL
-            AND JSON_VALUE(metadata, '$.llm_analysis') IS NOT NULL
-            ORDER BY mentioned_at DESC
-        """
+        sanctions_version = SanctionsScreener.list_version()
+
+        # Recorded as sanctions_screened_at: events re-analyzed after this
+        # point are screened again next run
+        screening_started_at = timezone.now()
 
         job_config = bq.QueryJobConfig(
+            use_query_cache=True,
             query_parameters=[
-                bq.ScalarQueryParameter('cutoff_date', 'TIMESTAMP', cutoff_date)
+                bq.ScalarQueryParameter('cutoff_date', 'TIMESTAMP', cutoff_date),
+                bq.ScalarQueryParameter('sanctions_version', 'TIMESTAMP', sanctions_version),
             ]
         )
 
-        results = bigquery_service.client.query(query, job_config=job_config).result()
-        event_rows = list(results)
-        total_events = len(event_rows)
+        # Get recent events from BigQuery with LLM analysis
+        results = bigquery_service.client.query(
+            SCREENABLE_EVENTS_SQL, job_config=job_config
+        ).result(page_size=SCREENING_PAGE_SIZE)
+        total_events = results.total_rows
 
         logger.info(
             f"Starting sanctions screening refresh: "
-            f"{total_events} events from last {lookback_days} days"
+            f"{total_events} events from last {lookback_days} days "
+            f"not screened since {sanctions_version.isoformat()}"
         )
 
         screened_count = 0
         matches_found = 0
         total_matches = 0
+        replaced_matches = 0
 
-        for row in event_rows:
-            event_id = row.id
-            metadata = row.metadata if hasattr(row, 'metadata') else {}
-
-            # Create mock event object for SanctionsScreener compatibility
+        # Stream result pages rather than loading the whole window into memory
+        for page in results.pages:
+            # Create mock event objects for SanctionsScreener compatibility
             # SanctionsScreener expects event.llm_analysis field
-            from types import SimpleNamespace
-            mock_event = SimpleNamespace(
-                id=event_id,
-                llm_analysis=metadata.get('llm_analysis', {})
-            )
-
-            # Delete old sanctions matches for this event (refresh)
-            # Note: SanctionsMatch stores event_id as string (BigQuery event ID)
-            from django.db.models import Q
-            old_matches_count = SanctionsMatch.objects.filter(
-                Q(event_id=event_id) | Q(event__id=event_id)
-            ).count()
-            SanctionsMatch.objects.filter(
-                Q(event_id=event_id) | Q(event__id=event_id)
-            ).delete()
+            mock_events = [
+                ScreeningEvent(id=row.id, llm_analysis=decode_llm_analysis(dict(row)))
+                for row in page
+            ]
+            event_ids = [event.id for event in mock_events]
 
-            # Re-screen event
-            sanctions_score = SanctionsScreener.screen_event_entities(mock_event)
+            # Re-screen the page first (API calls), then swap the old matches
+            # for the new ones in one transaction
+            scores, new_matches = SanctionsScreener.screen_events_bulk(mock_events)
 
-            # Count new matches
-            new_matches_count = SanctionsMatch.objects.filter(
-                Q(event_id=event_id) | Q(event__id=event_id)
-            ).count()
-            total_matches += new_matches_count
+            # Note: SanctionsMatch stores event_id as string (BigQuery event ID)
+            with transaction.atomic():
+                deleted, _ = SanctionsMatch.objects.filter(event_id__in=event_ids).delete()
+                SanctionsMatch.objects.bulk_create(new_matches, batch_size=1000)
 
-            if sanctions_score > 0.0:
-                matches_found += 1
+            bigquery_service.mark_sanctions_screened(event_ids, screening_started_at, cutoff_date)
 
-            screened_count += 1
+            replaced_matches += deleted
+            screened_count += len(mock_events)
+            matches_found += sum(1 for score in scores.values() if score > 0.0)
+            total_matches += len(new_matches)
 
-            # Log progress every 100 events
-            if screened_count % 100 == 0:
-                logger.info(
-                    f"Sanctions screening progress: {screened_count}/{total_events} "
-                    f"({matches_found} matches)"
-                )
+            logger.info(
+                f"Sanctions screening progress: {screened_count}/{total_events} "
+                f"({matches_found} matches)"
+            )
 
         logger.info(
             f"Sanctions screening refresh complete: "
             f"{screened_count} events screened, "
             f"{matches_found} events with matches, "
-            f"{total_matches} total SanctionsMatch records"
+            f"{total_matches} total SanctionsMatch records "
+            f"(replacing {replaced_matches})"
         )
 
         return {
@@ -180,9 +211,8 @@ def screen_event_sanctions(self, event_id: str) -> Dict[str, Any]:
                 'error': 'event_not_found'
             }
 
-        # Check if event has LLM analysis
-        metadata = event.get('metadata', {})
-        llm_analysis = metadata.get('llm_analysis', {}) if metadata else {}
+        # Check if event has LLM analysis (decoded by get_event_by_id)
+        llm_analysis = event['llm_analysis']
 
         if not llm_analysis or 'entities' not in llm_analysis:
             logger.warning(
@@ -198,21 +228,18 @@ def screen_event_sanctions(self, event_id: str) -> Dict[str, Any]:
             }
 
         # Create mock event object for SanctionsScreener compatibility
-        from types import SimpleNamespace
-        mock_event = SimpleNamespace(
+        mock_event = ScreeningEvent(
             id=event_id,
             llm_analysis=llm_analysis
         )
 
         # Screen event
         logger.info(f"Screening Event {event_id} for sanctions matches")
-        sanctions_score = SanctionsScreener.screen_event_entities(mock_event)
-
-        # Count matches
-        from django.db.models import Q
-        matches_count = SanctionsMatch.objects.filter(
-            Q(event_id=event_id) | Q(event__id=event_id)
-        ).count()
+        scores, new_matches = SanctionsScreener.screen_events_bulk([mock_event])
+        if new_matches:
+            SanctionsMatch.objects.bulk_create(new_matches)
+        sanctions_score = scores[event_id]
+        matches_count = len(new_matches)
 
         logger.info(
             f"Event {event_id} sanctions screening complete: "
@@ -235,3 +262,75 @@ def screen_event_sanctions(self, event_id: str) -> Dict[str, Any]:
             'status': 'error',
             'error': str(e)
         }
+
+
+@shared_task(base=BaseIngestionTask, bind=True, name='screen_events_sanctions')
+def screen_events_sanctions(self, event_ids: List[str], lookback_days: int = 7) -> Dict[str, Any]:
+    """
+    Screen a batch of events for sanctions matches.
+
+    Batch form of screen_event_sanctions for ingestion bursts: the events are
+    read from BigQuery in one query, screened with one shared screener, and
+    their matches replaced with one delete and one bulk insert.
+
+    Args:
+        event_ids: IDs of Events to screen (UUID strings from BigQuery)
+        lookback_days: Only events mentioned within this many days are read
+            and marked screened (default: 7, as for the daily refresh)
+
+    Returns:
+        Dictionary with screening statistics:
+        {
+            'screened': int (events with entity data),
+            'skipped': int (events missing or without entity data),
+            'matches_found': int (events with sanctions matches),
+            'total_matches': int (total SanctionsMatch records created),
+            'status': 'success' | 'error'
+        }
+    """
+    try:
+        screening_started_at = timezone.now()
+        cutoff_date = screening_started_at - timedelta(days=lookback_days)
+        events = bigquery_service.get_events_by_ids(event_ids, cutoff_date)
+
+        # Create mock event objects for SanctionsScreener compatibility
+        mock_events = [
+            ScreeningEvent(id=event['id'], llm_analysis=event['llm_analysis'])
+            for event in events
+            if event['llm_analysis'] and 'entities' in event['llm_analysis']
+        ]
+
+        logger.info(
+            f"Screening {len(mock_events)}/{len(event_ids)} events for sanctions matches"
+        )
+
+        scores, new_matches = SanctionsScreener.screen_events_bulk(mock_events)
+
+        with transaction.atomic():
+            SanctionsMatch.objects.filter(
+                event_id__in=[event.id for event in mock_events]
+            ).delete()
+            SanctionsMatch.objects.bulk_create(new_matches, batch_size=1000)
+
+        bigquery_service.mark_sanctions_screened(
+            [event.id for event in mock_events], screening_started_at, cutoff_date
+        )
+
+        return {
+            'screened': len(mock_events),
+            'skipped': len(event_ids) - len(mock_events),
+            'matches_found': sum(1 for score in scores.values() if score > 0.0),
+            'total_matches': len(new_matches),
+            'status': 'success'
+        }
+
+    except Exception as e:
+        logger.error(f"Batch sanctions screening failed: {e}", exc_info=True)
+        return {
+            'screened': 0,
+            'skipped': len(event_ids),
+            'matches_found': 0,
+            'total_matches': 0,
+            'status': 'error',
+            'error': str(e)
+        }
@@ -0,0 +1,77 @@
+"""
+Tests for RateLimiter sliding-window rate limiting.
+"""
+from unittest.mock import patch
+
+from data_pipeline.tasks.utils import RateLimiter
+
+
+class FakeClock:
+    """time.monotonic / time.sleep stand-in that advances only when slept."""
+
+    def __init__(self):
+        self.now = 100.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestRateLimiter:
+    """Test suite for RateLimiter.wait_if_needed."""
+
+    def setup_method(self):
+        self.clock = FakeClock()
+        patcher_monotonic = patch('data_pipeline.tasks.utils.time.monotonic', self.clock.monotonic)
+        patcher_sleep = patch('data_pipeline.tasks.utils.time.sleep', self.clock.sleep)
+        patcher_monotonic.start()
+        patcher_sleep.start()
+        self.patchers = [patcher_monotonic, patcher_sleep]
+
+    def teardown_method(self):
+        for patcher in self.patchers:
+            patcher.stop()
+
+    def test_calls_under_limit_do_not_wait(self):
+        limiter = RateLimiter(max_calls=3, time_window=10)
+
+        for _ in range(3):
+            limiter.wait_if_needed()
+
+        assert self.clock.sleeps == []
+        assert len(limiter.calls) == 3
+
+    def test_call_over_limit_waits_for_oldest_to_expire(self):
+        limiter = RateLimiter(max_calls=2, time_window=10)
+
+        limiter.wait_if_needed()
+        self.clock.now += 4
+        limiter.wait_if_needed()
+        limiter.wait_if_needed()
+
+        # Oldest call was at t=100, so the third waits until t=110
+        assert self.clock.sleeps == [6]
+        assert list(limiter.calls) == [104.0, 110.0]
+
+    def test_expired_calls_free_capacity(self):
+        limiter = RateLimiter(max_calls=2, time_window=10)
+
+        limiter.wait_if_needed()
+        limiter.wait_if_needed()
+        self.clock.now += 10
+        limiter.wait_if_needed()
+
+        assert self.clock.sleeps == []
+        assert list(limiter.calls) == [110.0]
+
+    def test_decorator_rate_limits_wrapped_function(self):
+        limiter = RateLimiter(max_calls=1, time_window=5)
+        wrapped = limiter(lambda value: value * 2)
+
+        assert wrapped(1) == 2
+        assert wrapped(2) == 4
+        assert self.clock.sleeps == [5]
@@ -8,6 +8,7 @@ Provides:
 """
 import time
 import logging
+from collections import deque
 from tenacity import (
     retry,
     stop_after_attempt,
@@ -69,7 +70,8 @@ class RateLimiter:
         """
         self.max_calls = max_calls
         self.time_window = time_window
-        self.calls = []
+        # Monotonic timestamps of calls in the window, oldest first
+        self.calls = deque(maxlen=max_calls)
 
     def wait_if_needed(self):
         """
@@ -77,10 +79,8 @@ class RateLimiter:
 
         Blocks until enough time has passed to make another call.
         """
-        now = time.time()
-
-        # Remove calls outside the time window
-        self.calls = [call_time for call_time in self.calls if now - call_time < self.time_window]
+        now = time.monotonic()
+        self._expire(now)
 
         # If at limit, wait until oldest call expires
         if len(self.calls) >= self.max_calls:
@@ -89,12 +89,17 @@ class RateLimiter:
                 logger.debug(f"Rate limit reached, sleeping for {sleep_time:.2f} seconds")
                 time.sleep(sleep_time)
                 # Clean up expired calls again after sleeping
-                now = time.time()
-                self.calls = [call_time for call_time in self.calls if now - call_time < self.time_window]
+                now = time.monotonic()
+                self._expire(now)
 
         # Record this call
         self.calls.append(now)
 
+    def _expire(self, now: float):
+        """Drop calls that have left the time window."""
+        while self.calls and now - self.calls[0] >= self.time_window:
+            self.calls.popleft()
+
     def __call__(self, func: Callable) -> Callable:
         """
         Decorator to rate limit a function.
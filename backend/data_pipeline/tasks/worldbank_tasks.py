@@ -5,8 +5,9 @@ Fetches Venezuela development indicators (GDP, inflation, poverty, etc.)
 for annual/quarterly reporting.
 """
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Set, Tuple
 from celery import shared_task
 from django.db import transaction
 from django.utils import timezone
@@ -22,10 +23,51 @@ from data_pipeline.config.worldbank_config import (
 )
 from core.models import Event
 from api.bigquery_models import WorldBank
-from api.services.bigquery_service import bigquery_service
+from api.services.bigquery_service import bigquery_service, DEDUP_MAX_BYTES_BILLED
 
 logger = logging.getLogger(__name__)
 
+# Indicators fetched from the World Bank API concurrently
+FETCH_CONCURRENCY = 8
+
+
+def _existing_observations(
+    indicator_ids: List[str],
+    start_date: date,
+    end_date: date,
+) -> Set[Tuple[str, date]]:
+    """
+    Return the (indicator_id, date) pairs already stored in BigQuery.
+
+    One query covers every fetched indicator, instead of one per observation.
+    On failure an empty set is returned, so observations are inserted rather
+    than skipped.
+    """
+    if not indicator_ids:
+        return set()
+
+    query = f"""
+        SELECT DISTINCT indicator_id, date
+        FROM `{settings.GCP_PROJECT_ID}.{settings.BIGQUERY_DATASET}.world_bank`
+        WHERE indicator_id IN UNNEST(@indicator_ids)
+        AND date BETWEEN @start_date AND @end_date
+    """
+    job_config = bigquery.QueryJobConfig(
+        maximum_bytes_billed=DEDUP_MAX_BYTES_BILLED,
+        query_parameters=[
+            bigquery.ArrayQueryParameter('indicator_ids', 'STRING', indicator_ids),
+            bigquery.ScalarQueryParameter('start_date', 'DATE', start_date),
+            bigquery.ScalarQueryParameter('end_date', 'DATE', end_date),
+        ]
+    )
+
+    try:
+        results = bigquery_service.client.query(query, job_config=job_config).result()
+        return {(row.indicator_id, row.date) for row in results}
+    except Exception as e:
+        logger.error(f"Failed to check for duplicates in BigQuery: {e}")
+        return set()
+
 
 @shared_task(base=BaseIngestionTask, bind=True)
 def ingest_worldbank_indicators(
@@ -83,84 +125,79 @@ def ingest_worldbank_indicators(
     start_year = current_year - lookback_years
     end_year = current_year
 
-    # Process each indicator
-    for indicator_id, indicator_config in indicators_to_fetch.items():
-        logger.info(f"Processing indicator: {indicator_config['name']} ({indicator_id})")
-
+    # Fetch every indicator first, so duplicates are checked in one query
+    def fetch(indicator_id: str) -> Any:
         try:
-            # Fetch indicator data
-            result = client.get_indicator(
+            return client.get_indicator(
                 indicator_id=indicator_id,
                 country='VE',
                 start_year=start_year,
                 end_year=end_year,
             )
+        except Exception as e:
+            return e
 
-            data_points = result.get('data', [])
+    # Requests are network-bound, so overlap them; results keep config order
+    with ThreadPoolExecutor(max_workers=FETCH_CONCURRENCY) as executor:
+        results = executor.map(fetch, indicators_to_fetch)
 
-            if not data_points:
-                logger.warning(f"No data available for {indicator_id} in the specified period")
-                indicators_failed += 1
-                continue
+    fetched = {}
+    for (indicator_id, indicator_config), result in zip(indicators_to_fetch.items(), results):
+        logger.info(f"Processing indicator: {indicator_config['name']} ({indicator_id})")
 
-            logger.info(f"Found {len(data_points)} observations for {indicator_id}")
-
-            # Process each observation
-            for data_point in data_points:
-                year = data_point['year']
-                value = data_point['value']
-
-                # Convert year to date (January 1st of that year)
-                indicator_date = date(year=year, month=1, day=1)
-
-                # Check for duplicate in BigQuery
-                try:
-                    query = f"""
-                        SELECT COUNT(*) as count
-                        FROM `{settings.GCP_PROJECT_ID}.{settings.BIGQUERY_DATASET}.world_bank`
-                        WHERE indicator_id = @indicator_id
-                        AND date = @date
-                    """
-                    job_config = bigquery.QueryJobConfig(
-                        query_parameters=[
-                            bigquery.ScalarQueryParameter('indicator_id', 'STRING', indicator_id),
-                            bigquery.ScalarQueryParameter('date', 'DATE', indicator_date)
-                        ]
-                    )
-                    results = bigquery_service.client.query(query, job_config=job_config).result()
-                    row_result = list(results)[0]
-                    if row_result.count > 0:
-                        logger.debug(f"Skipping duplicate observation: {indicator_id} {year}")
-                        observations_skipped += 1
-                        continue
-                except Exception as e:
-                    logger.error(f"Failed to check for duplicate in BigQuery: {e}")
-                    # Continue with insert - better to have duplicate than skip valid observation
-                    pass
-
-                # Create WorldBank record for BigQuery
-                try:
-                    wb_indicator = WorldBank(
-                        indicator_id=indicator_id,
-                        date=indicator_date,
-                        value=float(value) if value is not None else None,
-                        country_code='VE'
-                    )
-                    worldbank_indicators.append(wb_indicator)
-                    observations_created += 1
-                    logger.debug(f"Prepared World Bank indicator: {indicator_id} {year} = {value}")
-
-                except Exception as e:
-                    logger.error(f"Failed to prepare World Bank indicator for {indicator_id} {year}: {e}", exc_info=True)
-                    observations_skipped += 1
-
-            indicators_processed += 1
+        if isinstance(result, Exception):
+            logger.error(f"Failed to process indicator {indicator_id}: {result}", exc_info=result)
+            indicators_failed += 1
+            continue
 
-        except Exception as e:
-            logger.error(f"Failed to process indicator {indicator_id}: {e}", exc_info=True)
+        data_points = result.get('data', [])
+
+        if not data_points:
+            logger.warning(f"No data available for {indicator_id} in the specified period")
             indicators_failed += 1
             continue
 
+        logger.info(f"Found {len(data_points)} observations for {indicator_id}")
+        fetched[indicator_id] = data_points
+
+    existing = _existing_observations(
+        list(fetched),
+        date(year=start_year, month=1, day=1),
+        date(year=end_year, month=1, day=1),
+    )
+
+    # Process each observation
+    for indicator_id, data_points in fetched.items():
+        for data_point in data_points:
+            year = data_point['year']
+            value = data_point['value']
+
+            # Convert year to date (January 1st of that year)
+            indicator_date = date(year=year, month=1, day=1)
+
+            if (indicator_id, indicator_date) in existing:
+                logger.debug(f"Skipping duplicate observation: {indicator_id} {year}")
+                observations_skipped += 1
+                continue
+
+            # Create WorldBank record for BigQuery
+            try:
+                wb_indicator = WorldBank(
+                    indicator_id=indicator_id,
+                    date=indicator_date,
+                    value=float(value) if value is not None else None,
+                    country_code='VE'
+                )
+                worldbank_indicators.append(wb_indicator)
+                observations_created += 1
+                logger.debug(f"Prepared World Bank indicator: {indicator_id} {year} = {value}")
+
+            except Exception as e:
+                logger.error(f"Failed to prepare World Bank indicator for {indicator_id} {year}: {e}", exc_info=True)
+                observations_skipped += 1
+
+        indicators_processed += 1
+
     # Batch insert to BigQuery
     if worldbank_indicators:
         try:
@@ -1,12 +1,16 @@
 from ninja import Router
-from django.shortcuts import get_object_or_404
+from django.http import Http404
+from django.core.cache import cache
 from django.utils import timezone
-from datetime import timedelta
 from core.models import Entity
 from .models import ForecastResult
-from .services import VertexAIForecaster, InsufficientDataError, VertexAIError
+from .tasks import (
+    generating_key,
+    outcome_key,
+    FORECAST_TTL,
+    GENERATION_TIMEOUT,
+)
 from .schemas import ForecastResponse
-import json
 
 router = Router()
 
@@ -16,55 +20,50 @@ def get_entity_forecast(request, entity_id: int, horizon_days: int = 30):
     """
     Get forecast for entity risk trajectory.
 
-    Returns cached forecast if <24 hours old, otherwise generates new forecast.
+    Returns cached forecast if younger than FORECAST_TTL (24 hours). Otherwise queues generation and
+    returns status 'generating'; clients poll this endpoint until the
+    forecast is ready (or insufficient_data/error is reported).
     """
-    entity = get_object_or_404(Entity, id=entity_id)
-
-    # Check for recent cached forecast
+    # Check for recent cached forecast (the generated_at filter is the
+    # freshness check; no entity lookup is needed on a hit)
     cached = ForecastResult.objects.filter(
-        entity=entity,
+        entity_id=entity_id,
         horizon_days=horizon_days,
-        generated_at__gte=timezone.now() - timedelta(hours=24)
-    ).first()
+        generated_at__gte=timezone.now() - FORECAST_TTL
+    ).only('forecast_data', 'generated_at').first()
 
-    if cached and not cached.is_stale(hours=24):
+    if cached:
         return {
             'status': 'ready',
-            'forecast': json.loads(cached.forecast_data) if isinstance(cached.forecast_data, str) else cached.forecast_data,
+            'forecast': cached.forecast_data,
             'generated_at': cached.generated_at,
             'horizon_days': horizon_days,
         }
 
-    # Generate new forecast
-    try:
-        forecaster = VertexAIForecaster()
-        result = forecaster.forecast(entity_id, horizon_days)
-
-        # Cache result
-        ForecastResult.objects.create(
-            entity=entity,
-            forecast_data=result['forecast'],
-            horizon_days=horizon_days,
-            model_version=result['metadata']['model_version'],
-        )
+    # Outcome of a recent generation that produced no forecast
+    outcome = cache.get(outcome_key(entity_id, horizon_days))
+    if outcome is not None:
+        return {**outcome, 'horizon_days': horizon_days}
 
-        return {
-            'status': 'ready',
-            'forecast': result['forecast'],
-            'generated_at': timezone.now(),
-            'horizon_days': horizon_days,
-        }
+    if not Entity.objects.filter(id=entity_id).exists():
+        raise Http404(f"Entity {entity_id} not found")
 
-    except InsufficientDataError as e:
-        return {
-            'status': 'insufficient_data',
-            'horizon_days': horizon_days,
-            'message': str(e),
-        }
+    # Queue generation once; concurrent polls only see the in-progress marker
+    marker = generating_key(entity_id, horizon_days)
+    if cache.add(marker, True, GENERATION_TIMEOUT):
+        try:
+            # Imported here so the Cloud Tasks client only loads on a miss
+            from .tasks import enqueue_forecast
+            enqueue_forecast(entity_id, horizon_days)
+        except Exception as e:
+            cache.delete(marker)
+            return {
+                'status': 'error',
+                'horizon_days': horizon_days,
+                'message': f"Forecast generation failed: {str(e)}",
+            }
 
-    except VertexAIError as e:
-        return {
-            'status': 'error',
-            'horizon_days': horizon_days,
-            'message': f"Forecast generation failed: {str(e)}",
-        }
+    return {
+        'status': 'generating',
+        'horizon_days': horizon_days,
+    }
@@ -88,10 +88,15 @@ def create_table(client: bigquery.Client, dataset_id: str, table_id: str) -> Non
         field="mentioned_at"
     )
 
+    # Cluster by entity_id so per-entity history reads only that entity's blocks.
+    # No require_partition_filter: Vertex AI training reads the whole table.
+    table.clustering_fields = ["entity_id"]
+
     table = client.create_table(table)
     print(f"✓ Created table {table_ref}")
     print(f"  - Schema: {len(schema)} columns")
     print(f"  - Partitioning: DAY on mentioned_at")
+    print(f"  - Clustering: entity_id")
     print(f"  - Description: {table.description}")
 
 
@@ -5,7 +5,12 @@
 -- NOTE: Replace PROJECT_ID and CONNECTION_ID before running
 -- Usage: BigQuery Scheduled Query (daily 2 AM UTC)
 
-CREATE OR REPLACE TABLE `intelligence.entity_risk_training_data` AS
+-- Partitioning and clustering must be restated here: CREATE OR REPLACE
+-- drops the layout set by bigquery_setup.py.
+CREATE OR REPLACE TABLE `intelligence.entity_risk_training_data`
+PARTITION BY TIMESTAMP_TRUNC(mentioned_at, DAY)
+CLUSTER BY entity_id
+AS
 WITH entity_mentions AS (
   SELECT
     entity_id,
@@ -47,5 +52,4 @@ SELECT
 FROM entity_mentions em
 JOIN events e ON CAST(e.id AS STRING) = CAST(em.event_id AS STRING)
 WHERE e.risk_score IS NOT NULL
-GROUP BY entity_id, DATE(em.mentioned_at)
-ORDER BY entity_id, mentioned_at;
+GROUP BY entity_id, DATE(em.mentioned_at);
@@ -0,0 +1,27 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('forecasting', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            # forecast_data holds the list of forecast points as native JSON.
+            # Rows written as a serialized JSON string are unwrapped first.
+            sql="""
+                UPDATE forecasting_forecastresult
+                SET forecast_data = (forecast_data #>> '{}')::jsonb
+                WHERE jsonb_typeof(forecast_data) = 'string';
+
+                ALTER TABLE forecasting_forecastresult
+                    ADD CONSTRAINT forecast_data_is_array
+                    CHECK (jsonb_typeof(forecast_data) = 'array');
+            """,
+            reverse_sql="""
+                ALTER TABLE forecasting_forecastresult
+                    DROP CONSTRAINT IF EXISTS forecast_data_is_array;
+            """
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2 on 2026-10-17 14:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("forecasting", "0002_forecast_data_array"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="forecastresult",
+            index=models.Index(
+                fields=["entity", "horizon_days", "-generated_at"],
+                name="fc_entity_horiz_gen_idx",
+            ),
+        ),
+    ]
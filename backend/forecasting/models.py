@@ -31,6 +31,11 @@ class ForecastResult(models.Model):
         ordering = ['-generated_at']
         indexes = [
             models.Index(fields=['entity', '-generated_at']),
+            # Cache lookup: entity + horizon, newest first
+            models.Index(
+                fields=['entity', 'horizon_days', '-generated_at'],
+                name='fc_entity_horiz_gen_idx',
+            ),
         ]
 
     def is_stale(self, hours=24):
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from google.cloud import aiplatform
 from django.conf import settings
 import pandas as pd
@@ -6,16 +7,30 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Minimum days with mentions before an entity can be forecast (RESEARCH.md)
+MIN_HISTORY_DAYS = 14
+
+
+@lru_cache(maxsize=1)
+def _get_endpoint() -> aiplatform.Endpoint:
+    """
+    Return the process-wide Vertex AI endpoint handle.
+
+    aiplatform.init() and the Endpoint lookup make auth and metadata calls,
+    so they run once per process and the handle is reused by every request.
+    """
+    aiplatform.init(
+        project=settings.VERTEX_AI_PROJECT_ID,
+        location=settings.VERTEX_AI_LOCATION
+    )
+    return aiplatform.Endpoint(settings.VERTEX_AI_ENDPOINT_ID)
+
 
 class VertexAIForecaster:
     """Service for generating forecasts via Vertex AI endpoint."""
 
     def __init__(self):
-        aiplatform.init(
-            project=settings.VERTEX_AI_PROJECT_ID,
-            location=settings.VERTEX_AI_LOCATION
-        )
-        self.endpoint = aiplatform.Endpoint(settings.VERTEX_AI_ENDPOINT_ID)
+        self.endpoint = _get_endpoint()
 
     def forecast(self, entity_id: int, horizon_days: int = 30) -> Dict:
         """
@@ -33,15 +48,19 @@ class VertexAIForecaster:
             VertexAIError: Prediction request failed
         """
         from core.models import EntityMention
+        from django.db.models.functions import TruncDate
 
-        # Check data sufficiency (14 days minimum per RESEARCH.md)
+        # Check data sufficiency. Only whether MIN_HISTORY_DAYS distinct days
+        # exist matters, so the distinct-day query stops at that many.
         history_count = EntityMention.objects.filter(
             entity_id=entity_id
-        ).values('mentioned_at__date').distinct().count()
+        ).annotate(
+            day=TruncDate('mentioned_at')
+        ).values('day').order_by().distinct()[:MIN_HISTORY_DAYS].count()
 
-        if history_count < 14:
+        if history_count < MIN_HISTORY_DAYS:
             raise InsufficientDataError(
-                f"Need 14 days of history, found {history_count}"
+                f"Need {MIN_HISTORY_DAYS} days of history, found {history_count}"
             )
 
         # Prepare prediction instance
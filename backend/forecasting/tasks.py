@@ -0,0 +1,110 @@
+"""
+Background forecast generation for entity risk forecasting.
+
+Forecasts are generated off the request path: on a cache miss the API
+enqueues a Cloud Task (enqueue_forecast) that calls
+/api/internal/generate-forecast, which runs generate_forecast. The API
+answers 'generating' until the ForecastResult row has been written.
+"""
+import logging
+import os
+from datetime import timedelta
+from typing import Any, Dict
+
+from django.core.cache import cache
+from django.utils import timezone
+
+from data_pipeline.services.cloud_tasks import enqueue_internal_task
+
+from .models import ForecastResult
+from .services import VertexAIForecaster, InsufficientDataError, VertexAIError
+
+logger = logging.getLogger(__name__)
+
+# How long a generated forecast is served from ForecastResult
+FORECAST_TTL = timedelta(hours=24)
+
+# Seconds a generation stays marked in progress (Cloud Tasks dispatch deadline)
+GENERATION_TIMEOUT = 300
+
+# Cloud Tasks queue that runs generate_forecast
+FORECAST_QUEUE = os.environ.get('FORECAST_QUEUE', 'llm-analysis-queue')
+
+# Seconds an insufficient-data or error outcome is reported to pollers
+OUTCOME_TTL = 600
+
+
+def generating_key(entity_id: int, horizon_days: int) -> str:
+    """Cache key marking a forecast generation as queued or running."""
+    return f"forecast:generating:{entity_id}:{horizon_days}"
+
+
+def outcome_key(entity_id: int, horizon_days: int) -> str:
+    """Cache key holding the outcome of a generation that produced no forecast."""
+    return f"forecast:outcome:{entity_id}:{horizon_days}"
+
+
+def enqueue_forecast(entity_id: int, horizon_days: int) -> str:
+    """
+    Enqueue a Cloud Task that runs generate_forecast.
+
+    Args:
+        entity_id: Entity ID to forecast
+        horizon_days: Forecast horizon in days
+
+    Returns:
+        Name of the created Cloud Task
+    """
+    return enqueue_internal_task(
+        FORECAST_QUEUE,
+        '/api/internal/generate-forecast',
+        {'entity_id': entity_id, 'horizon_days': horizon_days},
+        dispatch_deadline=GENERATION_TIMEOUT,
+    )
+
+
+def generate_forecast(entity_id: int, horizon_days: int = 30) -> Dict[str, Any]:
+    """
+    Generate and store a forecast for an entity.
+
+    Args:
+        entity_id: Entity ID to forecast
+        horizon_days: Forecast horizon in days
+
+    Returns:
+        Dictionary with 'status' ('ready', 'insufficient_data' or 'error')
+        and a 'message' when no forecast was produced
+    """
+    try:
+        # Another run may have stored a fresh forecast already (a retried
+        # task, or one queued after the in-progress marker expired)
+        if ForecastResult.objects.filter(
+            entity_id=entity_id,
+            horizon_days=horizon_days,
+            generated_at__gte=timezone.now() - FORECAST_TTL
+        ).exists():
+            return {'status': 'ready'}
+
+        result = VertexAIForecaster().forecast(entity_id, horizon_days)
+
+        ForecastResult.objects.create(
+            entity_id=entity_id,
+            forecast_data=result['forecast'],
+            horizon_days=horizon_days,
+            model_version=result['metadata']['model_version'],
+        )
+        outcome = {'status': 'ready'}
+
+    except InsufficientDataError as e:
+        outcome = {'status': 'insufficient_data', 'message': str(e)}
+        cache.set(outcome_key(entity_id, horizon_days), outcome, OUTCOME_TTL)
+
+    except VertexAIError as e:
+        logger.error(f"Forecast generation failed for entity {entity_id}: {e}")
+        outcome = {'status': 'error', 'message': f"Forecast generation failed: {str(e)}"}
+        cache.set(outcome_key(entity_id, horizon_days), outcome, OUTCOME_TTL)
+
+    finally:
+        cache.delete(generating_key(entity_id, horizon_days))
+
+    return outcome
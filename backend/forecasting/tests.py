@@ -1,3 +1,127 @@
-from django.test import TestCase
+"""
+Tests for forecast generation dispatch and polling.
 
-# Create your tests here.
+The view queues generation once per entity/horizon (in-progress marker),
+reports 'generating' while the marker is held, and serves the stored
+forecast or the cached outcome once generation has finished.
+"""
+from unittest.mock import patch, MagicMock
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from forecasting.api import get_entity_forecast
+from forecasting.services import InsufficientDataError, VertexAIError
+from forecasting.tasks import generate_forecast, generating_key, outcome_key
+
+LOCMEM_CACHE = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+@patch('forecasting.api.Entity')
+@patch('forecasting.api.ForecastResult')
+class ForecastPollingTests(TestCase):
+    """Test the marker / outcome / poll flow of the forecast endpoint."""
+
+    def setUp(self):
+        cache.clear()
+
+    def _no_cached_forecast(self, forecast_result):
+        forecast_result.objects.filter.return_value.only.return_value.first.return_value = None
+
+    @patch('forecasting.tasks.enqueue_forecast')
+    def test_miss_enqueues_once_and_reports_generating(self, enqueue, forecast_result, entity):
+        self._no_cached_forecast(forecast_result)
+        entity.objects.filter.return_value.exists.return_value = True
+
+        first = get_entity_forecast(None, entity_id=1, horizon_days=30)
+        second = get_entity_forecast(None, entity_id=1, horizon_days=30)
+
+        self.assertEqual(first['status'], 'generating')
+        self.assertEqual(second['status'], 'generating')
+        enqueue.assert_called_once_with(1, 30)
+        self.assertTrue(cache.get(generating_key(1, 30)))
+
+    @patch('forecasting.tasks.enqueue_forecast', side_effect=RuntimeError('queue unavailable'))
+    def test_enqueue_failure_releases_marker(self, enqueue, forecast_result, entity):
+        self._no_cached_forecast(forecast_result)
+        entity.objects.filter.return_value.exists.return_value = True
+
+        response = get_entity_forecast(None, entity_id=1, horizon_days=30)
+
+        self.assertEqual(response['status'], 'error')
+        self.assertIsNone(cache.get(generating_key(1, 30)))
+
+    @patch('forecasting.tasks.enqueue_forecast')
+    def test_cached_outcome_is_reported(self, enqueue, forecast_result, entity):
+        self._no_cached_forecast(forecast_result)
+        cache.set(outcome_key(1, 30), {'status': 'insufficient_data', 'message': 'too short'})
+
+        response = get_entity_forecast(None, entity_id=1, horizon_days=30)
+
+        self.assertEqual(response['status'], 'insufficient_data')
+        self.assertEqual(response['message'], 'too short')
+        enqueue.assert_not_called()
+
+    @patch('forecasting.tasks.enqueue_forecast')
+    def test_stored_forecast_is_served(self, enqueue, forecast_result, entity):
+        stored = MagicMock(forecast_data=[], generated_at=None)
+        forecast_result.objects.filter.return_value.only.return_value.first.return_value = stored
+
+        response = get_entity_forecast(None, entity_id=1, horizon_days=30)
+
+        self.assertEqual(response['status'], 'ready')
+        enqueue.assert_not_called()
+        entity.objects.filter.assert_not_called()
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+@patch('forecasting.tasks.ForecastResult')
+@patch('forecasting.tasks.VertexAIForecaster')
+class GenerateForecastTests(TestCase):
+    """Test generate_forecast outcomes and marker cleanup."""
+
+    def setUp(self):
+        cache.clear()
+        cache.set(generating_key(1, 30), True)
+
+    def test_success_stores_forecast(self, forecaster, forecast_result):
+        forecast_result.objects.filter.return_value.exists.return_value = False
+        forecaster.return_value.forecast.return_value = {
+            'forecast': [],
+            'metadata': {'model_version': 'v1'},
+        }
+
+        outcome = generate_forecast(1, 30)
+
+        self.assertEqual(outcome, {'status': 'ready'})
+        forecast_result.objects.create.assert_called_once()
+        self.assertIsNone(cache.get(generating_key(1, 30)))
+
+    def test_fresh_forecast_skips_vertex(self, forecaster, forecast_result):
+        forecast_result.objects.filter.return_value.exists.return_value = True
+
+        outcome = generate_forecast(1, 30)
+
+        self.assertEqual(outcome, {'status': 'ready'})
+        forecaster.return_value.forecast.assert_not_called()
+        self.assertIsNone(cache.get(generating_key(1, 30)))
+
+    def test_insufficient_data_outcome_is_cached(self, forecaster, forecast_result):
+        forecast_result.objects.filter.return_value.exists.return_value = False
+        forecaster.return_value.forecast.side_effect = InsufficientDataError('too short')
+
+        outcome = generate_forecast(1, 30)
+
+        self.assertEqual(outcome['status'], 'insufficient_data')
+        self.assertEqual(cache.get(outcome_key(1, 30)), outcome)
+        self.assertIsNone(cache.get(generating_key(1, 30)))
+
+    def test_vertex_error_outcome_is_cached(self, forecaster, forecast_result):
+        forecast_result.objects.filter.return_value.exists.return_value = False
+        forecaster.return_value.forecast.side_effect = VertexAIError('endpoint down')
+
+        outcome = generate_forecast(1, 30)
+
+        self.assertEqual(outcome['status'], 'error')
+        self.assertEqual(cache.get(outcome_key(1, 30)), outcome)
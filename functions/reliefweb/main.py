@@ -8,6 +8,7 @@ import functions_framework
 import logging
 import uuid
 import requests
+from requests.adapters import HTTPAdapter
 from datetime import datetime, timedelta
 from typing import Dict, Any
 from flask import Request
@@ -24,6 +25,16 @@ from pubsub_client import PubSubClient
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Reports per API request (ReliefWeb maximum); further pages use offset
+REPORTS_PAGE_SIZE = 1000
+
+# Safety cap on pagination: stop after this many reports in one run
+MAX_REPORTS_OFFSET = 10_000
+
+# Keep-alive session, reused across warm invocations of the function instance
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=0))
+
 
 @functions_framework.http
 def sync_reliefweb(request: Request):
@@ -62,6 +73,8 @@ def sync_reliefweb(request: Request):
             'query[value]': 'country.iso3:VEN',
             'filter[field]': 'date.created',
             'filter[value][from]': date_filter,
+            # Oldest first, so offset pages are stable across requests
+            'sort[]': 'date.created:asc',
             'fields[include][]': [
                 'id',
                 'title',
@@ -73,18 +86,33 @@ def sync_reliefweb(request: Request):
                 'url',
                 'file.url',
             ],
-            'limit': 100,
+            'limit': REPORTS_PAGE_SIZE,
         }
 
-        # Fetch from ReliefWeb
+        # Fetch from ReliefWeb, following offset pages until totalCount
         logger.info("Fetching reports from ReliefWeb API")
-        response = requests.get(api_url, params=params, timeout=30)
-        response.raise_for_status()
-        data = response.json()
-
-        # ReliefWeb response structure: {'data': [...], 'count': N, 'totalCount': N}
-        reports = data.get('data', [])
-        total_count = data.get('totalCount', 0)
+        reports = []
+        while True:
+            response = _SESSION.get(
+                api_url, params={**params, 'offset': len(reports)}, timeout=30
+            )
+            response.raise_for_status()
+            data = response.json()
+
+            # ReliefWeb response structure: {'data': [...], 'count': N, 'totalCount': N}
+            page = data.get('data', [])
+            total_count = data.get('totalCount', 0)
+            reports.extend(page)
+
+            if len(page) < REPORTS_PAGE_SIZE or len(reports) >= total_count:
+                break
+            if len(reports) >= MAX_REPORTS_OFFSET:
+                logger.warning(
+                    f"Stopping ReliefWeb pagination at {len(reports)} of {total_count} reports; "
+                    f"reports after {reports[-1].get('fields', {}).get('date', {}).get('created')} "
+                    f"were not fetched"
+                )
+                break
 
         logger.info(f"Fetched {len(reports)} reports from ReliefWeb (total available: {total_count})")
 
@@ -93,6 +121,10 @@ def sync_reliefweb(request: Request):
         bigquery_events = []
         event_ids_for_analysis = []
 
+        # Check duplicates for the whole page in one query (last 30 days)
+        urls = [r.get('fields', {}).get('url') for r in reports]
+        existing_urls = bq_client.get_existing_urls([url for url in urls if url], days=30)
+
         # Process each report
         for report_wrapper in reports:
             # ReliefWeb wraps each record: {'id': ..., 'fields': {...}}
@@ -105,11 +137,11 @@ def sync_reliefweb(request: Request):
                 events_skipped += 1
                 continue
 
-            # Check for duplicates in BigQuery (last 30 days)
-            if bq_client.check_duplicate_by_url(url, days=30):
+            if url in existing_urls:
                 logger.debug(f"Skipping duplicate ReliefWeb report: {url}")
                 events_skipped += 1
                 continue
+            existing_urls.add(url)
 
             # Map ReliefWeb report to BigQuery Event
             try:
@@ -72,8 +72,8 @@ def sync_sanctions(request: Request):
             SELECT id, metadata
             FROM `{bq_client.project_id}.{bq_client.dataset_id}.events`
             WHERE mentioned_at >= @cutoff_date
-            AND metadata IS NOT NULL
-            AND JSON_VALUE(metadata, '$.llm_analysis') IS NOT NULL
+            AND (llm_analysis_z IS NOT NULL
+                 OR JSON_QUERY(metadata, '$.llm_analysis') IS NOT NULL)
             ORDER BY mentioned_at DESC
         """
 
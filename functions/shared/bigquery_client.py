@@ -6,7 +6,7 @@ No Django dependencies - pure GCP client library.
 """
 import os
 import logging
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Set
 from google.cloud import bigquery
 
 logger = logging.getLogger(__name__)
@@ -180,6 +180,43 @@ class BigQueryClient:
             logger.error(f"Failed to check for duplicate by URL: {e}")
             return False
 
+    def get_existing_urls(self, source_urls: List[str], days: int = 30) -> Set[str]:
+        """
+        Return which of source_urls already have events in the last N days.
+
+        One query for the whole batch, instead of check_duplicate_by_url()
+        per URL.
+
+        Args:
+            source_urls: Source URLs to check
+            days: Lookback period in days
+
+        Returns:
+            Set of URLs that already exist
+        """
+        if not source_urls:
+            return set()
+
+        query = f"""
+            SELECT DISTINCT source_url
+            FROM `{self.project_id}.{self.dataset_id}.events`
+            WHERE source_url IN UNNEST(@urls)
+            AND mentioned_at >= TIMESTAMP_SUB(CURRENT_TIMESTAMP(), INTERVAL @days DAY)
+        """
+        job_config = bigquery.QueryJobConfig(
+            query_parameters=[
+                bigquery.ArrayQueryParameter('urls', 'STRING', list(source_urls)),
+                bigquery.ScalarQueryParameter('days', 'INT64', days)
+            ]
+        )
+
+        try:
+            results = self.client.query(query, job_config=job_config).result()
+            return {row.source_url for row in results}
+        except Exception as e:
+            logger.error(f"Failed to check for duplicate URLs: {e}")
+            return set()
+
     def get_previous_fred_value(self, series_id: str, date: str) -> float:
         """
         Get previous FRED indicator value for a series.